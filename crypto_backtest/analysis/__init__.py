@@ -1,6 +1,6 @@
 """Analysis module for backtest metrics, validation, and visualization."""
 
 # Import only what exists
-from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.analysis.metrics import compute_core_metrics, compute_metrics
 
-__all__ = ["compute_metrics"]
+__all__ = ["compute_metrics", "compute_core_metrics"]
@@ -6,6 +6,8 @@ import numpy as np
 import pandas as pd
 from typing import Any
 
+from crypto_backtest.utils.runs import longest_true_run
+
 
 def _safe_float(value, default: float = 0.0) -> float:
     """Convert any value to safe float, handling complex numbers."""
@@ -150,6 +152,159 @@ def compute_metrics(equity_curve: pd.Series, trades: pd.DataFrame) -> dict[str,
     }
 
 
+# Fields shared by ``compute_core_metrics`` and ``compute_metrics``.
+CORE_METRICS = (
+    "total_return",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "win_rate",
+    "profit_factor",
+    "expectancy",
+)
+
+
+def compute_core_metrics(
+    equity: np.ndarray,
+    trade_pnl: np.ndarray | None = None,
+    periods_per_year: float = 252.0,
+) -> dict[str, float]:
+    """Objective metrics from raw arrays, for optimizer and Monte Carlo loops.
+
+    Same definitions as the matching fields of ``compute_metrics`` without
+    the pandas frequency inference, calendar breakdowns or per-element complex
+    checks. ``trade_pnl`` holds one PnL per signal (see ``_trade_pnl``) and
+    ``periods_per_year`` should be computed once per dataset.
+    """
+    equity = np.real(np.asarray(equity)).astype(float, copy=False)
+    equity = equity[~np.isnan(equity)]
+    if equity.size == 0:
+        return {}
+
+    start = _safe_float(equity[0], default=1.0)
+    end = _safe_float(equity[-1], default=1.0)
+    if start == 0:
+        start = 1.0
+    total_return = (end / start) - 1.0
+
+    periods_per_year = _safe_float(periods_per_year, default=252.0)
+    if periods_per_year <= 0:
+        periods_per_year = 252.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = equity[1:] / equity[:-1] - 1.0
+    returns = returns[~np.isnan(returns)]
+    std_returns = _safe_array_std(returns)
+    mean_returns = _safe_float(returns.mean()) if returns.size else 0.0
+    sharpe = 0.0
+    if std_returns > 0:
+        sharpe = _safe_float(_safe_float(mean_returns / std_returns) * np.sqrt(periods_per_year))
+
+    std_downside = _safe_array_std(returns[returns < 0])
+    sortino = 0.0
+    if std_downside > 0:
+        sortino = _safe_float(_safe_float(mean_returns / std_downside) * np.sqrt(periods_per_year))
+
+    drawdown = equity / np.maximum.accumulate(equity) - 1.0
+    max_drawdown = _safe_float(drawdown.min())
+    max_drawdown_duration = longest_true_run(drawdown < 0)
+
+    pnl = np.empty(0) if trade_pnl is None else np.asarray(trade_pnl, dtype=float)
+    if pnl.size:
+        gains = pnl[pnl > 0].sum()
+        losses = pnl[pnl < 0].sum()
+        if losses == 0:
+            profit_factor = float("inf") if gains > 0 else 0.0
+        else:
+            profit_factor = gains / abs(losses)
+        win_rate = float((pnl > 0).mean())
+        expectancy = pnl.mean()
+    else:
+        profit_factor = win_rate = expectancy = 0.0
+
+    return {
+        "total_return": _safe_float(total_return),
+        "sharpe_ratio": sharpe,
+        "sortino_ratio": sortino,
+        "max_drawdown": max_drawdown,
+        "max_drawdown_duration": float(max_drawdown_duration),
+        "win_rate": _safe_float(win_rate),
+        "profit_factor": _safe_float(profit_factor),
+        "expectancy": _safe_float(expectancy),
+    }
+
+
+def compute_core_metrics_matrix(
+    equity: np.ndarray,
+    periods_per_year: float = 252.0,
+) -> dict[str, np.ndarray]:
+    """Row-wise ``compute_core_metrics`` for a (curves, bars) equity matrix.
+
+    Returns ``total_return``, ``sharpe_ratio`` and ``max_drawdown`` arrays with
+    one value per row, identical to calling ``compute_core_metrics`` on each
+    row. Rows with NaN, zero or non-finite returns take that per-row path.
+    """
+    equity = np.real(np.asarray(equity)).astype(float, copy=False)
+    if equity.ndim != 2:
+        raise ValueError("equity must be a 2D (curves, bars) matrix")
+    n_rows, n_bars = equity.shape
+
+    periods_per_year = _safe_float(periods_per_year, default=252.0)
+    if periods_per_year <= 0:
+        periods_per_year = 252.0
+
+    total_return = np.zeros(n_rows)
+    sharpe = np.zeros(n_rows)
+    max_drawdown = np.zeros(n_rows)
+    if n_rows == 0 or n_bars == 0:
+        return {"total_return": total_return, "sharpe_ratio": sharpe, "max_drawdown": max_drawdown}
+
+    clean = np.isfinite(equity).all(axis=1) & (equity != 0).all(axis=1)
+    if n_bars >= 3 and clean.any():
+        rows = equity if clean.all() else equity[clean]
+        with np.errstate(over="ignore", invalid="ignore"):
+            returns = np.divide(rows[:, 1:], rows[:, :-1])
+        returns -= 1.0
+        finite = np.isfinite(returns).all(axis=1)
+        if not finite.all():
+            clean[clean] = finite
+            rows, returns = rows[finite], returns[finite]
+
+        total_return[clean] = rows[:, -1] / rows[:, 0] - 1.0
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(std > 0, mean / std, 0.0) * np.sqrt(periods_per_year)
+        sharpe[clean] = np.where(np.isfinite(ratio), ratio, 0.0)
+
+        drawdown = np.maximum.accumulate(rows, axis=1)
+        np.divide(rows, drawdown, out=drawdown)
+        drawdown -= 1.0
+        max_drawdown[clean] = drawdown.min(axis=1)
+    else:
+        clean[:] = False
+
+    for row in np.flatnonzero(~clean):
+        metrics = compute_core_metrics(equity[row], periods_per_year=periods_per_year)
+        total_return[row] = metrics.get("total_return", 0.0)
+        sharpe[row] = metrics.get("sharpe_ratio", 0.0)
+        max_drawdown[row] = metrics.get("max_drawdown", 0.0)
+
+    return {"total_return": total_return, "sharpe_ratio": sharpe, "max_drawdown": max_drawdown}
+
+
+def _safe_array_std(values: np.ndarray) -> float:
+    """Population std of a float array; 0.0 when undefined (``_safe_std`` rules)."""
+    if values.size < 2:
+        return 0.0
+    with np.errstate(invalid="ignore"):
+        result = float(values.std())
+    if not np.isfinite(result) or result < 0:
+        return 0.0
+    return result
+
+
 # =============================================================================
 # Optional reference implementation (empyrical-reloaded)
 # =============================================================================
@@ -308,15 +463,7 @@ def _max_drawdown(equity: pd.Series) -> tuple[pd.Series, float, int]:
     drawdown = equity / hwm - 1.0
     max_drawdown = float(drawdown.min()) if not drawdown.empty else 0.0
 
-    underwater = drawdown < 0
-    max_duration = 0
-    current = 0
-    for is_under in underwater:
-        if is_under:
-            current += 1
-            max_duration = max(max_duration, current)
-        else:
-            current = 0
+    max_duration = longest_true_run((drawdown < 0).to_numpy())
     return drawdown, max_drawdown, max_duration
 
 
@@ -13,9 +13,10 @@ from enum import Enum
 from typing import Optional, Tuple, Dict, List
 import numpy as np
 import pandas as pd
-from scipy import stats
 
 from crypto_backtest.indicators.atr import compute_atr
+from crypto_backtest.indicators.rolling import rolling_percentile_rank
+from crypto_backtest.utils.runs import run_positions
 
 # ============================================================================
 # PART 1: REGIME DEFINITIONS
@@ -145,14 +146,7 @@ def compute_regime_features(df: pd.DataFrame, lookback: int = 200) -> pd.DataFra
 
     # Volatility percentile (crypto-adaptive)
     features["vol_percentile"] = (
-        features["atr_14"]
-        .rolling(lookback)
-        .apply(
-            lambda x: stats.percentileofscore(x.dropna(), x.iloc[-1]) / 100
-            if len(x.dropna()) > 10
-            else 0.5,
-            raw=False,
-        )
+        _rolling_percentile(features["atr_14"], lookback)
         .shift(1)
     )
 
@@ -214,14 +208,7 @@ def compute_regime_features(df: pd.DataFrame, lookback: int = 200) -> pd.DataFra
         (high.rolling(20).max() - low.rolling(20).min()) / close
     ).shift(1)
     features["range_percentile"] = (
-        features["range_20"]
-        .rolling(lookback)
-        .apply(
-            lambda x: stats.percentileofscore(x.dropna(), x.iloc[-1]) / 100
-            if len(x.dropna()) > 10
-            else 0.5,
-            raw=False,
-        )
+        _rolling_percentile(features["range_20"], lookback)
         .shift(1)
     )
 
@@ -622,16 +609,9 @@ class CryptoRegimeAnalyzer:
 
     def _compute_stability(self, regime_series: pd.Series) -> pd.Series:
         """Compute how many bars we've been in current regime"""
-        stability = pd.Series(index=regime_series.index, dtype=float)
-
-        changes = regime_series != regime_series.shift(1)
-        groups = changes.cumsum()
-
-        for group_id in groups.unique():
-            mask = groups == group_id
-            stability.loc[mask] = range(1, mask.sum() + 1)
-
-        return stability
+        return pd.Series(
+            run_positions(regime_series).astype(float), index=regime_series.index
+        )
 
     def _is_favorable_long(
         self, trend: pd.Series, vol: pd.Series, crypto: pd.Series
@@ -677,6 +657,14 @@ class CryptoRegimeAnalyzer:
 # ============================================================================
 
 
+def _rolling_percentile(series: pd.Series, lookback: int) -> pd.Series:
+    """Percentile rank of each bar in its ``lookback`` window (0.5 for windows of 10 bars or fewer)."""
+    ranks = rolling_percentile_rank(series, lookback)
+    if lookback <= 10:
+        ranks = ranks.where(ranks.isna(), 0.5)
+    return ranks
+
+
 def _compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     """Compute RSI indicator"""
     delta = close.diff()
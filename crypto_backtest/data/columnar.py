@@ -0,0 +1,246 @@
+"""Native fixed-width OHLCV file: memory-mapped, sliceable by timestamp, append-only."""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SUFFIX = ".ohlcv"
+MAGIC = b"CBOHLCV\x00"
+VERSION = 1
+HEADER_SIZE = 64
+# magic, version, flags, n_rows, interval_ns, start_ns, end_ns
+_HEADER = struct.Struct("<8sII4q")
+# Set when every consecutive timestamp difference equals interval_ns.
+FLAG_ON_GRID = 1
+RECORD = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+COLUMNS = RECORD.names[1:]
+
+
+@dataclass(frozen=True)
+class OHLCVHeader:
+    """Row count, bar interval and timestamp range (UTC epoch nanoseconds).
+
+    ``on_grid`` is recorded by ``write``/``append`` only after checking that
+    every bar follows the previous one by exactly ``interval_ns``.
+    """
+
+    n_rows: int
+    interval_ns: int
+    start_ns: int
+    end_ns: int
+    on_grid: bool = False
+
+    @property
+    def regular(self) -> bool:
+        """True when the bars are exactly ``start_ns + k * interval_ns``, k < n_rows."""
+        if self.n_rows < 2:
+            return True
+        return self.on_grid and self.interval_ns > 0
+
+    def pack(self) -> bytes:
+        flags = FLAG_ON_GRID if self.on_grid else 0
+        packed = _HEADER.pack(
+            MAGIC, VERSION, flags, self.n_rows, self.interval_ns, self.start_ns, self.end_ns
+        )
+        return packed.ljust(HEADER_SIZE, b"\x00")
+
+
+class OHLCVFile:
+    """One asset/timeframe stored as a header plus (timestamp, OHLCV) records.
+
+    Records are fixed-width (int64 nanoseconds + five float64 columns) and
+    sorted by strictly increasing timestamp. ``read`` maps the file and copies
+    only the requested rows; when the header marks the bars as on the
+    interval grid the row range of a timestamp window is computed from the
+    header alone, otherwise (gaps, misaligned bars) it is a binary search
+    over the mapped timestamp column. ``append`` writes new records past the
+    last row and then rewrites the header, so a torn append is ignored.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    @classmethod
+    def write(
+        cls, path: str | Path, data: pd.DataFrame, interval: pd.Timedelta | None = None
+    ) -> "OHLCVFile":
+        """Create (or replace) ``path`` from a DatetimeIndex-ed OHLCV frame."""
+        records = _to_records(data)
+        if interval is not None:
+            interval_ns = int(pd.Timedelta(interval).value)
+        elif len(records) > 1:
+            interval_ns = int(np.median(np.diff(records["timestamp"])))
+        else:
+            interval_ns = 0
+        header = _header_for(records, interval_ns)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(header.pack())
+            handle.write(records.tobytes())
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @property
+    def header(self) -> OHLCVHeader:
+        with open(self.path, "rb") as handle:
+            return _read_header(handle)
+
+    def records(self) -> np.ndarray:
+        """Read-only memory map of every record."""
+        n_rows = self.header.n_rows
+        if n_rows == 0:
+            return np.empty(0, dtype=RECORD)
+        return np.memmap(self.path, dtype=RECORD, mode="r", offset=HEADER_SIZE, shape=(n_rows,))
+
+    def row_bounds(self, start=None, end=None) -> tuple[int, int]:
+        """Rows ``[first, stop)`` with ``start <= timestamp <= end`` (either may be None)."""
+        header = self.header
+        if header.n_rows == 0:
+            return 0, 0
+        if header.regular:
+            first = 0 if start is None else _grid_position(header, _to_ns(start), side="left")
+            stop = header.n_rows if end is None else _grid_position(header, _to_ns(end), side="right")
+        else:
+            stamps = self.records()["timestamp"]
+            first = 0 if start is None else int(np.searchsorted(stamps, _to_ns(start), "left"))
+            stop = header.n_rows if end is None else int(np.searchsorted(stamps, _to_ns(end), "right"))
+        return first, max(first, stop)
+
+    def read(self, start=None, end=None) -> pd.DataFrame:
+        """UTC-indexed float64 OHLCV frame for ``start <= timestamp <= end``."""
+        return self.read_rows(*self.row_bounds(start, end))
+
+    def read_rows(self, first: int, stop: int) -> pd.DataFrame:
+        """Frame for rows ``[first, stop)``; only those bytes are read."""
+        records = np.array(self.records()[first:stop])
+        index = pd.DatetimeIndex(records["timestamp"].view("M8[ns]"), name="timestamp")
+        return pd.DataFrame(
+            {column: records[column] for column in COLUMNS},
+            index=index.tz_localize("UTC"),
+        )
+
+    def append(self, data: pd.DataFrame) -> int:
+        """Append rows newer than the last stored bar; return how many were written."""
+        if not self.exists():
+            self.write(self.path, data)
+            return self.header.n_rows
+
+        records = _to_records(data)
+        with open(self.path, "r+b") as handle:
+            header = _read_header(handle)
+            if header.n_rows:
+                records = records[records["timestamp"] > header.end_ns]
+            if len(records) == 0:
+                return 0
+            handle.seek(HEADER_SIZE + header.n_rows * RECORD.itemsize)
+            handle.write(records.tobytes())
+            handle.flush()
+
+            stamps = records["timestamp"]
+            if header.n_rows:
+                stamps = np.concatenate([[header.end_ns], stamps])
+            interval_ns = header.interval_ns
+            if interval_ns == 0:
+                interval_ns = int(np.median(np.diff(stamps))) if len(stamps) > 1 else 0
+            updated = OHLCVHeader(
+                n_rows=header.n_rows + len(records),
+                interval_ns=interval_ns,
+                start_ns=header.start_ns if header.n_rows else int(records["timestamp"][0]),
+                end_ns=int(records["timestamp"][-1]),
+                on_grid=(header.n_rows < 2 or header.on_grid) and _on_grid(stamps, interval_ns),
+            )
+            handle.seek(0)
+            handle.write(updated.pack())
+            handle.flush()
+        return len(records)
+
+
+def _to_records(data: pd.DataFrame) -> np.ndarray:
+    if "timestamp" in data.columns:
+        index = pd.DatetimeIndex(pd.to_datetime(data["timestamp"], utc=True))
+    elif isinstance(data.index, pd.DatetimeIndex):
+        index = data.index
+    else:
+        raise ValueError("OHLCV data needs a DatetimeIndex or a timestamp column")
+    if index.tz is None:
+        index = index.tz_localize("UTC")
+
+    records = np.empty(len(data), dtype=RECORD)
+    records["timestamp"] = index.as_unit("ns").asi8
+    for column in COLUMNS:
+        records[column] = data[column].to_numpy(dtype=np.float64)
+    if len(records) > 1 and not np.all(np.diff(records["timestamp"]) > 0):
+        raise ValueError("OHLCV timestamps must be strictly increasing")
+    return records
+
+
+def _header_for(records: np.ndarray, interval_ns: int) -> OHLCVHeader:
+    if len(records) == 0:
+        return OHLCVHeader(0, interval_ns, 0, 0)
+    return OHLCVHeader(
+        n_rows=len(records),
+        interval_ns=interval_ns,
+        start_ns=int(records["timestamp"][0]),
+        end_ns=int(records["timestamp"][-1]),
+        on_grid=_on_grid(records["timestamp"], interval_ns),
+    )
+
+
+def _on_grid(stamps: np.ndarray, interval_ns: int) -> bool:
+    """True when consecutive ``stamps`` are exactly ``interval_ns`` apart."""
+    if len(stamps) < 2:
+        return True
+    return interval_ns > 0 and bool(np.all(np.diff(stamps) == interval_ns))
+
+
+def _read_header(handle) -> OHLCVHeader:
+    handle.seek(0)
+    raw = handle.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("truncated OHLCV file header")
+    magic, version, flags, n_rows, interval_ns, start_ns, end_ns = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("not an OHLCV file")
+    if version != VERSION:
+        raise ValueError(f"unsupported OHLCV file version {version}")
+    return OHLCVHeader(n_rows, interval_ns, start_ns, end_ns, bool(flags & FLAG_ON_GRID))
+
+
+def _grid_position(header: OHLCVHeader, stamp: int, side: str) -> int:
+    """``searchsorted`` on the regular grid ``start_ns + k * interval_ns``."""
+    if header.n_rows == 1:
+        return int(stamp > header.start_ns) if side == "left" else int(stamp >= header.start_ns)
+    offset = stamp - header.start_ns
+    if side == "left":
+        position = -(-offset // header.interval_ns)
+    else:
+        position = offset // header.interval_ns + 1
+    return int(min(max(position, 0), header.n_rows))
+
+
+def _to_ns(value) -> int:
+    stamp = pd.Timestamp(value)
+    if stamp.tzinfo is None:
+        stamp = stamp.tz_localize("UTC")
+    return int(stamp.as_unit("ns").value)
@@ -0,0 +1,259 @@
+"""Concurrent OHLCV downloader with per-exchange rate limits and resumable pages."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, at most ``capacity`` banked."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return the time waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+@dataclass(frozen=True)
+class DownloadJob:
+    """Bars of one symbol in ``[since_ms, until_ms)``; ``until_ms=None`` means now."""
+
+    exchange_id: str
+    symbol: str
+    timeframe: str
+    since_ms: int
+    until_ms: int | None = None
+
+    @property
+    def name(self) -> str:
+        safe_symbol = self.symbol.replace("/", "_")
+        return f"{self.exchange_id}-{safe_symbol}-{self.timeframe}"
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    job: DownloadJob
+    data: pd.DataFrame | None
+    error: BaseException | None = None
+
+
+class ConcurrentDownloader:
+    """Fetch many symbols' OHLCV pages on a bounded thread pool.
+
+    The time range of each job is split into pages of ``page_limit`` bars
+    that are fetched concurrently; all pages of all jobs share one pool, and
+    every request first takes a token from its exchange's bucket (rate from
+    ``requests_per_second`` or the client's ``rateLimit``). ccxt clients are
+    not thread-safe, so each pool thread creates its own client per exchange
+    while all threads share that exchange's bucket. With a
+    ``checkpoint_dir`` each finished page is saved, so a rerun of an
+    interrupted job only fetches the missing pages; checkpoints are removed
+    once a job completes. Results are UTC-normalized, sorted and deduplicated
+    like ``DataFetcher``.
+    """
+
+    def __init__(
+        self,
+        exchange_factory: Callable[[str], Any] | None = None,
+        max_workers: int = 8,
+        requests_per_second: Mapping[str, float] | None = None,
+        page_limit: int = 1000,
+        checkpoint_dir: str | Path | None = None,
+        retries: int = 3,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._exchange_factory = exchange_factory or _ccxt_exchange
+        self.max_workers = max_workers
+        self.requests_per_second = dict(requests_per_second or {})
+        self.page_limit = page_limit
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir is not None else None
+        self.retries = retries
+        self._clients = threading.local()
+        self._buckets: dict[str, TokenBucket | None] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, job: DownloadJob) -> pd.DataFrame:
+        result = self.fetch_many([job])[0]
+        if result.error is not None:
+            raise result.error
+        return result.data
+
+    def fetch_many(self, jobs: Iterable[DownloadJob]) -> list[DownloadResult]:
+        """Download every job; failures are reported per job, not raised."""
+        jobs = list(jobs)
+        plans: list[tuple[DownloadJob, list[int], int] | BaseException] = []
+        for job in jobs:
+            try:
+                plans.append(self._plan(job))
+            except Exception as exc:  # noqa: BLE001 - reported in the result
+                plans.append(exc)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = []
+            for plan in plans:
+                if isinstance(plan, BaseException):
+                    pending.append(plan)
+                    continue
+                planned, starts, step = plan
+                pending.append(
+                    (planned, [executor.submit(self._page, planned, start, step) for start in starts])
+                )
+
+            results = []
+            for job, item in zip(jobs, pending):
+                if isinstance(item, BaseException):
+                    results.append(DownloadResult(job, None, item))
+                    continue
+                planned, futures = item
+                try:
+                    pages = [future.result() for future in futures]
+                except Exception as exc:  # noqa: BLE001 - reported in the result
+                    results.append(DownloadResult(job, None, exc))
+                    continue
+                results.append(DownloadResult(job, _to_frame(pages)))
+                self._clear_checkpoint(planned)
+        return results
+
+    def _plan(self, job: DownloadJob) -> tuple[DownloadJob, list[int], int]:
+        exchange = self._exchange(job.exchange_id)
+        step = int(exchange.parse_timeframe(job.timeframe) * 1000) * self.page_limit
+        until_ms = job.until_ms if job.until_ms is not None else int(exchange.milliseconds())
+        job = DownloadJob(job.exchange_id, job.symbol, job.timeframe, job.since_ms, until_ms)
+        self._prepare_checkpoint(job, step)
+        return job, list(range(job.since_ms, until_ms, step)), step
+
+    def _page(self, job: DownloadJob, start: int, step: int) -> np.ndarray:
+        stop = min(start + step, job.until_ms)
+        path = self._page_path(job, start)
+        if path is not None and path.exists():
+            page = np.load(path)
+            return page[(page[:, 0] >= start) & (page[:, 0] < stop)]
+
+        exchange = self._exchange(job.exchange_id)
+        bucket = self._buckets[job.exchange_id]
+        for attempt in range(self.retries + 1):
+            if bucket is not None:
+                bucket.acquire()
+            try:
+                rows = exchange.fetch_ohlcv(job.symbol, job.timeframe, since=start, limit=self.page_limit)
+                break
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(min(0.5 * 2**attempt, 10.0))
+
+        page = np.asarray(rows, dtype=np.float64).reshape(-1, len(COLUMNS))
+        page = page[(page[:, 0] >= start) & (page[:, 0] < stop)]
+        if path is not None:
+            tmp_path = path.with_suffix(".tmp.npy")
+            np.save(tmp_path, page)
+            os.replace(tmp_path, path)
+        return page
+
+    def _exchange(self, exchange_id: str):
+        """This thread's client for ``exchange_id``; the rate bucket is shared."""
+        clients = getattr(self._clients, "by_id", None)
+        if clients is None:
+            clients = self._clients.by_id = {}
+        if exchange_id not in clients:
+            exchange = self._exchange_factory(exchange_id)
+            clients[exchange_id] = exchange
+            with self._lock:
+                if exchange_id not in self._buckets:
+                    rate = self.requests_per_second.get(exchange_id)
+                    if rate is None and getattr(exchange, "rateLimit", None):
+                        rate = 1000.0 / float(exchange.rateLimit)
+                    self._buckets[exchange_id] = TokenBucket(rate) if rate else None
+        return clients[exchange_id]
+
+    def _job_dir(self, job: DownloadJob) -> Path | None:
+        if self.checkpoint_dir is None:
+            return None
+        return self.checkpoint_dir / job.name
+
+    def _page_path(self, job: DownloadJob, start: int) -> Path | None:
+        directory = self._job_dir(job)
+        return directory / f"{start}.npy" if directory is not None else None
+
+    def _prepare_checkpoint(self, job: DownloadJob, step: int) -> None:
+        """Keep saved pages of the same page grid whose window was complete."""
+        directory = self._job_dir(job)
+        if directory is None:
+            return
+        spec_path = directory / "job.json"
+        if spec_path.exists():
+            saved = json.loads(spec_path.read_text(encoding="utf-8"))
+            if saved["since_ms"] == job.since_ms and saved["page_limit"] == self.page_limit:
+                # A page cut short by the previous range end is refetched.
+                for path in directory.glob("*.npy"):
+                    if path.stem.isdigit() and int(path.stem) + step > saved["until_ms"]:
+                        path.unlink()
+            else:
+                shutil.rmtree(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        spec = {"since_ms": job.since_ms, "until_ms": job.until_ms, "page_limit": self.page_limit}
+        spec_path.write_text(json.dumps(spec), encoding="utf-8")
+
+    def _clear_checkpoint(self, job: DownloadJob) -> None:
+        directory = self._job_dir(job)
+        if directory is not None and directory.exists():
+            shutil.rmtree(directory)
+
+
+def _to_frame(pages: list[np.ndarray]) -> pd.DataFrame:
+    values = np.concatenate(pages) if pages else np.empty((0, len(COLUMNS)))
+    frame = pd.DataFrame(values, columns=COLUMNS)
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"].astype(np.int64), unit="ms", utc=True)
+    frame = frame.drop_duplicates(subset=["timestamp"]).sort_values("timestamp")
+    return frame.reset_index(drop=True)
+
+
+def _ccxt_exchange(exchange_id: str):
+    import ccxt  # Imported lazily to avoid import cost unless needed.
+
+    try:
+        exchange_class = getattr(ccxt, exchange_id)
+    except AttributeError as exc:
+        raise ValueError(f"Unsupported exchange: {exchange_id}") from exc
+    # Requests are paced by the downloader's token bucket instead.
+    return exchange_class({"enableRateLimit": False})
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable
 
 import pandas as pd
 
-from .storage import CacheKey, ParquetStore
+from .storage import CacheKey, ColumnarStore, ParquetStore
 
 
 @dataclass(frozen=True)
@@ -21,7 +22,9 @@ class FetchRequest:
 class DataFetcher:
     """Unified interface for multi-exchange OHLCV fetching."""
 
-    def __init__(self, exchange_id: str, store: ParquetStore | None = None) -> None:
+    def __init__(
+        self, exchange_id: str, store: ParquetStore | ColumnarStore | None = None
+    ) -> None:
         self.exchange_id = exchange_id
         self.store = store
         self._exchange = None
@@ -52,13 +55,73 @@ class DataFetcher:
 
         fresh = self._normalize(self._to_frame(rows))
         combined = self._combine_cached(cached, fresh)
-        if self.store:
+        if self.store and hasattr(self.store, "append") and cached is not None:
+            # Append-only stores only need the bars past the cached range.
+            if not fresh.empty:
+                self.store.append(cache_key, fresh)
+        elif self.store:
             self.store.save(cache_key, combined)
         return combined
 
-    def fetch_ohlcv_range(self, requests: Iterable[FetchRequest]) -> pd.DataFrame:
-        """Fetch and concatenate multiple requests in order."""
-        frames = [self.fetch_ohlcv(request) for request in requests]
+    def update(self, request: FetchRequest) -> int:
+        """Top up the store with bars after its last cached timestamp.
+
+        Unlike ``fetch_ohlcv`` this never loads the cached history: the last
+        timestamp comes from store metadata and only new bars are written.
+        Returns the number of bars added.
+        """
+        if self.store is None:
+            raise ValueError("DataFetcher.update requires a store")
+        exchange = self._get_exchange()
+        exchange.load_markets()
+
+        cache_key = CacheKey(self.exchange_id, request.symbol, request.timeframe)
+        timeframe_ms = self._timeframe_ms(exchange, request.timeframe)
+        last = self.store.last_timestamp(cache_key)
+        since = request.since
+        if last is not None:
+            last_ms = int(pd.Timestamp(last).value // 1_000_000)
+            since = last_ms + timeframe_ms if since is None else max(since, last_ms + timeframe_ms)
+
+        if since is None:
+            rows = exchange.fetch_ohlcv(
+                request.symbol, request.timeframe, since=None, limit=request.limit
+            )
+        else:
+            rows = self._fetch_paginated(exchange, request, since, timeframe_ms)
+        fresh = self._normalize(self._to_frame(rows))
+        if fresh.empty:
+            return 0
+        return self.store.append(cache_key, fresh)
+
+    def fetch_ohlcv_range(
+        self, requests: Iterable[FetchRequest], max_workers: int = 1
+    ) -> pd.DataFrame:
+        """Fetch and concatenate multiple requests in order.
+
+        ``max_workers > 1`` runs requests for different symbols/timeframes in
+        parallel. Requests sharing a cache key stay sequential in one worker,
+        so they never append to the same store entry concurrently, and each
+        worker uses its own exchange client (ccxt clients are not thread-safe).
+        """
+        requests = list(requests)
+        groups: dict[CacheKey, list[int]] = {}
+        for i, request in enumerate(requests):
+            key = CacheKey(self.exchange_id, request.symbol, request.timeframe)
+            groups.setdefault(key, []).append(i)
+        if max_workers > 1 and len(groups) > 1:
+            frames: list[pd.DataFrame | None] = [None] * len(requests)
+
+            def run_group(indices: list[int]) -> None:
+                fetcher = DataFetcher(self.exchange_id, store=self.store)
+                for i in indices:
+                    frames[i] = fetcher.fetch_ohlcv(requests[i])
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for future in [executor.submit(run_group, group) for group in groups.values()]:
+                    future.result()
+        else:
+            frames = [self.fetch_ohlcv(request) for request in requests]
         if not frames:
             return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
         combined = pd.concat(frames, ignore_index=True)
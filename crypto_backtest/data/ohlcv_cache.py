@@ -0,0 +1,158 @@
+"""Process-level cache of parsed OHLCV files, optionally shared across processes."""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from . import columnar
+from .shared import SharedFrame, SharedFrameHandle, attach_frame
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# JSON map of resolved path -> published segment, inherited by worker
+# processes started inside ``share_ohlcv``.
+SHARED_OHLCV_ENV = "CRYPTO_BACKTEST_SHARED_OHLCV"
+
+
+def read_ohlcv(path: str | Path) -> pd.DataFrame:
+    """Parse a native, parquet or CSV OHLCV file into a UTC-indexed float64 frame."""
+    path = Path(path)
+    if path.suffix == columnar.SUFFIX:
+        return columnar.OHLCVFile(path).read()
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+        df.columns = [str(col).strip() for col in df.columns]
+
+    if "timestamp" in df.columns:
+        df.index = pd.to_datetime(df["timestamp"], utc=True)
+    elif not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index, utc=True)
+    if df.index.tz is None:
+        df.index = df.index.tz_localize("UTC")
+    elif str(df.index.tz) != "UTC":
+        df.index = df.index.tz_convert("UTC")
+
+    missing = [col for col in OHLCV_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"{path} is missing OHLCV columns: {missing}")
+    return df[list(OHLCV_COLUMNS)].astype(np.float64)
+
+
+class OHLCVCache:
+    """Parsed OHLCV frames keyed by (resolved path, mtime).
+
+    A file is re-read only when its modification time changes. Frames are
+    backed by read-only arrays and every ``load`` returns a shallow copy, so
+    callers may reassign the index or add columns without touching the
+    cache. Inside ``share_ohlcv`` the frames come from shared memory instead.
+    """
+
+    def __init__(self) -> None:
+        self._frames: dict[str, tuple[int, pd.DataFrame]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str | Path) -> pd.DataFrame:
+        key = str(Path(path).resolve())
+        mtime_ns = os.stat(key).st_mtime_ns
+        entry = self._frames.get(key)
+        if entry is not None and entry[0] == mtime_ns:
+            self.hits += 1
+            return entry[1].copy(deep=False)
+
+        self.misses += 1
+        frame = _attach_published(key, mtime_ns)
+        if frame is None:
+            frame = _read_only(read_ohlcv(key))
+        self._frames[key] = (mtime_ns, frame)
+        return frame.copy(deep=False)
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+_DEFAULT_CACHE = OHLCVCache()
+
+
+def load_ohlcv(path: str | Path) -> pd.DataFrame:
+    """Load ``path`` through the process-wide ``OHLCVCache``."""
+    return _DEFAULT_CACHE.load(path)
+
+
+def clear_ohlcv_cache() -> None:
+    _DEFAULT_CACHE.clear()
+
+
+@contextmanager
+def share_ohlcv(paths: Iterable[str | Path]) -> Iterator[dict[str, SharedFrameHandle]]:
+    """Publish OHLCV files in shared memory for worker processes.
+
+    Worker processes started inside the block find the segments through
+    ``SHARED_OHLCV_ENV`` and ``load_ohlcv`` attaches them zero-copy instead
+    of parsing the file. Segments are unlinked on exit.
+    """
+    previous = os.environ.get(SHARED_OHLCV_ENV)
+    published = json.loads(previous) if previous else {}
+    shared: list[SharedFrame] = []
+    handles: dict[str, SharedFrameHandle] = {}
+    try:
+        for path in paths:
+            key = str(Path(path).resolve())
+            frame = SharedFrame(load_ohlcv(key))
+            shared.append(frame)
+            handles[key] = frame.handle
+            published[key] = {
+                "mtime_ns": os.stat(key).st_mtime_ns,
+                "name": frame.handle.name,
+                "n_rows": frame.handle.n_rows,
+                "columns": list(frame.handle.columns),
+                "index_name": frame.handle.index_name,
+                "tz": frame.handle.tz,
+            }
+        os.environ[SHARED_OHLCV_ENV] = json.dumps(published)
+        yield handles
+    finally:
+        if previous is None:
+            os.environ.pop(SHARED_OHLCV_ENV, None)
+        else:
+            os.environ[SHARED_OHLCV_ENV] = previous
+        for frame in shared:
+            frame.close()
+
+
+def _attach_published(key: str, mtime_ns: int) -> pd.DataFrame | None:
+    published = os.environ.get(SHARED_OHLCV_ENV)
+    if not published:
+        return None
+    entry = json.loads(published).get(key)
+    if entry is None or entry["mtime_ns"] != mtime_ns:
+        return None
+    handle = SharedFrameHandle(
+        name=entry["name"],
+        n_rows=entry["n_rows"],
+        columns=tuple(entry["columns"]),
+        index_name=entry["index_name"],
+        tz=entry["tz"],
+    )
+    try:
+        return attach_frame(handle)
+    except FileNotFoundError:  # Publisher already closed the segment.
+        return None
+
+
+def _read_only(frame: pd.DataFrame) -> pd.DataFrame:
+    values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64))
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=frame.index, columns=frame.columns, copy=False)
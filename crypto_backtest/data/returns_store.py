@@ -0,0 +1,174 @@
+"""Append-only, memory-mappable store for per-trial bar returns (PBO inputs)."""
+
+from __future__ import annotations
+
+import json
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib import format as npy_format
+
+DTYPE = np.dtype("<f4")
+
+
+class ReturnsMatrixStore:
+    """(n_trials, n_bars) float32 returns matrix grown one trial row at a time.
+
+    Rows live in ``returns_matrix_<asset>_<run_id>.npy`` (a regular ``.npy``
+    file, so ``np.load`` keeps working) and metadata in a JSON sidecar: asset,
+    run_id, bar index range and each row's trial params. Appends rewrite the
+    fixed-size ``.npy`` header in place; readers open the file memory-mapped so
+    several guard processes can share one copy through the page cache.
+    """
+
+    def __init__(self, root_dir: str | Path, asset: str, run_id: str) -> None:
+        self.root_dir = Path(root_dir)
+        self.asset = asset
+        self.run_id = run_id
+
+    @property
+    def data_path(self) -> Path:
+        return self.root_dir / f"returns_matrix_{self.asset}_{self.run_id}.npy"
+
+    @property
+    def metadata_path(self) -> Path:
+        return self.root_dir / f"returns_matrix_{self.asset}_{self.run_id}.json"
+
+    def exists(self) -> bool:
+        return self.data_path.exists()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        with open(self.data_path, "rb") as handle:
+            shape, _, _ = _read_header(handle)
+        return shape
+
+    def metadata(self) -> dict[str, Any]:
+        """Return the sidecar metadata (empty trials list for legacy files)."""
+        if self.metadata_path.exists():
+            return json.loads(self.metadata_path.read_text(encoding="utf-8"))
+        n_trials, n_bars = self.shape
+        return {
+            "asset": self.asset,
+            "run_id": self.run_id,
+            "n_bars": n_bars,
+            "bar_start": None,
+            "bar_end": None,
+            "trials": [{"row": row, "params": {}} for row in range(n_trials)],
+        }
+
+    def reset(self) -> None:
+        """Delete any existing matrix and metadata for this asset/run."""
+        for path in (self.data_path, self.metadata_path):
+            if path.exists():
+                path.unlink()
+
+    def append(
+        self,
+        returns: np.ndarray,
+        params: dict[str, Any] | None = None,
+        index: pd.Index | None = None,
+    ) -> int:
+        """Append one trial row and return its row number.
+
+        The first row fixes ``n_bars`` (and the bar range when ``index`` is
+        given); later rows must have the same length.
+        """
+        row = np.ascontiguousarray(returns, dtype=DTYPE)
+        if row.ndim != 1:
+            raise ValueError("returns must be 1D")
+
+        if not self.exists():
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.data_path, "wb") as handle:
+                npy_format.write_array_header_1_0(handle, _header((0, len(row))))
+            metadata = {
+                "asset": self.asset,
+                "run_id": self.run_id,
+                "n_bars": int(len(row)),
+                "bar_start": str(index[0]) if index is not None and len(index) else None,
+                "bar_end": str(index[-1]) if index is not None and len(index) else None,
+                "trials": [],
+            }
+        else:
+            metadata = self.metadata()
+
+        with open(self.data_path, "r+b") as handle:
+            (n_trials, n_bars), offset, dtype = _read_header(handle)
+            if dtype != DTYPE:
+                raise ValueError(f"store dtype {dtype} is not {DTYPE}")
+            if len(row) != n_bars:
+                raise ValueError(f"returns length {len(row)} != store n_bars {n_bars}")
+            handle.seek(offset + n_trials * n_bars * DTYPE.itemsize)
+            handle.write(row.tobytes())
+            handle.flush()
+
+            header = _encode_header((n_trials + 1, n_bars))
+            if len(header) != offset:
+                raise RuntimeError("npy header cannot grow in place; numpy >= 1.24 required")
+            handle.seek(0)
+            handle.write(header)
+
+        metadata["trials"].append({"row": n_trials, "params": params or {}})
+        _write_json_atomic(self.metadata_path, metadata)
+        return n_trials
+
+    def load(self, rows: Sequence[int] | None = None) -> np.ndarray:
+        """Open the matrix read-only and memory-mapped, or copy only ``rows``."""
+        matrix = np.load(self.data_path, mmap_mode="r")
+        if rows is None:
+            return matrix
+        return np.asarray(matrix[np.asarray(rows, dtype=np.int64)])
+
+    def find_rows(self, **params: Any) -> list[int]:
+        """Row numbers of trials whose params match every given key/value."""
+        return [
+            trial["row"]
+            for trial in self.metadata()["trials"]
+            if all(trial["params"].get(key) == value for key, value in params.items())
+        ]
+
+    @classmethod
+    def latest(cls, root_dir: str | Path, asset: str) -> "ReturnsMatrixStore | None":
+        """Store for the most recent run_id of ``asset`` in ``root_dir``."""
+        prefix = f"returns_matrix_{asset}_"
+        matches = sorted(Path(root_dir).glob(f"{prefix}*.npy"))
+        if not matches:
+            return None
+        return cls(root_dir, asset, matches[-1].stem[len(prefix):])
+
+
+def _header(shape: tuple[int, int]) -> dict[str, Any]:
+    return {
+        "descr": npy_format.dtype_to_descr(DTYPE),
+        "fortran_order": False,
+        "shape": shape,
+    }
+
+
+def _encode_header(shape: tuple[int, int]) -> bytes:
+    buffer = BytesIO()
+    npy_format.write_array_header_1_0(buffer, _header(shape))
+    return buffer.getvalue()
+
+
+def _read_header(handle) -> tuple[tuple[int, int], int, np.dtype]:
+    handle.seek(0)
+    version = npy_format.read_magic(handle)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(handle)
+    else:
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(handle)
+    if fortran_order or len(shape) != 2:
+        raise ValueError("returns matrix must be a C-ordered 2D array")
+    return shape, handle.tell(), dtype
+
+
+def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -0,0 +1,103 @@
+"""Share a numeric OHLCV frame with worker processes through POSIX shared memory."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+# Frames attached in this process, keyed by segment name. Workers in a pool
+# attach once and reuse the zero-copy view for every task.
+_ATTACHED: dict[str, tuple[SharedMemory, pd.DataFrame]] = {}
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable description of a frame published by ``SharedFrame``."""
+
+    name: str
+    n_rows: int
+    columns: tuple[str, ...]
+    index_name: str | None
+    tz: str | None
+
+
+class SharedFrame:
+    """Publish a DatetimeIndex-ed float frame once; workers ``attach_frame`` it.
+
+    The segment holds the index as int64 nanoseconds followed by the columns
+    as a row-major float64 matrix. The creating process owns the segment and
+    must ``close()`` it (or use the object as a context manager).
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("SharedFrame requires a DatetimeIndex")
+        values = data.to_numpy(dtype=np.float64)
+        stamps = data.index.as_unit("ns").asi8
+        n_rows, n_cols = values.shape
+
+        self._shm = SharedMemory(create=True, size=max(1, 8 * n_rows * (n_cols + 1)))
+        buffer_index, buffer_values = _views(self._shm, n_rows, n_cols)
+        buffer_index[:] = stamps
+        buffer_values[:] = values
+
+        tz = data.index.tz
+        self.handle = SharedFrameHandle(
+            name=self._shm.name,
+            n_rows=n_rows,
+            columns=tuple(str(column) for column in data.columns),
+            index_name=data.index.name,
+            tz=str(tz) if tz is not None else None,
+        )
+
+    def close(self) -> None:
+        """Release and unlink the segment."""
+        if self._shm is None:
+            return
+        _ATTACHED.pop(self._shm.name, None)
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_frame(handle: SharedFrameHandle) -> pd.DataFrame:
+    """Return a read-only DataFrame backed by the shared segment (cached per process)."""
+    attached = _ATTACHED.get(handle.name)
+    if attached is not None:
+        return attached[1]
+
+    shm = _open_segment(handle.name)
+    stamps, values = _views(shm, handle.n_rows, len(handle.columns))
+    stamps.flags.writeable = False
+    values.flags.writeable = False
+    index = pd.DatetimeIndex(stamps.view("M8[ns]"), name=handle.index_name)
+    if handle.tz is not None:
+        index = index.tz_localize("UTC").tz_convert(handle.tz)
+    frame = pd.DataFrame(values, index=index, columns=list(handle.columns), copy=False)
+    _ATTACHED[handle.name] = (shm, frame)
+    return frame
+
+
+def _views(shm: SharedMemory, n_rows: int, n_cols: int) -> tuple[np.ndarray, np.ndarray]:
+    stamps = np.ndarray((n_rows,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray((n_rows, n_cols), dtype=np.float64, buffer=shm.buf, offset=8 * n_rows)
+    return stamps, values
+
+
+def _open_segment(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no ``track``; the owner unlinks the segment.
+        shm = SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -1,12 +1,16 @@
-"""Local storage for market data (Parquet cache)."""
+"""Local storage for market data (Parquet and native columnar caches)."""
 
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
 
+from .columnar import SUFFIX, OHLCVFile
+
 
 @dataclass(frozen=True)
 class CacheKey:
@@ -16,25 +20,184 @@ class CacheKey:
 
 
 class ParquetStore:
-    """Simple Parquet cache for OHLCV data."""
+    """Parquet cache for OHLCV data, partitioned by calendar month.
+
+    Each key is a directory of ``YYYY-MM.parquet`` files plus ``_meta.json``
+    holding the row count and last timestamp, so top-ups rewrite only the
+    months they touch and never read the full history. A legacy single
+    ``{symbol}-{timeframe}.parquet`` file is still read until the next save.
+    """
+
+    META_FILE = "_meta.json"
 
     def __init__(self, root_dir: str) -> None:
         self.root_dir = Path(root_dir)
 
     def load(self, key: CacheKey) -> pd.DataFrame | None:
         """Load cached data if available."""
+        partitions = self._partitions(key)
+        if partitions:
+            frames = [pd.read_parquet(path) for path in partitions]
+            return pd.concat(frames, ignore_index=True)
+        legacy = self._legacy_path(key)
+        if legacy.exists():
+            return pd.read_parquet(legacy)
+        return None
+
+    def save(self, key: CacheKey, data: pd.DataFrame) -> None:
+        """Replace the cached data for ``key``."""
+        directory = self._dir_for_key(key)
+        for path in self._partitions(key):
+            path.unlink()
+        data = _sorted_unique(data)
+        for month, frame in _by_month(data):
+            _write_parquet_atomic(directory / f"{month}.parquet", frame)
+        self._write_meta(key, len(data), data["timestamp"].iloc[-1] if len(data) else None)
+        legacy = self._legacy_path(key)
+        if legacy.exists():
+            legacy.unlink()
+
+    def append(self, key: CacheKey, data: pd.DataFrame) -> int:
+        """Persist bars newer than the cached range; return how many were added."""
+        meta = self._read_meta(key)
+        if meta is None:
+            cached = self.load(key)
+            if cached is not None and not cached.empty:
+                # Migrate a legacy file to partitions once.
+                self.save(key, cached)
+                meta = self._read_meta(key)
+
+        if meta is None:
+            self.save(key, data)
+            return self._read_meta(key)["rows"]
+
+        fresh = _sorted_unique(data)
+        last = meta["last_timestamp"]
+        if last is not None:
+            fresh = fresh[fresh["timestamp"] > pd.Timestamp(last)]
+        if fresh.empty:
+            return 0
+
+        # Partitions are written before the metadata, so after a crash between
+        # the two a partition may already hold bars the metadata does not
+        # count. Merges are deduplicated and counts come from what is written.
+        directory = self._dir_for_key(key)
+        added = 0
+        rows = meta["rows"]
+        for month, frame in _by_month(fresh):
+            path = directory / f"{month}.parquet"
+            existing = counted = 0
+            if path.exists():
+                current = pd.read_parquet(path)
+                existing = len(current)
+                if last is not None:
+                    counted = int((current["timestamp"] <= pd.Timestamp(last)).sum())
+                frame = _sorted_unique(pd.concat([current, frame], ignore_index=True))
+            _write_parquet_atomic(path, frame)
+            added += len(frame) - existing
+            rows += len(frame) - counted
+        # The last month written ends the data, including bars left by a crash.
+        self._write_meta(key, rows, frame["timestamp"].iloc[-1])
+        return added
+
+    def last_timestamp(self, key: CacheKey) -> pd.Timestamp | None:
+        """Last cached bar time, read from metadata rather than the data."""
+        meta = self._read_meta(key)
+        if meta is not None:
+            last = meta["last_timestamp"]
+            return pd.Timestamp(last) if last is not None else None
+        legacy = self._legacy_path(key)
+        if legacy.exists():
+            stamps = pd.read_parquet(legacy, columns=["timestamp"])["timestamp"]
+            return pd.Timestamp(stamps.max()) if len(stamps) else None
+        return None
+
+    def _partitions(self, key: CacheKey) -> list[Path]:
+        directory = self._dir_for_key(key)
+        if not directory.exists():
+            return []
+        return sorted(directory.glob("*.parquet"))
+
+    def _read_meta(self, key: CacheKey) -> dict | None:
+        path = self._dir_for_key(key) / self.META_FILE
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _write_meta(self, key: CacheKey, rows: int, last_timestamp) -> None:
+        directory = self._dir_for_key(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "rows": int(rows),
+            "last_timestamp": pd.Timestamp(last_timestamp).isoformat()
+            if last_timestamp is not None
+            else None,
+        }
+        tmp_path = directory / (self.META_FILE + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, directory / self.META_FILE)
+
+    def _dir_for_key(self, key: CacheKey) -> Path:
+        return self.root_dir / key.exchange / _stem_for_key(key)
+
+    def _legacy_path(self, key: CacheKey) -> Path:
+        return self.root_dir / key.exchange / f"{_stem_for_key(key)}.parquet"
+
+
+class ColumnarStore:
+    """Append-only ``OHLCVFile`` cache with the ``ParquetStore`` interface."""
+
+    def __init__(self, root_dir: str) -> None:
+        self.root_dir = Path(root_dir)
+
+    def load(self, key: CacheKey) -> pd.DataFrame | None:
+        """Load cached data (with a ``timestamp`` column) if available."""
         path = self._path_for_key(key)
         if not path.exists():
             return None
-        return pd.read_parquet(path)
+        return OHLCVFile(path).read().reset_index()
 
     def save(self, key: CacheKey, data: pd.DataFrame) -> None:
-        """Persist data to the cache."""
-        path = self._path_for_key(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        data.to_parquet(path, index=False)
+        """Replace the cached file with ``data``."""
+        OHLCVFile.write(self._path_for_key(key), data)
+
+    def append(self, key: CacheKey, data: pd.DataFrame) -> int:
+        """Append bars newer than the cached range; return how many were added."""
+        return OHLCVFile(self._path_for_key(key)).append(data)
+
+    def last_timestamp(self, key: CacheKey) -> pd.Timestamp | None:
+        """Last cached bar time, read from the file header."""
+        file = OHLCVFile(self._path_for_key(key))
+        if not file.exists() or file.header.n_rows == 0:
+            return None
+        return pd.Timestamp(file.header.end_ns, tz="UTC")
 
     def _path_for_key(self, key: CacheKey) -> Path:
-        safe_symbol = key.symbol.replace("/", "_")
-        filename = f"{safe_symbol}-{key.timeframe}.parquet"
-        return self.root_dir / key.exchange / filename
+        return self.root_dir / key.exchange / f"{_stem_for_key(key)}{SUFFIX}"
+
+
+def _stem_for_key(key: CacheKey) -> str:
+    safe_symbol = key.symbol.replace("/", "_")
+    return f"{safe_symbol}-{key.timeframe}"
+
+
+def _sorted_unique(data: pd.DataFrame) -> pd.DataFrame:
+    data = data.drop_duplicates(subset=["timestamp"], keep="last")
+    return data.sort_values("timestamp").reset_index(drop=True)
+
+
+def _by_month(data: pd.DataFrame):
+    """Yield ``(YYYY-MM, rows)`` groups of a timestamp-sorted frame."""
+    if data.empty:
+        return
+    stamps = pd.to_datetime(data["timestamp"], utc=True)
+    months = stamps.dt.strftime("%Y-%m")
+    for month, frame in data.groupby(months.to_numpy(), sort=True):
+        yield month, frame.reset_index(drop=True)
+
+
+def _write_parquet_atomic(path: Path, data: pd.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    data.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
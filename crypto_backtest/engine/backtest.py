@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Callable, Literal, Sequence
+import os
+
+import numpy as np
 import pandas as pd
 
+from crypto_backtest.analysis.metrics import _periods_per_year
 from crypto_backtest.strategies.base import BaseStrategy
 from crypto_backtest.engine.execution import apply_fees_and_slippage
 from crypto_backtest.engine.position_manager import MultiTPPositionManager, PositionLeg
+from crypto_backtest.indicators.cache import IndicatorCache
+
+# Bump whenever a change alters simulated trades or equity, so cached
+# results (see ``crypto_backtest.engine.result_cache``) are not reused.
+ENGINE_VERSION = "1"
 
 
 @dataclass(frozen=True)
@@ -28,22 +37,29 @@ class BacktestResult:
 
 
 class VectorizedBacktester:
-    def __init__(self, config: BacktestConfig) -> None:
+    def __init__(self, config: BacktestConfig, result_cache=None) -> None:
         self.config = config
+        # Optional ``BacktestResultCache``; without one, ``run`` uses the
+        # cache named by $CRYPTO_BACKTEST_RESULT_CACHE, if any.
+        self.result_cache = result_cache
 
     def run(self, data: pd.DataFrame, strategy: BaseStrategy) -> BacktestResult:
         """Run a vectorized backtest and return results."""
+        cache = self.result_cache
+        if cache is None:
+            from crypto_backtest.engine.result_cache import default_result_cache
+
+            cache = default_result_cache()
+        if cache is None or data.empty:
+            return self._run(data, strategy)
+        return cache.get_or_run(data, strategy, self.config, lambda: self._run(data, strategy))
+
+    def _run(self, data: pd.DataFrame, strategy: BaseStrategy) -> BacktestResult:
         if data.empty:
             return BacktestResult(equity_curve=pd.Series(dtype=float), trades=pd.DataFrame())
 
         signals = strategy.generate_signals(data)
-        position_manager = MultiTPPositionManager(
-            [
-                PositionLeg(size=0.5, tp_multiple=2.0),
-                PositionLeg(size=0.3, tp_multiple=6.0),
-                PositionLeg(size=0.2, tp_multiple=10.0),
-            ]
-        )
+        position_manager = self._position_manager()
         trades = position_manager.simulate(
             signals,
             data,
@@ -54,8 +70,72 @@ class VectorizedBacktester:
             slippage_bps=self.config.slippage_bps,
             risk_per_trade=self.config.risk_per_trade,
         )
+        return self._result(trades, data.index)
+
+    def run_segments(
+        self,
+        data: pd.DataFrame,
+        strategy: BaseStrategy,
+        bounds: Sequence[tuple[int, int]],
+        carry_state: bool = False,
+    ) -> list[BacktestResult]:
+        """Backtest row ranges ``[start, stop)`` of ``data`` with one signal pass.
+
+        Signals are generated once on the full history, so indicators are warm
+        at every segment start. Each segment is then simulated on its own from
+        a flat book and ``initial_capital``. With ``carry_state`` the full
+        history is simulated once instead: positions open at a boundary run
+        on, and each trade belongs to the segment of its exit bar. For the old
+        cold-start behaviour, call ``run`` on each slice.
+        """
+        if data.empty:
+            return [self.run(data, strategy) for _ in bounds]
+
+        signals = strategy.generate_signals(data)
+        position_manager = self._position_manager()
+        arrays = (
+            data["high"].to_numpy(dtype=float),
+            data["low"].to_numpy(dtype=float),
+            signals["signal"].to_numpy().astype(np.int64),
+            signals["entry_price"].to_numpy(dtype=float),
+            signals["sl_price"].to_numpy(dtype=float),
+            signals["tp1_price"].to_numpy(dtype=float),
+            signals["tp2_price"].to_numpy(dtype=float),
+            signals["tp3_price"].to_numpy(dtype=float),
+        )
+
+        def simulate(start: int, stop: int) -> pd.DataFrame:
+            return position_manager.simulate_arrays(
+                *(values[start:stop] for values in arrays),
+                data.index[start:stop],
+                self.config.initial_capital,
+                sizing_mode=self.config.sizing_mode,
+                intrabar_order=self.config.intrabar_order,
+                fees_bps=self.config.fees_bps,
+                slippage_bps=self.config.slippage_bps,
+                risk_per_trade=self.config.risk_per_trade,
+            )
+
+        if not carry_state:
+            return [
+                self._result(simulate(start, stop), data.index[start:stop])
+                for start, stop in bounds
+            ]
+
+        trades = simulate(0, len(data))
+        exit_pos = (
+            data.index.get_indexer(trades["exit_time"]) if not trades.empty else np.empty(0, int)
+        )
+        results = []
+        for start, stop in bounds:
+            segment = trades[(exit_pos >= start) & (exit_pos < stop)] if not trades.empty else trades
+            results.append(self._result(segment.reset_index(drop=True), data.index[start:stop]))
+        return results
+
+    def _result(self, trades: pd.DataFrame, index: pd.Index) -> BacktestResult:
+        """Attach per-trade PnL and build the equity curve on ``index``."""
         if trades.empty:
-            equity_curve = pd.Series(self.config.initial_capital, index=data.index)
+            equity_curve = pd.Series(self.config.initial_capital, index=index)
             return BacktestResult(equity_curve=equity_curve, trades=trades)
 
         if "net_pnl" in trades.columns:
@@ -69,7 +149,191 @@ class VectorizedBacktester:
             )
 
         pnl_by_time = trades.groupby("exit_time")["pnl"].sum()
-        pnl_series = pnl_by_time.reindex(data.index, fill_value=0.0)
+        pnl_series = pnl_by_time.reindex(index, fill_value=0.0)
         equity_curve = self.config.initial_capital + pnl_series.cumsum()
 
         return BacktestResult(equity_curve=equity_curve, trades=trades)
+
+    def run_many(
+        self,
+        data: pd.DataFrame,
+        strategies: Sequence[BaseStrategy],
+        n_jobs: int = 1,
+        evaluate: Callable[[BacktestResult], Any] | None = None,
+        cache_size: int = 256,
+    ) -> list[Any]:
+        """Backtest a batch of strategies on the same dataset.
+
+        The batch is split into ``n_jobs`` contiguous chunks (``-1`` uses every
+        core). Each chunk runs in one worker with a shared ``IndicatorCache``,
+        so strategies that share indicator parameters (e.g. the same
+        ``tenkan``/``kijun``) compute them once; keep such strategies adjacent.
+        ``evaluate`` is applied to every result inside the worker, which avoids
+        shipping equity curves back; it must be picklable when ``n_jobs > 1``.
+        Outputs are returned in input order.
+        """
+        strategies = list(strategies)
+        if not strategies:
+            return []
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        n_chunks = max(1, min(n_jobs, len(strategies)))
+        if n_chunks == 1:
+            return _run_batch(self.config, data, strategies, evaluate, cache_size)
+
+        from joblib import Parallel, delayed
+
+        chunks = [
+            strategies[bounds[0] : bounds[-1] + 1]
+            for bounds in np.array_split(np.arange(len(strategies)), n_chunks)
+        ]
+        outputs = Parallel(n_jobs=n_chunks)(
+            delayed(_run_batch)(self.config, data, chunk, evaluate, cache_size) for chunk in chunks
+        )
+        return [item for chunk_outputs in outputs for item in chunk_outputs]
+
+    def run_cost_scenarios(
+        self,
+        data: pd.DataFrame,
+        signals: pd.DataFrame,
+        scenarios: Sequence[tuple[float, float]],
+    ) -> pd.DataFrame:
+        """Evaluate one precomputed signal frame under many cost scenarios.
+
+        ``scenarios`` is a sequence of ``(fees_bps, slippage_bps)`` pairs; the
+        config's own fees/slippage are ignored. Costs never change trade
+        timing, so the trades are simulated once (once per scenario in
+        ``equity`` sizing mode, where costs feed back into position size) and
+        all equity curves are evaluated together. Metrics use the same
+        definitions and units as ``compute_metrics``.
+        """
+        costs = np.asarray(scenarios, dtype=float).reshape(-1, 2)
+        fees_bps = costs[:, 0]
+        slippage_bps = costs[:, 1]
+        cost_rates = (fees_bps + slippage_bps) / 10_000.0
+        n_scenarios = len(costs)
+        n_bars = len(data)
+        initial_capital = self.config.initial_capital
+
+        position_manager = self._position_manager()
+        sim_kwargs = dict(
+            sizing_mode=self.config.sizing_mode,
+            intrabar_order=self.config.intrabar_order,
+            risk_per_trade=self.config.risk_per_trade,
+        )
+        if n_bars == 0:
+            trades = pd.DataFrame()
+        else:
+            trades = position_manager.simulate(
+                signals, data, initial_capital, fees_bps=0.0, slippage_bps=0.0, **sim_kwargs
+            )
+
+        if trades.empty:
+            net_pnl = np.zeros((n_scenarios, 0), dtype=float)
+            exit_idx = np.zeros(0, dtype=np.int64)
+            entry_group = np.zeros(0, dtype=np.int64)
+        else:
+            exit_idx = data.index.get_indexer(trades["exit_time"])
+            entry_group = pd.factorize(trades["entry_time"])[0]
+            if self.config.sizing_mode == "fixed":
+                gross = trades["gross_pnl"].to_numpy(dtype=float)
+                notional = trades["notional"].to_numpy(dtype=float)
+                net_pnl = gross[None, :] - notional[None, :] * cost_rates[:, None] * 2.0
+            else:
+                net_pnl = np.vstack(
+                    [
+                        position_manager.simulate(
+                            signals,
+                            data,
+                            initial_capital,
+                            fees_bps=fee,
+                            slippage_bps=slip,
+                            **sim_kwargs,
+                        )["net_pnl"].to_numpy(dtype=float)
+                        for fee, slip in costs
+                    ]
+                )
+
+        pnl_by_bar = np.zeros((n_scenarios, n_bars), dtype=float)
+        for row in range(n_scenarios):
+            pnl_by_bar[row] = np.bincount(exit_idx, weights=net_pnl[row], minlength=n_bars)
+        equity = initial_capital + np.cumsum(pnl_by_bar, axis=1)
+
+        result = pd.DataFrame(
+            {
+                "fees_bps": fees_bps,
+                "slippage_bps": slippage_bps,
+                "final_equity": equity[:, -1] if n_bars else np.full(n_scenarios, initial_capital),
+                "total_return": 0.0,
+                "sharpe_ratio": 0.0,
+                "max_drawdown": 0.0,
+                "profit_factor": 0.0,
+                "win_rate": 0.0,
+                "trades": int(net_pnl.shape[1]),
+            }
+        )
+        if n_bars == 0:
+            return result
+
+        start = np.where(equity[:, 0] == 0, 1.0, equity[:, 0])
+        result["total_return"] = equity[:, -1] / start - 1.0
+
+        if n_bars > 2:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = equity[:, 1:] / equity[:, :-1] - 1.0
+                mean = returns.mean(axis=1)
+                std = returns.std(axis=1, ddof=0)
+                sharpe = np.where(std > 0, mean / std, 0.0) * np.sqrt(_periods_per_year(data.index))
+            result["sharpe_ratio"] = np.where(np.isfinite(sharpe), sharpe, 0.0)
+
+        drawdown = equity / np.maximum.accumulate(equity, axis=1) - 1.0
+        result["max_drawdown"] = drawdown.min(axis=1)
+
+        if net_pnl.shape[1]:
+            n_groups = int(entry_group.max()) + 1
+            for row in range(n_scenarios):
+                signal_pnl = np.bincount(entry_group, weights=net_pnl[row], minlength=n_groups)
+                gains = signal_pnl[signal_pnl > 0].sum()
+                losses = signal_pnl[signal_pnl < 0].sum()
+                if losses != 0:
+                    profit_factor = gains / abs(losses)
+                else:
+                    profit_factor = np.inf if gains > 0 else 0.0
+                # compute_metrics maps non-finite profit factors to 0.0.
+                result.loc[row, "profit_factor"] = profit_factor if np.isfinite(profit_factor) else 0.0
+                result.loc[row, "win_rate"] = float((signal_pnl > 0).mean())
+        return result
+
+    @staticmethod
+    def _position_manager() -> MultiTPPositionManager:
+        return MultiTPPositionManager(
+            [
+                PositionLeg(size=0.5, tp_multiple=2.0),
+                PositionLeg(size=0.3, tp_multiple=6.0),
+                PositionLeg(size=0.2, tp_multiple=10.0),
+            ]
+        )
+
+
+def _run_batch(
+    config: BacktestConfig,
+    data: pd.DataFrame,
+    strategies: Sequence[BaseStrategy],
+    evaluate: Callable[[BacktestResult], Any] | None,
+    cache_size: int,
+) -> list[Any]:
+    backtester = VectorizedBacktester(config)
+    cache = IndicatorCache(maxsize=cache_size)
+    outputs = []
+    for strategy in strategies:
+        uses_cache = hasattr(strategy, "cache")
+        if uses_cache:
+            previous_cache = strategy.cache
+            strategy.cache = cache
+        try:
+            result = backtester.run(data, strategy)
+        finally:
+            if uses_cache:
+                strategy.cache = previous_cache
+        outputs.append(evaluate(result) if evaluate is not None else result)
+    return outputs
@@ -7,6 +7,8 @@ from typing import Any, Literal
 import numpy as np
 import pandas as pd
 
+from crypto_backtest.utils.jit import njit
+
 
 @dataclass(frozen=True)
 class PositionLeg:
@@ -34,18 +36,144 @@ class MultiTPPositionManager:
         enable_short: bool = True,
     ) -> pd.DataFrame:
         """Simulate multi-TP trade management and return trades."""
-        required = {"signal", "entry_price", "sl_price", "tp1_price", "tp2_price", "tp3_price"}
-        missing = required.difference(signals.columns)
-        if missing:
-            raise ValueError(f"Missing signal columns: {sorted(missing)}")
+        self._validate_inputs(signals, sizing_mode, intrabar_order, risk_per_trade)
         if signals.empty:
             return pd.DataFrame()
+        n = len(data)
+        if len(signals) < n:
+            raise ValueError("signals must cover every bar of data")
+
+        return self.simulate_arrays(
+            data["high"].to_numpy(dtype=float),
+            data["low"].to_numpy(dtype=float),
+            signals["signal"].to_numpy()[:n].astype(np.int64),
+            signals["entry_price"].to_numpy(dtype=float)[:n],
+            signals["sl_price"].to_numpy(dtype=float)[:n],
+            signals["tp1_price"].to_numpy(dtype=float)[:n],
+            signals["tp2_price"].to_numpy(dtype=float)[:n],
+            signals["tp3_price"].to_numpy(dtype=float)[:n],
+            data.index,
+            initial_capital,
+            sizing_mode=sizing_mode,
+            intrabar_order=intrabar_order,
+            fees_bps=fees_bps,
+            slippage_bps=slippage_bps,
+            risk_per_trade=risk_per_trade,
+            enable_long=enable_long,
+            enable_short=enable_short,
+        )
+
+    def simulate_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        signal: np.ndarray,
+        entry_price: np.ndarray,
+        sl_price: np.ndarray,
+        tp1_price: np.ndarray,
+        tp2_price: np.ndarray,
+        tp3_price: np.ndarray,
+        index: pd.Index,
+        initial_capital: float,
+        sizing_mode: Literal["fixed", "equity"] = "fixed",
+        intrabar_order: Literal["stop_first", "tp_first"] = "stop_first",
+        fees_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+        risk_per_trade: float = 0.005,
+        enable_long: bool = True,
+        enable_short: bool = True,
+    ) -> pd.DataFrame:
+        """Simulate on pre-extracted NumPy arrays and return the trades frame.
+
+        Produces exactly the same trades as ``simulate_reference``; ``index``
+        supplies the entry/exit timestamps.
+        """
         if sizing_mode not in {"fixed", "equity"}:
             raise ValueError("sizing_mode must be 'fixed' or 'equity'")
         if intrabar_order not in {"stop_first", "tp_first"}:
             raise ValueError("intrabar_order must be 'stop_first' or 'tp_first'")
         if risk_per_trade <= 0:
             raise ValueError("risk_per_trade must be > 0")
+        if len(self.legs) > 3:
+            raise ValueError("At most 3 legs are supported (tp1/tp2/tp3)")
+        if len(high) == 0 or not self.legs:
+            return pd.DataFrame()
+
+        (
+            entry_idx,
+            exit_idx,
+            direction,
+            leg_idx,
+            is_stop,
+            pos_entry,
+            exit_price,
+            notional,
+            quantity,
+            gross_pnl,
+            costs,
+            net_pnl,
+        ) = _simulate_kernel(
+            np.ascontiguousarray(high, dtype=np.float64),
+            np.ascontiguousarray(low, dtype=np.float64),
+            np.ascontiguousarray(signal, dtype=np.int64),
+            np.ascontiguousarray(entry_price, dtype=np.float64),
+            np.ascontiguousarray(sl_price, dtype=np.float64),
+            np.ascontiguousarray(tp1_price, dtype=np.float64),
+            np.ascontiguousarray(tp2_price, dtype=np.float64),
+            np.ascontiguousarray(tp3_price, dtype=np.float64),
+            np.array([leg.size for leg in self.legs], dtype=np.float64),
+            float(initial_capital),
+            sizing_mode == "equity",
+            intrabar_order == "stop_first",
+            (fees_bps + slippage_bps) / 10_000.0,
+            float(risk_per_trade),
+            bool(enable_long),
+            bool(enable_short),
+        )
+        if len(entry_idx) == 0:
+            return pd.DataFrame()
+
+        # Column dtypes follow the reference records: leg sizes/multiples keep
+        # their Python int/float inference and timestamps keep the index dtype.
+        sizes = np.array([leg.size for leg in self.legs])
+        tp_multiples = np.array([leg.tp_multiple for leg in self.legs])
+        reasons = np.array([f"tp{i + 1}" for i in range(len(self.legs))], dtype=object)
+        exit_reason = reasons[leg_idx]
+        exit_reason[is_stop] = "stop"
+        trades = {
+            "entry_time": index.take(entry_idx),
+            "exit_time": index.take(exit_idx),
+            "direction": direction,
+            "entry_price": pos_entry,
+            "exit_price": exit_price,
+            "size": sizes[leg_idx],
+            "notional": notional,
+            "quantity": quantity,
+            "gross_pnl": gross_pnl,
+            "costs": costs,
+            "net_pnl": net_pnl,
+            "exit_reason": exit_reason,
+            "tp_multiple": tp_multiples[leg_idx],
+        }
+        return pd.DataFrame(trades)
+
+    def simulate_reference(
+        self,
+        signals: pd.DataFrame,
+        data: pd.DataFrame,
+        initial_capital: float,
+        sizing_mode: Literal["fixed", "equity"] = "fixed",
+        intrabar_order: Literal["stop_first", "tp_first"] = "stop_first",
+        fees_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+        risk_per_trade: float = 0.005,
+        enable_long: bool = True,
+        enable_short: bool = True,
+    ) -> pd.DataFrame:
+        """Bar-by-bar pandas simulation kept as the parity oracle for ``simulate``."""
+        self._validate_inputs(signals, sizing_mode, intrabar_order, risk_per_trade)
+        if signals.empty:
+            return pd.DataFrame()
 
         trades: list[dict[str, Any]] = []
         position: dict[str, Any] | None = None
@@ -187,6 +315,26 @@ class MultiTPPositionManager:
 
         return pd.DataFrame(trades)
 
+    @staticmethod
+    def _validate_inputs(
+        signals: pd.DataFrame,
+        sizing_mode: str,
+        intrabar_order: str,
+        risk_per_trade: float,
+    ) -> None:
+        required = {"signal", "entry_price", "sl_price", "tp1_price", "tp2_price", "tp3_price"}
+        missing = required.difference(signals.columns)
+        if missing:
+            raise ValueError(f"Missing signal columns: {sorted(missing)}")
+        if signals.empty:
+            return
+        if sizing_mode not in {"fixed", "equity"}:
+            raise ValueError("sizing_mode must be 'fixed' or 'equity'")
+        if intrabar_order not in {"stop_first", "tp_first"}:
+            raise ValueError("intrabar_order must be 'stop_first' or 'tp_first'")
+        if risk_per_trade <= 0:
+            raise ValueError("risk_per_trade must be > 0")
+
     def _process_tp_hits(
         self,
         trades: list[dict[str, Any]],
@@ -262,3 +410,263 @@ class MultiTPPositionManager:
                     trades, position, leg, exit_time, exit_price, reason, cost_rate
                 )
         return pnl_total
+
+
+@njit(cache=True)
+def _open_notional(
+    idx,
+    signal,
+    entry_price,
+    sl_price,
+    tp1_price,
+    tp2_price,
+    tp3_price,
+    trade_capital,
+    risk_per_trade,
+    enable_long,
+    enable_short,
+):
+    """Return (opened, total_notional) for a candidate entry at ``idx``."""
+    signal_value = signal[idx]
+    if signal_value == 0:
+        return False, 0.0
+    if signal_value == 1 and not enable_long:
+        return False, 0.0
+    if signal_value == -1 and not enable_short:
+        return False, 0.0
+    entry = entry_price[idx]
+    sl = sl_price[idx]
+    if (
+        np.isnan(entry)
+        or np.isnan(sl)
+        or np.isnan(tp1_price[idx])
+        or np.isnan(tp2_price[idx])
+        or np.isnan(tp3_price[idx])
+    ):
+        return False, 0.0
+    if entry == 0:
+        return False, 0.0
+    stop_distance = abs(entry - sl) / entry
+    if stop_distance <= 0:
+        return False, 0.0
+    risk_amount = trade_capital * risk_per_trade
+    return True, risk_amount / stop_distance
+
+
+@njit(cache=True)
+def _simulate_kernel(
+    high,
+    low,
+    signal,
+    entry_price,
+    sl_price,
+    tp1_price,
+    tp2_price,
+    tp3_price,
+    leg_sizes,
+    initial_capital,
+    equity_sizing,
+    stop_first,
+    cost_rate,
+    risk_per_trade,
+    enable_long,
+    enable_short,
+):
+    """Array port of ``MultiTPPositionManager.simulate_reference``.
+
+    Arithmetic is performed in the same order as the reference loop so the
+    outputs match bit for bit. Returns one row per closed leg.
+    """
+    n = high.shape[0]
+    n_legs = leg_sizes.shape[0]
+    max_rows = n * n_legs
+
+    out_entry_idx = np.empty(max_rows, dtype=np.int64)
+    out_exit_idx = np.empty(max_rows, dtype=np.int64)
+    out_direction = np.empty(max_rows, dtype=np.int64)
+    out_leg = np.empty(max_rows, dtype=np.int64)
+    out_is_stop = np.empty(max_rows, dtype=np.bool_)
+    out_entry = np.empty(max_rows, dtype=np.float64)
+    out_exit = np.empty(max_rows, dtype=np.float64)
+    out_notional = np.empty(max_rows, dtype=np.float64)
+    out_quantity = np.empty(max_rows, dtype=np.float64)
+    out_gross = np.empty(max_rows, dtype=np.float64)
+    out_costs = np.empty(max_rows, dtype=np.float64)
+    out_net = np.empty(max_rows, dtype=np.float64)
+
+    leg_tp = np.empty(3, dtype=np.float64)
+    leg_quantity = np.empty(n_legs, dtype=np.float64)
+    leg_notional = np.empty(n_legs, dtype=np.float64)
+    leg_active = np.zeros(n_legs, dtype=np.bool_)
+
+    rows = 0
+    equity = initial_capital
+    in_position = False
+    direction = 0
+    pos_entry = 0.0
+    pos_entry_idx = 0
+    stop = 0.0
+    pos_tp1 = 0.0
+    realized = 0.0
+
+    for idx in range(n):
+        if in_position:
+            bar_high = high[idx]
+            bar_low = low[idx]
+            closed = False
+
+            if direction == 1:
+                stop_hit = bar_low <= stop
+                extreme = bar_high
+            else:
+                stop_hit = bar_high >= stop
+                extreme = bar_low
+
+            if stop_first and stop_hit:
+                check_tp = False
+                close_all = True
+            elif stop_first:
+                check_tp = True
+                close_all = False
+            else:
+                if direction == 1:
+                    nearest = np.inf
+                    for j in range(n_legs):
+                        if leg_active[j] and leg_tp[j] < nearest:
+                            nearest = leg_tp[j]
+                    check_tp = bar_high >= nearest
+                else:
+                    nearest = -np.inf
+                    for j in range(n_legs):
+                        if leg_active[j] and leg_tp[j] > nearest:
+                            nearest = leg_tp[j]
+                    check_tp = bar_low <= nearest
+                close_all = False
+
+            if check_tp:
+                for j in range(n_legs):
+                    if not leg_active[j]:
+                        continue
+                    if (direction == 1 and extreme >= leg_tp[j]) or (
+                        direction == -1 and extreme <= leg_tp[j]
+                    ):
+                        exit_px = leg_tp[j]
+                        pnl = (exit_px - pos_entry) * direction * leg_quantity[j]
+                        costs = leg_notional[j] * cost_rate * 2.0
+                        net = pnl - costs
+                        out_entry_idx[rows] = pos_entry_idx
+                        out_exit_idx[rows] = idx
+                        out_direction[rows] = direction
+                        out_leg[rows] = j
+                        out_is_stop[rows] = False
+                        out_entry[rows] = pos_entry
+                        out_exit[rows] = exit_px
+                        out_notional[rows] = leg_notional[j]
+                        out_quantity[rows] = leg_quantity[j]
+                        out_gross[rows] = pnl
+                        out_costs[rows] = costs
+                        out_net[rows] = net
+                        rows += 1
+                        leg_active[j] = False
+                        realized += net
+                        if j == 0:
+                            stop = pos_entry
+                        elif j == 1:
+                            stop = pos_tp1
+
+            if not stop_first:
+                if direction == 1:
+                    stop_hit = bar_low <= stop
+                else:
+                    stop_hit = bar_high >= stop
+                if stop_hit:
+                    for j in range(n_legs):
+                        if leg_active[j]:
+                            close_all = True
+                            break
+
+            if close_all:
+                pnl_total = 0.0
+                for j in range(n_legs):
+                    if not leg_active[j]:
+                        continue
+                    pnl = (stop - pos_entry) * direction * leg_quantity[j]
+                    costs = leg_notional[j] * cost_rate * 2.0
+                    net = pnl - costs
+                    out_entry_idx[rows] = pos_entry_idx
+                    out_exit_idx[rows] = idx
+                    out_direction[rows] = direction
+                    out_leg[rows] = j
+                    out_is_stop[rows] = True
+                    out_entry[rows] = pos_entry
+                    out_exit[rows] = stop
+                    out_notional[rows] = leg_notional[j]
+                    out_quantity[rows] = leg_quantity[j]
+                    out_gross[rows] = pnl
+                    out_costs[rows] = costs
+                    out_net[rows] = net
+                    rows += 1
+                    leg_active[j] = False
+                    pnl_total += net
+                realized += pnl_total
+                closed = True
+            else:
+                closed = True
+                for j in range(n_legs):
+                    if leg_active[j]:
+                        closed = False
+                        break
+
+            if not closed:
+                continue
+            if equity_sizing:
+                equity += realized
+            in_position = False
+
+        trade_capital = equity if equity_sizing else initial_capital
+        opened, total_notional = _open_notional(
+            idx,
+            signal,
+            entry_price,
+            sl_price,
+            tp1_price,
+            tp2_price,
+            tp3_price,
+            trade_capital,
+            risk_per_trade,
+            enable_long,
+            enable_short,
+        )
+        if not opened:
+            continue
+
+        entry = entry_price[idx]
+        in_position = True
+        direction = signal[idx]
+        pos_entry = entry
+        pos_entry_idx = idx
+        stop = sl_price[idx]
+        pos_tp1 = tp1_price[idx]
+        realized = 0.0
+        leg_tp[0] = tp1_price[idx]
+        leg_tp[1] = tp2_price[idx]
+        leg_tp[2] = tp3_price[idx]
+        for j in range(n_legs):
+            leg_notional[j] = total_notional * leg_sizes[j]
+            leg_quantity[j] = leg_notional[j] / entry
+            leg_active[j] = True
+
+    return (
+        out_entry_idx[:rows],
+        out_exit_idx[:rows],
+        out_direction[:rows],
+        out_leg[:rows],
+        out_is_stop[:rows],
+        out_entry[:rows],
+        out_exit[:rows],
+        out_notional[:rows],
+        out_quantity[:rows],
+        out_gross[:rows],
+        out_costs[:rows],
+        out_net[:rows],
+    )
@@ -0,0 +1,206 @@
+"""Content-addressed on-disk cache of backtest results."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.engine.backtest import ENGINE_VERSION, BacktestConfig, BacktestResult
+from crypto_backtest.strategies.base import BaseStrategy
+
+# Directory of the cache used by ``VectorizedBacktester.run`` when no cache
+# is passed explicitly; inherited by worker processes.
+RESULT_CACHE_ENV = "CRYPTO_BACKTEST_RESULT_CACHE"
+DEFAULT_MAX_BYTES = 2 * 2**30
+SUFFIX = ".pkl"
+
+
+class BacktestResultCache:
+    """``BacktestResult`` files keyed by a hash of data, strategy, config and engine.
+
+    Entries live in ``<root_dir>/<key[:2]>/<key>.pkl``. Writes go to a
+    temporary file in the same directory and are renamed into place, so
+    concurrent processes only ever see complete entries (the last writer of
+    a key wins, with identical content). A hit refreshes the entry's mtime;
+    after each write the least recently used entries are deleted until the
+    cache fits ``max_bytes``. ``hits``/``misses`` count lookups in this
+    process.
+    """
+
+    def __init__(self, root_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self.root_dir = Path(root_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Running estimate of the directory size; rescanned before evicting.
+        self._approx_bytes: int | None = None
+
+    def key(
+        self, data: pd.DataFrame, strategy: BaseStrategy, config: BacktestConfig
+    ) -> str | None:
+        return result_cache_key(data, strategy, config)
+
+    def get(self, key: str) -> BacktestResult | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                result = pickle.load(handle)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            # Unreadable entry (e.g. written by an incompatible version).
+            _unlink(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: BacktestResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            _unlink(Path(tmp_name))
+            raise
+        if self._approx_bytes is None:
+            self._approx_bytes = self.size_bytes
+        else:
+            self._approx_bytes += size
+        if self._approx_bytes > self.max_bytes:
+            self._evict()
+
+    def get_or_run(
+        self,
+        data: pd.DataFrame,
+        strategy: BaseStrategy,
+        config: BacktestConfig,
+        run: Callable[[], BacktestResult],
+    ) -> BacktestResult:
+        """Return the cached result for this backtest, or ``run()`` and store it."""
+        key = self.key(data, strategy, config)
+        if key is None:
+            return run()
+        result = self.get(key)
+        if result is None:
+            result = run()
+            self.put(key, result)
+        return result
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            _unlink(path)
+        self._approx_bytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root_dir / key[:2] / f"{key}{SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, int, int]]:
+        entries = []
+        for path in self.root_dir.glob(f"*/*{SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Evicted by another process.
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            if _unlink(path):
+                self.evictions += 1
+            total -= size
+        self._approx_bytes = total
+
+
+def result_cache_key(
+    data: pd.DataFrame, strategy: BaseStrategy, config: BacktestConfig
+) -> str | None:
+    """Hex digest identifying a backtest, or None when it cannot be cached.
+
+    Covers the data (index, columns and values), the strategy class with its
+    params dataclass (or dict) and the ``BacktestConfig``, plus
+    ``ENGINE_VERSION``. Strategies without ``params`` and runs that write
+    debug output are not cached.
+    """
+    params = getattr(strategy, "params", None)
+    if dataclasses.is_dataclass(params) and not isinstance(params, type):
+        params = dataclasses.asdict(params)
+    if not isinstance(params, dict) or params.get("debug_signals"):
+        return None
+
+    spec = {
+        "engine": ENGINE_VERSION,
+        "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+        "params": params,
+        "config": dataclasses.asdict(config),
+        "columns": [str(column) for column in data.columns],
+    }
+    try:
+        encoded = json.dumps(spec, sort_keys=True, default=_json_default).encode()
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(encoded, digest_size=20)
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+_DEFAULT_CACHES: dict[str, BacktestResultCache] = {}
+
+
+def default_result_cache() -> BacktestResultCache | None:
+    """Cache at ``$CRYPTO_BACKTEST_RESULT_CACHE``, or None when it is unset."""
+    root_dir = os.environ.get(RESULT_CACHE_ENV)
+    if not root_dir:
+        return None
+    cache = _DEFAULT_CACHES.get(root_dir)
+    if cache is None:
+        cache = _DEFAULT_CACHES[root_dir] = BacktestResultCache(root_dir)
+    return cache
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot hash {type(value).__name__} in backtest params")
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
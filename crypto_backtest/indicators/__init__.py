@@ -1,6 +1,8 @@
 """Indicators module."""
 
 from crypto_backtest.indicators.atr import compute_atr
+from crypto_backtest.indicators.cache import IndicatorCache
+from crypto_backtest.indicators.rolling import rolling_slope
 from crypto_backtest.indicators.adx_filter import compute_adx, adx_filter, adx_directional_filter
 from crypto_backtest.indicators.regime_filter import (
     filter_recovery_regime,
@@ -12,6 +14,8 @@ from crypto_backtest.indicators.regime_filter import (
 
 __all__ = [
     "compute_atr",
+    "IndicatorCache",
+    "rolling_slope",
     "compute_adx",
     "adx_filter",
     "adx_directional_filter",
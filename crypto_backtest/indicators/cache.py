@@ -0,0 +1,71 @@
+"""Per-dataset indicator cache with bounded LRU eviction."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import pandas as pd
+
+
+class IndicatorCache:
+    """Memoize indicator outputs for a single dataset.
+
+    Entries are keyed on the exact parameters that affect each indicator,
+    e.g. ``("ichimoku", tenkan, kijun, displacement)``. The cache is bound to
+    one DataFrame object: passing a different frame clears it, so results can
+    never leak across datasets. Cached values are shared between callers and
+    must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: pd.DataFrame | None = None
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(
+        self,
+        data: pd.DataFrame,
+        key: Hashable,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return the cached value for ``key`` or compute and store it."""
+        if data is not self._data:
+            self.clear()
+            self._data = data
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and unbind the dataset."""
+        self._entries.clear()
+        self._data = None
+
+
+def cached(
+    cache: IndicatorCache | None,
+    data: pd.DataFrame,
+    key: Hashable,
+    compute: Callable[[], Any],
+) -> Any:
+    """Look ``key`` up in ``cache`` when one is provided, else just compute."""
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(data, key, compute)
@@ -6,7 +6,11 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from crypto_backtest.utils.jit import njit
+
+from .cache import IndicatorCache, cached
 from .ichimoku import donchian
+from .rolling import rolling_slope
 
 
 @dataclass(frozen=True)
@@ -31,8 +35,9 @@ class FiveInOneConfig:
 
 
 class FiveInOneFilter:
-    def __init__(self, config: FiveInOneConfig) -> None:
+    def __init__(self, config: FiveInOneConfig, cache: IndicatorCache | None = None) -> None:
         self.config = config
+        self.cache = cache
 
     def distance_filter(self, ohlc4: pd.Series) -> pd.Series:
         """Distance filter using multiple KAMA periods."""
@@ -240,8 +245,14 @@ class FiveInOneFilter:
         always_true = pd.Series(True, index=index)
 
         if self.config.use_distance_filter:
-            ohlc4 = (data["open"] + data["high"] + data["low"] + data["close"]) / 4.0
-            total_distance = self.distance_filter(ohlc4)
+            total_distance = cached(
+                self.cache,
+                data,
+                ("5in1_distance",),
+                lambda: self.distance_filter(
+                    (data["open"] + data["high"] + data["low"] + data["close"]) / 4.0
+                ),
+            )
             distance_bull = total_distance > 0
             distance_bear = total_distance < 0
         else:
@@ -250,11 +261,21 @@ class FiveInOneFilter:
 
         if self.config.use_volume_filter:
             if self.config.use_ad_line:
-                vol_signal = self.ad_line_filter(
-                    data["high"], data["low"], data["close"], data["volume"]
+                vol_signal = cached(
+                    self.cache,
+                    data,
+                    ("5in1_ad_line", self.config.ad_norm_period),
+                    lambda: self.ad_line_filter(
+                        data["high"], data["low"], data["close"], data["volume"]
+                    ),
                 )
             else:
-                vol_signal = self.obv_filter(data["close"], data["volume"])
+                vol_signal = cached(
+                    self.cache,
+                    data,
+                    ("5in1_obv",),
+                    lambda: self.obv_filter(data["close"], data["volume"]),
+                )
             volume_bull = vol_signal > 0
             volume_bear = vol_signal < 0
         else:
@@ -262,7 +283,12 @@ class FiveInOneFilter:
             volume_bear = always_true
 
         if self.config.use_regression_cloud:
-            reg_signal = self.regression_cloud_filter(data["close"])
+            reg_signal = cached(
+                self.cache,
+                data,
+                ("5in1_regression",),
+                lambda: self.regression_cloud_filter(data["close"]),
+            )
             reg_bull = reg_signal > 0
             reg_bear = reg_signal < 0
         else:
@@ -270,7 +296,19 @@ class FiveInOneFilter:
             reg_bear = always_true
 
         if self.config.use_kama_oscillator:
-            kama_signal = self.kama_oscillator(data["close"])
+            kama_signal = cached(
+                self.cache,
+                data,
+                (
+                    "5in1_kama_osc",
+                    self.config.er_period,
+                    self.config.fast_period,
+                    self.config.slow_period,
+                    self.config.norm_period,
+                    self.config.use_norm,
+                ),
+                lambda: self.kama_oscillator(data["close"]),
+            )
             kama_bull = kama_signal > 0
             kama_bear = kama_signal < 0
         else:
@@ -278,7 +316,18 @@ class FiveInOneFilter:
             kama_bear = always_true
 
         if self.config.use_ichimoku_filter:
-            ichi_signal = self.ichimoku_5_filter(data, self.config.ichi5in1_strict)
+            ichi_signal = cached(
+                self.cache,
+                data,
+                (
+                    "5in1_ichimoku",
+                    self.config.tenkan_5,
+                    self.config.kijun_5,
+                    self.config.displacement_5,
+                    self.config.ichi5in1_strict,
+                ),
+                lambda: self.ichimoku_5_filter(data, self.config.ichi5in1_strict),
+            )
             ichi_bull = ichi_signal > 0
             ichi_bear = ichi_signal < 0
         else:
@@ -326,11 +375,7 @@ class FiveInOneFilter:
         slow_end = 0.0645
         smooth = (er * (fast_end - slow_end) + slow_end) ** 2
 
-        kama = np.zeros(n, dtype=float)
-        kama[0] = price[0]
-        for i in range(1, n):
-            kama[i] = kama[i - 1] + smooth[i] * (price[i] - kama[i - 1])
-        return pd.Series(kama, index=src.index)
+        return pd.Series(_kama_distance_kernel(price, smooth), index=src.index)
 
     @staticmethod
     def _safe_div(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
@@ -339,18 +384,13 @@ class FiveInOneFilter:
 
     @staticmethod
     def _rolling_slope(series: pd.Series, length: int) -> pd.Series:
-        if length < 2:
-            return pd.Series(0.0, index=series.index)
-        x = np.arange(1, length + 1, dtype=float)
-        sum_x = x.sum()
-        sum_x2 = (x**2).sum()
-        denom = length * sum_x2 - sum_x**2
-        if denom == 0:
-            return pd.Series(0.0, index=series.index)
-
-        def slope(values: np.ndarray) -> float:
-            sum_y = values.sum()
-            sum_xy = (values * x).sum()
-            return (length * sum_xy - sum_x * sum_y) / denom
-
-        return series.rolling(length).apply(slope, raw=True)
+        return rolling_slope(series, length)
+
+
+@njit(cache=True)
+def _kama_distance_kernel(price: np.ndarray, smooth: np.ndarray) -> np.ndarray:
+    kama = np.zeros(len(price), dtype=np.float64)
+    kama[0] = price[0]
+    for i in range(1, len(price)):
+        kama[i] = kama[i - 1] + smooth[i] * (price[i] - kama[i - 1])
+    return kama
@@ -1,10 +1,17 @@
-"""MAMA/FAMA/KAMA indicator implementations."""
+"""MAMA/FAMA/KAMA indicator implementations.
+
+The recursive filters run in ``_*_kernel`` functions compiled with Numba when
+it is installed (see ``crypto_backtest.utils.jit``) and as plain Python loops
+otherwise.
+"""
 
 from __future__ import annotations
 
 import numpy as np
 import pandas as pd
 
+from crypto_backtest.utils.jit import njit
+
 
 def hilbert_transform(x: np.ndarray) -> np.ndarray:
     """Hilbert Transform approximation used by MESA."""
@@ -21,7 +28,12 @@ def hilbert_transform(x: np.ndarray) -> np.ndarray:
 
 def compute_mesa_period(src: pd.Series) -> pd.Series:
     """Compute adaptive MESA period."""
-    price = src.to_numpy(dtype=float)
+    period = _mesa_period_kernel(src.to_numpy(dtype=float))
+    return pd.Series(period, index=src.index, name="mesa_period")
+
+
+@njit(cache=True)
+def _mesa_period_kernel(price: np.ndarray) -> np.ndarray:
     n = len(price)
     smooth = np.zeros(n, dtype=float)
     detrender = np.zeros(n, dtype=float)
@@ -90,7 +102,7 @@ def compute_mesa_period(src: pd.Series) -> pd.Series:
         period_raw = min(max(period_raw, 6.0), 50.0)
         period[i] = 0.2 * period_raw + 0.8 * period[i - 1]
 
-    return pd.Series(period, index=src.index, name="mesa_period")
+    return period
 
 
 def _efficiency_ratio(src: pd.Series, length: int) -> np.ndarray:
@@ -132,6 +144,14 @@ def compute_alpha(
     fast_arr = _as_array(fast_limit, n)
     slow_arr = _as_array(slow_limit, n)
 
+    alpha = _alpha_kernel(price, fast_arr, slow_arr)
+    beta = alpha / 2.0
+    return pd.Series(alpha, index=src.index), pd.Series(beta, index=src.index)
+
+
+@njit(cache=True)
+def _alpha_kernel(price: np.ndarray, fast_arr: np.ndarray, slow_arr: np.ndarray) -> np.ndarray:
+    n = len(price)
     smooth = np.zeros(n, dtype=float)
     detrender = np.zeros(n, dtype=float)
     i1 = np.zeros(n, dtype=float)
@@ -218,8 +238,7 @@ def compute_alpha(
 
         alpha[i] = alpha_val
 
-    beta = alpha / 2.0
-    return pd.Series(alpha, index=src.index), pd.Series(beta, index=src.index)
+    return alpha
 
 
 def compute_mama_fama(
@@ -231,8 +250,6 @@ def compute_mama_fama(
     """Compute MAMA/FAMA series."""
     price = src.to_numpy(dtype=float)
     n = len(price)
-    mama = np.zeros(n, dtype=float)
-    fama = np.zeros(n, dtype=float)
 
     if n == 0:
         return pd.DataFrame(index=src.index, columns=["mama", "fama"], dtype=float)
@@ -245,14 +262,7 @@ def compute_mama_fama(
     alpha_arr = alpha.to_numpy(dtype=float)
     beta_arr = beta.to_numpy(dtype=float)
 
-    mama[0] = price[0]
-    fama[0] = price[0]
-
-    for i in range(1, n):
-        a = alpha_arr[i]
-        b = beta_arr[i]
-        mama[i] = a * price[i] + (1 - a) * mama[i - 1]
-        fama[i] = b * mama[i] + (1 - b) * fama[i - 1]
+    mama, fama = _mama_fama_kernel(price, alpha_arr, beta_arr)
 
     return pd.DataFrame({"mama": mama, "fama": fama}, index=src.index)
 
@@ -273,9 +283,34 @@ def compute_kama(src: pd.Series, length: int) -> pd.Series:
     beta_arr = beta.to_numpy(dtype=float)
     alpha_k = (er * (beta_arr - alpha_arr) + alpha_arr) ** 2
 
-    kama = np.zeros(n, dtype=float)
-    kama[0] = price[0]
+    kama = _kama_kernel(price, alpha_k)
+    return pd.Series(kama, index=src.index, name="kama")
+
+
+@njit(cache=True)
+def _mama_fama_kernel(
+    price: np.ndarray,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    n = len(price)
+    mama = np.zeros(n, dtype=np.float64)
+    fama = np.zeros(n, dtype=np.float64)
+    mama[0] = price[0]
+    fama[0] = price[0]
+
     for i in range(1, n):
-        kama[i] = alpha_k[i] * price[i] + (1 - alpha_k[i]) * kama[i - 1]
+        a = alpha[i]
+        b = beta[i]
+        mama[i] = a * price[i] + (1 - a) * mama[i - 1]
+        fama[i] = b * mama[i] + (1 - b) * fama[i - 1]
+    return mama, fama
 
-    return pd.Series(kama, index=src.index, name="kama")
+
+@njit(cache=True)
+def _kama_kernel(price: np.ndarray, alpha_k: np.ndarray) -> np.ndarray:
+    kama = np.zeros(len(price), dtype=np.float64)
+    kama[0] = price[0]
+    for i in range(1, len(price)):
+        kama[i] = alpha_k[i] * price[i] + (1 - alpha_k[i]) * kama[i - 1]
+    return kama
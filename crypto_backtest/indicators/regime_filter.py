@@ -180,21 +180,18 @@ def get_regime_performance(
     
     regimes = classify_regimes_v2(data)
     
-    # Map entry times to regimes
+    # Map entry times to regimes (unknown entry times match no regime)
+    if "entry_time" in trades.columns:
+        entry_regimes = regimes.reindex(trades["entry_time"]).to_numpy()
+    else:
+        entry_regimes = np.full(len(trades), None, dtype=object)
+
     results = []
     for regime in REGIMES_V2:
-        # Find trades that entered during this regime
-        regime_mask = regimes == regime
-        
-        # Match trades to regimes by entry_time
-        regime_trades = []
-        for _, trade in trades.iterrows():
-            entry_time = trade.get("entry_time")
-            if entry_time is not None and entry_time in regimes.index:
-                if regimes.loc[entry_time] == regime:
-                    regime_trades.append(trade)
+        # Trades that entered during this regime
+        regime_df = trades[entry_regimes == regime]
         
-        if not regime_trades:
+        if regime_df.empty:
             results.append({
                 "regime": regime,
                 "n_trades": 0,
@@ -205,7 +202,6 @@ def get_regime_performance(
             })
             continue
         
-        regime_df = pd.DataFrame(regime_trades)
         total_pnl = regime_df["pnl"].sum() if "pnl" in regime_df.columns else 0
         n_trades = len(regime_df)
         wins = (regime_df["pnl"] > 0).sum() if "pnl" in regime_df.columns else 0
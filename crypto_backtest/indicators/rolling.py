@@ -0,0 +1,98 @@
+"""Rolling-window indicator primitives."""
+
+from __future__ import annotations
+
+import bisect
+import warnings
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_slope(series: pd.Series, length: int) -> pd.Series:
+    """Least-squares slope of each ``length``-bar window against x = 1..length.
+
+    O(n) equivalent of ``series.rolling(length).apply(slope)``. The slope is
+    ``sum((x - x_mean) * y) / sum((x - x_mean) ** 2)``, where the numerator
+    comes from cumulative sums of ``y`` and ``position * y``. Sums are taken
+    over overlapping blocks of a few windows, with ``y`` and the positions
+    recentered inside each block, so the accumulated values stay small and
+    no precision is lost on long histories. Windows containing NaN, or
+    shorter than ``length``, are NaN; ``length < 2`` yields zeros.
+    """
+    if length < 2:
+        return pd.Series(0.0, index=series.index)
+
+    values = series.to_numpy(dtype=float)
+    n = len(values)
+    slope = np.full(n, np.nan)
+    if n < length:
+        return pd.Series(slope, index=series.index, name=series.name)
+
+    # Each block yields ``block`` consecutive windows from block + length - 1 bars.
+    block = 4 * length
+    n_windows = n - length + 1
+    n_blocks = -(-n_windows // block)
+    span = block + length - 1
+    padded = np.full(n_blocks * block + length - 1, np.nan)
+    padded[:n] = values
+    segments = sliding_window_view(padded, span)[::block]
+
+    missing = np.isnan(segments)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        reference = np.nanmean(segments, axis=1, keepdims=True)
+    y = np.where(missing, 0.0, segments - np.nan_to_num(reference))
+    position = np.arange(span, dtype=float) - (span - 1) / 2.0
+
+    def window_sums(x: np.ndarray) -> np.ndarray:
+        cumulative = np.concatenate([np.zeros((n_blocks, 1)), np.cumsum(x, axis=1)], axis=1)
+        return cumulative[:, length:] - cumulative[:, :-length]
+
+    sum_y = window_sums(y)
+    sum_py = window_sums(position * y)
+    n_missing = window_sums(missing.astype(float))
+
+    # Centre of the window ending at each position, in block coordinates.
+    window_center = position[length - 1:] - (length - 1) / 2.0
+    numerator = sum_py - window_center * sum_y
+    numerator[n_missing > 0] = np.nan
+    sum_xc2 = length * (length * length - 1) / 12.0
+    slope[length - 1:] = (numerator / sum_xc2).reshape(-1)[:n_windows]
+    return pd.Series(slope, index=series.index, name=series.name)
+
+
+def rolling_percentile_rank(series: pd.Series, length: int) -> pd.Series:
+    """Percentile rank (0-1) of each value within its trailing ``length`` window.
+
+    Streaming equivalent of ``series.rolling(length).apply(lambda x:
+    stats.percentileofscore(x, x.iloc[-1]) / 100)`` (``kind="rank"``): a
+    sorted copy of the window is kept with bisect insert/remove, so each bar
+    costs two binary searches. Windows shorter than ``length`` or holding a
+    NaN are NaN, as with the rolling default ``min_periods``.
+    """
+    if length < 1:
+        raise ValueError("length must be >= 1")
+    values = series.to_numpy(dtype=float)
+    ranks = np.full(len(values), np.nan)
+    window: list[float] = []
+    n_missing = 0
+    scale = 50.0 / length
+
+    for i, value in enumerate(values.tolist()):
+        if value != value:
+            n_missing += 1
+        else:
+            bisect.insort(window, value)
+        if i >= length:
+            old = values[i - length]
+            if old != old:
+                n_missing -= 1
+            else:
+                del window[bisect.bisect_left(window, old)]
+        if i >= length - 1 and n_missing == 0:
+            left = bisect.bisect_left(window, value)
+            right = bisect.bisect_right(window, value)
+            ranks[i] = (left + right + 1) * scale / 100
+    return pd.Series(ranks, index=series.index, name=series.name)
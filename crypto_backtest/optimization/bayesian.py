@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, is_dataclass, replace
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 
 MIN_TP_GAP = 0.5
 
-from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.analysis.metrics import (
+    CORE_METRICS,
+    _periods_per_year,
+    _trade_pnl,
+    compute_core_metrics,
+    compute_metrics,
+)
 from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
 
 
@@ -17,13 +23,26 @@ from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
 class OptimizationResult:
     best_params: dict[str, float]
     best_score: float
+    # Params of completed trials, best first (used to warm-start later studies).
+    ranked_params: tuple[dict[str, Any], ...] = ()
 
 
 class BayesianOptimizer:
     """Optuna-based TPE optimizer."""
 
-    def optimize(self, data, strategy_class, param_space, n_trials: int = 100) -> OptimizationResult:
-        """Run optimization and return the best parameters."""
+    def optimize(
+        self,
+        data,
+        strategy_class,
+        param_space,
+        n_trials: int = 100,
+        warm_start: Sequence[dict[str, Any]] = (),
+    ) -> OptimizationResult:
+        """Run optimization and return the best parameters.
+
+        ``warm_start`` params are enqueued as the study's first trials.
+        ``param_space["seed"]`` seeds the TPE sampler for reproducible runs.
+        """
         import optuna
 
         search_space = param_space.get("search_space")
@@ -37,6 +56,7 @@ class BayesianOptimizer:
         objective_name = param_space.get("objective", "sharpe_ratio")
         direction = param_space.get("direction", "maximize")
         backtest_config = param_space.get("backtest_config") or BacktestConfig()
+        periods_per_year = _periods_per_year(data.index)
 
         def objective(trial: optuna.Trial) -> float:
             overrides = _suggest_params(trial, search_space)
@@ -44,18 +64,38 @@ class BayesianOptimizer:
             strategy = _instantiate_strategy(strategy_class, params)
             backtester = VectorizedBacktester(backtest_config)
             result = backtester.run(data, strategy)
-            metrics = compute_metrics(result.equity_curve, result.trades)
+            if objective_name in CORE_METRICS:
+                metrics = compute_core_metrics(
+                    result.equity_curve.to_numpy(),
+                    _trade_pnl(result.trades).to_numpy(),
+                    periods_per_year,
+                )
+            else:
+                metrics = compute_metrics(result.equity_curve, result.trades)
             score = metrics.get(objective_name, float("-inf"))
             if score is None or np.isnan(score):
                 return float("-inf")
             return float(score)
 
         storage = optuna.storages.InMemoryStorage()
-        study = optuna.create_study(direction=direction, storage=storage)
+        seed = param_space.get("seed")
+        sampler = optuna.samplers.TPESampler(seed=seed) if seed is not None else None
+        study = optuna.create_study(direction=direction, storage=storage, sampler=sampler)
+        for params in warm_start:
+            study.enqueue_trial(params, skip_if_exists=True)
         study.optimize(objective, n_trials=n_trials)
 
-        best_params = study.best_params
-        return OptimizationResult(best_params=best_params, best_score=float(study.best_value))
+        completed = [
+            trial
+            for trial in study.trials
+            if trial.state == optuna.trial.TrialState.COMPLETE
+        ]
+        completed.sort(key=lambda trial: trial.value, reverse=direction == "maximize")
+        return OptimizationResult(
+            best_params=study.best_params,
+            best_score=float(study.best_value),
+            ranked_params=tuple(trial.params for trial in completed),
+        )
 
 
 def _instantiate_strategy(strategy_class, params: Any):
@@ -23,7 +23,11 @@ try:
 except ImportError:
     fcntl = None
 
-from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.analysis.metrics import (
+    _periods_per_year,
+    _trade_pnl,
+    compute_core_metrics,
+)
 from crypto_backtest.config.scan_assets import (
     OPTIM_CONFIG,
     ATR_SEARCH_SPACE,
@@ -34,8 +38,14 @@ from crypto_backtest.config.scan_assets import (
     get_atr_search_space_for_asset,
     get_volatility_profile,
 )
+from crypto_backtest.data.columnar import SUFFIX as OHLCV_SUFFIX, OHLCVFile
+from crypto_backtest.data.ohlcv_cache import load_ohlcv
+from crypto_backtest.data.returns_store import ReturnsMatrixStore
 from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.engine.result_cache import RESULT_CACHE_ENV
+from crypto_backtest.indicators.cache import IndicatorCache
 from crypto_backtest.strategies.final_trigger import FinalTriggerStrategy
+from crypto_backtest.validation.monte_carlo import bootstrap_return_metrics
 from crypto_backtest.optimization.bayesian import _instantiate_strategy, _apply_overrides
 from crypto_backtest.validation.conservative_reopt import (
     CONSERVATIVE_ATR_SPACE,
@@ -212,41 +222,56 @@ def append_partial_result(
         pd.DataFrame([row]).to_csv(handle, header=header_needed, index=False)
 
 
-def load_data(asset: str, data_dir: str = "data") -> pd.DataFrame:
-    """Load OHLCV data for an asset.
+def load_data(
+    asset: str,
+    data_dir: str = "data",
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    """Load OHLCV data for an asset, optionally only bars in ``[start, end]``.
     
     Ensures the returned DataFrame has a UTC-aware DatetimeIndex to avoid
-    timezone mismatch errors with trade timestamps.
+    timezone mismatch errors with trade timestamps. Parsed files are cached
+    per process (see ``crypto_backtest.data.ohlcv_cache``), so repeated calls
+    only stat the file; the returned frame's arrays are read-only. A native
+    ``.ohlcv`` file serves a ``start``/``end`` window by reading only its rows.
     """
-    # Try parquet first, then CSV
-    parquet_path = Path(data_dir) / f"{asset}_1H.parquet"
-    csv_path = Path(data_dir) / f"Binance_{asset}USDT_1h.csv"
-
-    if parquet_path.exists():
-        df = pd.read_parquet(parquet_path)
-        if not isinstance(df.index, pd.DatetimeIndex):
-            if "timestamp" in df.columns:
-                df.index = pd.to_datetime(df["timestamp"], utc=True)
-            else:
-                df.index = pd.to_datetime(df.index, utc=True)
-        # Ensure UTC timezone (fix for guards timezone mismatch)
-        if df.index.tz is None:
-            df.index = df.index.tz_localize("UTC")
-        elif str(df.index.tz) != "UTC":
-            df.index = df.index.tz_convert("UTC")
-        return df
-
-    if csv_path.exists():
-        df = pd.read_csv(csv_path)
-        df.columns = [col.strip() for col in df.columns]
-        if "timestamp" in df.columns:
-            df.index = pd.to_datetime(df["timestamp"], utc=True)
-        # Ensure UTC timezone
-        if df.index.tz is None:
-            df.index = df.index.tz_localize("UTC")
-        return df[["open", "high", "low", "close", "volume"]]
-
-    raise FileNotFoundError(f"No data found for {asset} in {data_dir}")
+    path = data_path(asset, data_dir)
+    if start is None and end is None:
+        return load_ohlcv(path)
+    if path.suffix == OHLCV_SUFFIX:
+        return OHLCVFile(path).read(start, end)
+    start = _utc(start) if start is not None else None
+    end = _utc(end) if end is not None else None
+    return load_ohlcv(path).loc[start:end]
+
+
+def data_path(asset: str, data_dir: str = "data") -> Path:
+    """OHLCV file used by ``load_data``: the most recently written of the asset's files.
+
+    Candidates are the native ``.ohlcv`` file, parquet and the Binance CSV;
+    on equal mtimes the earlier one in that order wins. A parquet/CSV refresh
+    is therefore read until ``convert_ohlcv.py`` rewrites the native file.
+    """
+    candidates = (
+        Path(data_dir) / f"{asset}_1H{OHLCV_SUFFIX}",
+        Path(data_dir) / f"{asset}_1H.parquet",
+        Path(data_dir) / f"Binance_{asset}USDT_1h.csv",
+    )
+    found = []
+    for priority, path in enumerate(candidates):
+        try:
+            found.append((path.stat().st_mtime_ns, -priority, path))
+        except FileNotFoundError:
+            continue
+    if not found:
+        raise FileNotFoundError(f"No data found for {asset} in {data_dir}")
+    return max(found)[2]
+
+
+def _utc(value: str | pd.Timestamp) -> pd.Timestamp:
+    stamp = pd.Timestamp(value)
+    return stamp.tz_localize("UTC") if stamp.tzinfo is None else stamp.tz_convert("UTC")
 
 
 def split_data(df: pd.DataFrame, splits=(0.6, 0.2, 0.2)):
@@ -265,10 +290,14 @@ def split_data(df: pd.DataFrame, splits=(0.6, 0.2, 0.2)):
             # Optimize on train_idx, validate on test_idx
             pass
     """
-    n = len(df)
+    return tuple(df.iloc[start:stop] for start, stop in split_bounds(len(df), splits))
+
+
+def split_bounds(n: int, splits=(0.6, 0.2, 0.2)) -> list[tuple[int, int]]:
+    """Row ranges ``[start, stop)`` of the IS/VAL/OOS segments used by ``split_data``."""
     is_end = int(n * splits[0])
     val_end = int(n * (splits[0] + splits[1]))
-    return df.iloc[:is_end], df.iloc[is_end:val_end], df.iloc[val_end:]
+    return [(0, is_end), (is_end, val_end), (val_end, n)]
 
 
 def build_strategy_params(
@@ -374,11 +403,20 @@ def run_backtest(
     data: pd.DataFrame,
     params: dict[str, Any],
     config: BacktestConfig = BASE_CONFIG,
+    cache: IndicatorCache | None = None,
+    periods_per_year: float | None = None,
 ) -> dict[str, float]:
-    """Run backtest and return metrics dict."""
-    result = _run_backtest_result(data, params, config)
-    metrics = compute_metrics(result.equity_curve, result.trades)
+    """Run backtest and return metrics dict.
 
+    Pass the same ``cache`` and ``periods_per_year`` across trials on one
+    dataset to reuse indicators and skip frequency inference.
+    """
+    result = _run_backtest_result(data, params, config, cache)
+    return _metrics_row(result, data, periods_per_year)
+
+
+def _metrics_row(result, data: pd.DataFrame, periods_per_year: float | None) -> dict[str, float]:
+    metrics = _objective_metrics(result, data, periods_per_year)
     return {
         "sharpe": float(metrics.get("sharpe_ratio", 0.0)),
         "total_return": float(metrics.get("total_return", 0.0) * 100.0),
@@ -389,38 +427,72 @@ def run_backtest(
     }
 
 
+def run_segment_backtests(
+    data: pd.DataFrame,
+    params: dict[str, Any],
+    bounds: list[tuple[int, int]],
+    config: BacktestConfig = BASE_CONFIG,
+    carry_state: bool = False,
+    strict_isolation: bool = False,
+) -> list[dict[str, float]]:
+    """``run_backtest`` metrics for each row range of ``data``.
+
+    Indicators and signals are computed once on the full history and each
+    segment is simulated on its index range (see ``run_segments``).
+    ``strict_isolation`` instead backtests every slice from a cold start, as
+    separate ``run_backtest`` calls do.
+    """
+    if strict_isolation:
+        return [run_backtest(data.iloc[start:stop], params, config) for start, stop in bounds]
+
+    strategy = _instantiate_strategy(FinalTriggerStrategy, params)
+    results = VectorizedBacktester(config).run_segments(
+        data, strategy, bounds, carry_state=carry_state
+    )
+    periods_per_year = _periods_per_year(data.index)
+    return [_metrics_row(result, data, periods_per_year) for result in results]
+
+
 def _run_backtest_result(
     data: pd.DataFrame,
     params: dict[str, Any],
     config: BacktestConfig = BASE_CONFIG,
+    cache: IndicatorCache | None = None,
 ):
     strategy = _instantiate_strategy(FinalTriggerStrategy, params)
+    strategy.cache = cache
     backtester = VectorizedBacktester(config)
     return backtester.run(data, strategy)
 
 
-def _stack_returns_matrix(returns_matrix: list[np.ndarray]) -> np.ndarray:
-    if not returns_matrix:
-        return np.empty((0, 0), dtype=np.float32)
-    lengths = {len(series) for series in returns_matrix}
-    if len(lengths) > 1:
-        min_len = min(lengths)
-        stacked = np.stack([series[:min_len] for series in returns_matrix], axis=0)
-    else:
-        stacked = np.stack(returns_matrix, axis=0)
-    return stacked.astype(np.float32, copy=False)
+def _objective_metrics(
+    result, data: pd.DataFrame, periods_per_year: float | None = None
+) -> dict[str, float]:
+    """Core metrics of one trial; full ``compute_metrics`` is kept for reports."""
+    if periods_per_year is None:
+        periods_per_year = _periods_per_year(data.index)
+    return compute_core_metrics(
+        result.equity_curve.to_numpy(),
+        _trade_pnl(result.trades).to_numpy(),
+        periods_per_year,
+    )
 
 
-def _save_returns_matrix(
-    asset: str,
-    run_id: str,
-    returns_matrix: np.ndarray,
-    output_dir: str,
-) -> str:
-    output_path = Path(output_dir) / f"returns_matrix_{asset}_{run_id}.npy"
-    output_path.parent.mkdir(exist_ok=True)
-    np.save(output_path, returns_matrix)
-    return str(output_path)
+def _record_trial_returns(
+    store: ReturnsMatrixStore,
+    equity_curve: pd.Series,
+    params: dict[str, Any],
+) -> None:
+    """Append one trial's bar returns to the PBO returns-matrix store."""
+    returns_series = equity_curve.pct_change().fillna(0.0)
+    try:
+        store.append(
+            returns_series.to_numpy(dtype=np.float32, copy=False),
+            params=params,
+            index=returns_series.index,
+        )
+    except (OSError, ValueError) as exc:
+        print(f"[{store.asset}] Returns matrix append failed: {exc}")
 
 
 def optimize_atr(
@@ -445,6 +517,9 @@ def optimize_atr(
     best_sharpe = -np.inf
     space = search_space or ATR_SEARCH_SPACE
 
+    cache = IndicatorCache()
+    periods_per_year = _periods_per_year(data.index)
+
     def objective(trial: optuna.Trial) -> float:
         sl = trial.suggest_float("sl_mult", *space["sl_mult"], step=0.25)
         tp1 = trial.suggest_float("tp1_mult", *space["tp1_mult"], step=0.25)
@@ -462,7 +537,7 @@ def optimize_atr(
             filter_config=filter_config,
         )
 
-        result = run_backtest(data, params)
+        result = run_backtest(data, params, cache=cache, periods_per_year=periods_per_year)
 
         if result["trades"] < min_trades:
             return -10.0
@@ -493,6 +568,9 @@ def optimize_atr_conservative(
     import random
     random.seed(_CURRENT_ASSET_SEED)
 
+    cache = IndicatorCache()
+    periods_per_year = _periods_per_year(data.index)
+
     def objective(trial: optuna.Trial) -> float:
         sl = trial.suggest_categorical("sl_mult", CONSERVATIVE_ATR_SPACE["sl_mult"])
         tp1 = trial.suggest_categorical("tp1_mult", CONSERVATIVE_ATR_SPACE["tp1_mult"])
@@ -510,7 +588,7 @@ def optimize_atr_conservative(
             filter_config=filter_config,
         )
 
-        result = run_backtest(data, params)
+        result = run_backtest(data, params, cache=cache, periods_per_year=periods_per_year)
 
         if result["trades"] < min_trades:
             return -10.0
@@ -532,7 +610,7 @@ def optimize_ichimoku(
     min_trades: int = 50,
     fixed_displacement: int | None = None,
     filter_config: dict[str, bool] | None = None,
-    returns_matrix: list[np.ndarray] | None = None,
+    returns_matrix: ReturnsMatrixStore | None = None,
 ) -> tuple[dict[str, int], float]:
     """Optimize Ichimoku parameters."""
     import optuna
@@ -542,6 +620,9 @@ def optimize_ichimoku(
     import random
     random.seed(_CURRENT_ASSET_SEED)
 
+    cache = IndicatorCache()
+    periods_per_year = _periods_per_year(data.index)
+
     def objective(trial: optuna.Trial) -> float:
         tenkan = trial.suggest_int("tenkan", *ICHI_SEARCH_SPACE["tenkan"])
         kijun = trial.suggest_int("kijun", *ICHI_SEARCH_SPACE["kijun"])
@@ -561,15 +642,14 @@ def optimize_ichimoku(
         )
 
         if returns_matrix is None:
-            result = run_backtest(data, params)
+            result = run_backtest(data, params, cache=cache, periods_per_year=periods_per_year)
             if result["trades"] < min_trades:
                 return -10.0
             return result["sharpe"]
 
-        result = _run_backtest_result(data, params, BASE_CONFIG)
-        metrics = compute_metrics(result.equity_curve, result.trades)
-        returns_series = result.equity_curve.pct_change().fillna(0.0)
-        returns_matrix.append(returns_series.to_numpy(dtype=np.float32, copy=False))
+        result = _run_backtest_result(data, params, BASE_CONFIG, cache)
+        metrics = _objective_metrics(result, data, periods_per_year)
+        _record_trial_returns(returns_matrix, result.equity_curve, trial.params)
         sharpe = float(metrics.get("sharpe_ratio", 0.0))
         if len(result.trades) < min_trades:
             return -10.0
@@ -590,7 +670,7 @@ def optimize_ichimoku_conservative(
     min_trades: int = 50,
     fixed_displacement: int | None = None,
     filter_config: dict[str, bool] | None = None,
-    returns_matrix: list[np.ndarray] | None = None,
+    returns_matrix: ReturnsMatrixStore | None = None,
 ) -> tuple[dict[str, int], float]:
     """Optimize Ichimoku parameters with a discrete grid."""
     import optuna
@@ -600,6 +680,9 @@ def optimize_ichimoku_conservative(
     import random
     random.seed(_CURRENT_ASSET_SEED)
 
+    cache = IndicatorCache()
+    periods_per_year = _periods_per_year(data.index)
+
     def objective(trial: optuna.Trial) -> float:
         tenkan = trial.suggest_categorical("tenkan", CONSERVATIVE_ICHI_SPACE["tenkan"])
         kijun = trial.suggest_categorical("kijun", CONSERVATIVE_ICHI_SPACE["kijun"])
@@ -622,15 +705,14 @@ def optimize_ichimoku_conservative(
         )
 
         if returns_matrix is None:
-            result = run_backtest(data, params)
+            result = run_backtest(data, params, cache=cache, periods_per_year=periods_per_year)
             if result["trades"] < min_trades:
                 return -10.0
             return result["sharpe"]
 
-        result = _run_backtest_result(data, params, BASE_CONFIG)
-        metrics = compute_metrics(result.equity_curve, result.trades)
-        returns_series = result.equity_curve.pct_change().fillna(0.0)
-        returns_matrix.append(returns_series.to_numpy(dtype=np.float32, copy=False))
+        result = _run_backtest_result(data, params, BASE_CONFIG, cache)
+        metrics = _objective_metrics(result, data, periods_per_year)
+        _record_trial_returns(returns_matrix, result.equity_curve, trial.params)
         sharpe = float(metrics.get("sharpe_ratio", 0.0))
         if len(result.trades) < min_trades:
             return -10.0
@@ -856,17 +938,16 @@ def monte_carlo_pvalue(
 
     # Simplified: randomize entry points
     rng = np.random.default_rng(seed)
-    sharpe_values = []
-
-    for _ in range(iterations):
-        # Random equity curve
-        random_returns = rng.choice(prices[1:] / prices[:-1] - 1, size=n_bars - 1)
-        equity = BASE_CONFIG.initial_capital * np.cumprod(1 + random_returns * 0.01)
-        equity_series = pd.Series(equity, index=data.index[1:])
-        metrics = compute_metrics(equity_series, pd.DataFrame())
-        sharpe_values.append(float(metrics.get("sharpe_ratio", 0.0)))
+    metrics = bootstrap_return_metrics(
+        prices[1:] / prices[:-1] - 1,
+        scale=0.01,
+        initial_capital=BASE_CONFIG.initial_capital,
+        iterations=iterations,
+        rng=rng,
+        periods_per_year=_periods_per_year(data.index[1:]),
+    )
 
-    sharpe_arr = np.array(sharpe_values, dtype=float)
+    sharpe_arr = metrics["sharpe_ratio"]
     count_better = int((sharpe_arr >= actual_sharpe).sum())
     return float((count_better + 1) / (len(sharpe_arr) + 1))
 
@@ -886,6 +967,8 @@ def optimize_single_asset(
     run_id: str | None = None,
     track_returns_matrix: bool = True,
     returns_matrix_dir: str = "outputs",
+    strict_segment_isolation: bool = False,
+    carry_segment_state: bool = False,
 ) -> AssetScanResult:
     """Full optimization pipeline for one asset.
     
@@ -894,6 +977,10 @@ def optimize_single_asset(
                          use volatility-profiled ATR ranges based on asset type.
                          HIGH_VOL (meme coins) -> tighter stops
                          LOW_VOL (majors) -> wider stops
+        strict_segment_isolation: Backtest IS/VAL/OOS from a cold start each
+                         instead of slicing one full-history signal pass.
+        carry_segment_state: Let positions open at a segment boundary run on
+                         into the next segment (ignored with strict isolation).
     """
     # Create unique seed per asset to avoid sampler conflicts in parallel execution
     # Use hashlib instead of hash() to ensure deterministic results (hash() is randomized in Python 3.3+)
@@ -928,7 +1015,10 @@ def optimize_single_asset(
     start_date = ""
     end_date = ""
     total_bars_raw = 0
-    returns_matrix = [] if track_returns_matrix else None
+    returns_matrix = None
+    if track_returns_matrix and run_id and returns_matrix_dir:
+        returns_matrix = ReturnsMatrixStore(returns_matrix_dir, asset, run_id)
+        returns_matrix.reset()
 
     _log_progress(asset, "START")
 
@@ -942,6 +1032,7 @@ def optimize_single_asset(
 
         df = df.iloc[OPTIM_CONFIG["warmup_bars"]:]
         splits = CONSERVATIVE_SPLIT_RATIO if conservative else (0.6, 0.2, 0.2)
+        segment_bounds = split_bounds(len(df), splits)
         df_is, df_val, df_oos = split_data(df, splits=splits)
 
         print(f"[{asset}] Data: IS={len(df_is)}, VAL={len(df_val)}, OOS={len(df_oos)} bars [{start_date} -> {end_date}]")
@@ -992,18 +1083,8 @@ def optimize_single_asset(
                 returns_matrix=returns_matrix,
             )
         print(f"[{asset}] Ichi done: Sharpe={ichi_sharpe:.2f}, params={ichi_params}")
-        if returns_matrix is not None:
-            returns_array = _stack_returns_matrix(returns_matrix)
-            if run_id and returns_matrix_dir:
-                try:
-                    saved_path = _save_returns_matrix(
-                        asset, run_id, returns_array, returns_matrix_dir
-                    )
-                    print(f"[{asset}] Returns matrix saved: {saved_path}")
-                except Exception as save_error:
-                    print(f"[{asset}] Returns matrix save failed: {save_error}")
-            returns_matrix = None
-            returns_array = None
+        if returns_matrix is not None and returns_matrix.exists():
+            print(f"[{asset}] Returns matrix saved: {returns_matrix.data_path}")
 
         # 4. Build final params
         final_params = build_strategy_params(
@@ -1033,9 +1114,13 @@ def optimize_single_asset(
 
         # 5. Evaluate on all segments
         _log_progress(asset, "WF")
-        is_results = run_backtest(df_is, final_params)
-        val_results = run_backtest(df_val, final_params)
-        oos_results = run_backtest(df_oos, final_params)
+        is_results, val_results, oos_results = run_segment_backtests(
+            df,
+            final_params,
+            segment_bounds,
+            carry_state=carry_segment_state,
+            strict_isolation=strict_segment_isolation,
+        )
 
         # 6. Calculate WFE DUAL metrics (Pardo 2008 standard)
         wfe_pardo = oos_results["sharpe"] / is_results["sharpe"] if is_results["sharpe"] > 0 else 0
@@ -1156,6 +1241,8 @@ def run_parallel_scan(
     use_vol_profile: bool = False,
     track_returns_matrix: bool = True,
     returns_matrix_dir: str = "outputs",
+    strict_segment_isolation: bool = False,
+    carry_segment_state: bool = False,
 ) -> tuple[pd.DataFrame, str]:
     """Run optimization for all assets in parallel.
     
@@ -1218,6 +1305,8 @@ def run_parallel_scan(
             run_id,
             track_returns_matrix,
             returns_matrix_dir,
+            strict_segment_isolation,
+            carry_segment_state,
         )
         for asset in assets
     )
@@ -1327,9 +1416,26 @@ def main():
         default="outputs",
         help="Output directory for returns matrix files",
     )
+    parser.add_argument(
+        "--strict-segment-isolation",
+        action="store_true",
+        help="Backtest IS/VAL/OOS from a cold start each (no shared indicator warmup)",
+    )
+    parser.add_argument(
+        "--carry-segment-state",
+        action="store_true",
+        help="Carry open positions across IS/VAL/OOS boundaries",
+    )
+    parser.add_argument(
+        "--result-cache",
+        default=None,
+        help="Directory of the on-disk backtest result cache shared by all workers",
+    )
     parser.set_defaults(enforce_tp_progression=True)
     parser.set_defaults(track_returns_matrix=True)
     args = parser.parse_args()
+    if args.result_cache:
+        os.environ[RESULT_CACHE_ENV] = args.result_cache
 
     assets = args.assets or SCAN_ASSETS
 
@@ -1348,6 +1454,8 @@ def main():
         use_vol_profile=args.use_vol_profile,
         track_returns_matrix=args.track_returns_matrix,
         returns_matrix_dir=args.returns_matrix_dir,
+        strict_segment_isolation=args.strict_segment_isolation,
+        carry_segment_state=args.carry_segment_state,
     )
 
 
@@ -44,12 +44,15 @@ Date: 2026-01-26
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
 import numpy as np
 import pandas as pd
 
 from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.data.shared import SharedFrame, SharedFrameHandle, attach_frame
 from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
 from crypto_backtest.optimization.bayesian import BayesianOptimizer, _apply_overrides
 
@@ -59,6 +62,10 @@ class WalkForwardConfig:
     in_sample_days: int = 180
     out_of_sample_days: int = 30
     n_trials: int = 50
+    # Windows optimized concurrently; the OHLCV is shared with workers once.
+    n_jobs: int = 1
+    # Enqueue the previous window's top-k params in each study (sequential only).
+    warm_start_top_k: int = 0
 
 
 @dataclass(frozen=True)
@@ -69,6 +76,17 @@ class WalkForwardResult:
     degradation_pct: float  # Display-friendly degradation percentage
 
 
+@dataclass(frozen=True)
+class _WindowResult:
+    is_score: float
+    oos_score: float
+    is_return: float
+    oos_return: float
+    oos_equity: pd.Series
+    oos_trades: pd.DataFrame
+    ranked_params: tuple[dict, ...]
+
+
 class WalkForwardAnalyzer:
     def __init__(self, config: WalkForwardConfig) -> None:
         self.config = config
@@ -88,73 +106,47 @@ class WalkForwardAnalyzer:
         search_space = param_space.get("search_space")
         if base_params is None or search_space is None:
             raise ValueError("param_space must include 'base_params' and 'search_space'")
+        if self.config.warm_start_top_k > 0 and self.config.n_jobs != 1:
+            raise ValueError("warm_start_top_k chains windows and requires n_jobs=1")
 
         backtest_config = param_space.get("backtest_config") or BacktestConfig()
         objective_name = param_space.get("objective", "sharpe_ratio")
-        direction = param_space.get("direction", "maximize")
-
-        in_sample = pd.Timedelta(days=self.config.in_sample_days)
-        out_sample = pd.Timedelta(days=self.config.out_of_sample_days)
 
         start = data.index.min()
-        end = data.index.max()
         if not isinstance(start, pd.Timestamp):
             raise ValueError("data must use a DatetimeIndex for walk-forward analysis")
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
 
-        oos_equity_curves = []
-        oos_trades = []
-        is_scores = []
-        oos_scores = []
-        is_returns = []
-        oos_returns = []
-
-        window_start = start
-        while window_start + in_sample + out_sample <= end:
-            train_end = window_start + in_sample
-            test_end = train_end + out_sample
-
-            train = data[(data.index >= window_start) & (data.index < train_end)]
-            test = data[(data.index >= train_end) & (data.index < test_end)]
-            if len(train) < 2 or len(test) < 2:
-                break
-
-            opt_space = {
-                "base_params": base_params,
-                "search_space": search_space,
-                "objective": objective_name,
-                "direction": direction,
-                "backtest_config": backtest_config,
-            }
-            opt_result = self.optimizer.optimize(
-                train, strategy_class, opt_space, n_trials=self.config.n_trials
-            )
-            best_params = _apply_overrides(base_params, opt_result.best_params)
-
-            backtester = VectorizedBacktester(backtest_config)
-
-            strategy_is = strategy_class(best_params)
-            result_is = backtester.run(train, strategy_is)
-            metrics_is = compute_metrics(result_is.equity_curve, result_is.trades)
-            is_score = metrics_is.get(objective_name, 0.0)
-            is_return = metrics_is.get("total_return", 0.0)
-
-            strategy_oos = strategy_class(best_params)
-            result_oos = backtester.run(test, strategy_oos)
-            metrics_oos = compute_metrics(result_oos.equity_curve, result_oos.trades)
-            oos_score = metrics_oos.get(objective_name, 0.0)
-            oos_return = metrics_oos.get("total_return", 0.0)
-
-            is_scores.append(is_score)
-            oos_scores.append(oos_score)
-            is_returns.append(is_return)
-            oos_returns.append(oos_return)
-
-            oos_equity_curves.append(result_oos.equity_curve)
-            oos_trades.append(result_oos.trades)
-
-            window_start = test_end
-
-        if not oos_equity_curves:
+        windows = _window_bounds(
+            data.index,
+            pd.Timedelta(days=self.config.in_sample_days),
+            pd.Timedelta(days=self.config.out_of_sample_days),
+        )
+        opt_space = {
+            "base_params": base_params,
+            "search_space": search_space,
+            "objective": objective_name,
+            "direction": param_space.get("direction", "maximize"),
+            "backtest_config": backtest_config,
+        }
+        if "seed" in param_space:
+            opt_space["seed"] = param_space["seed"]
+
+        if self.config.n_jobs != 1 and len(windows) > 1:
+            results = self._run_parallel(data, windows, strategy_class, opt_space)
+        else:
+            results = []
+            warm_start: tuple[dict, ...] = ()
+            for bounds in windows:
+                window = _run_window(
+                    data, bounds, strategy_class, opt_space, self.config.n_trials,
+                    warm_start, self.optimizer,
+                )
+                results.append(window)
+                warm_start = window.ranked_params[: self.config.warm_start_top_k]
+
+        if not results:
             return WalkForwardResult(
                 combined_metrics={},
                 return_efficiency=0.0,
@@ -162,16 +154,18 @@ class WalkForwardAnalyzer:
                 degradation_pct=0.0,
             )
 
-        combined_equity = _stitch_equity(oos_equity_curves, backtest_config.initial_capital)
-        combined_trades = pd.concat(oos_trades, ignore_index=True)
+        combined_equity = _stitch_equity(
+            [window.oos_equity for window in results], backtest_config.initial_capital
+        )
+        combined_trades = pd.concat([window.oos_trades for window in results], ignore_index=True)
         combined_metrics = compute_metrics(combined_equity, combined_trades)
 
-        mean_is_score = _mean_safe(is_scores)
-        mean_oos_score = _mean_safe(oos_scores)
+        mean_is_score = _mean_safe([window.is_score for window in results])
+        mean_oos_score = _mean_safe([window.oos_score for window in results])
         wfe_pardo = _ratio(mean_oos_score, mean_is_score)  # TRUE WFE using Sharpe ratios
 
-        mean_is_return = _mean_safe(is_returns)
-        mean_oos_return = _mean_safe(oos_returns)
+        mean_is_return = _mean_safe([window.is_return for window in results])
+        mean_oos_return = _mean_safe([window.oos_return for window in results])
         return_efficiency = _ratio(mean_oos_return, mean_is_return)  # Return ratio (NOT WFE)
 
         # Calculate display-friendly degradation percentage
@@ -184,6 +178,100 @@ class WalkForwardAnalyzer:
             degradation_pct=degradation_pct,
         )
 
+    def _run_parallel(
+        self,
+        data: pd.DataFrame,
+        windows: list[tuple[int, int, int]],
+        strategy_class,
+        opt_space: dict,
+    ) -> list[_WindowResult]:
+        n_jobs = self.config.n_jobs if self.config.n_jobs > 0 else (os.cpu_count() or 1)
+        with SharedFrame(data) as shared, ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(windows))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _run_shared_window, shared.handle, bounds, strategy_class, opt_space,
+                    self.config.n_trials, self.optimizer,
+                )
+                for bounds in windows
+            ]
+            return [future.result() for future in futures]
+
+
+def _window_bounds(
+    index: pd.DatetimeIndex, in_sample: pd.Timedelta, out_sample: pd.Timedelta
+) -> list[tuple[int, int, int]]:
+    """Row positions ``(train_start, train_end, test_end)`` of each IS/OOS window."""
+    windows = []
+    end = index[-1]
+    window_start = index[0]
+    while window_start + in_sample + out_sample <= end:
+        train_end = window_start + in_sample
+        test_end = train_end + out_sample
+        first, split, last = index.searchsorted([window_start, train_end, test_end])
+        if split - first < 2 or last - split < 2:
+            break
+        windows.append((int(first), int(split), int(last)))
+        window_start = test_end
+    return windows
+
+
+def _run_window(
+    data: pd.DataFrame,
+    bounds: tuple[int, int, int],
+    strategy_class,
+    opt_space: dict,
+    n_trials: int,
+    warm_start: tuple[dict, ...] = (),
+    optimizer: BayesianOptimizer | None = None,
+) -> _WindowResult:
+    """Optimize one IS window and evaluate the best params IS and OOS."""
+    first, split, last = bounds
+    train = data.iloc[first:split]
+    test = data.iloc[split:last]
+    objective_name = opt_space["objective"]
+    backtest_config = opt_space["backtest_config"]
+
+    optimizer = optimizer or BayesianOptimizer()
+    opt_result = optimizer.optimize(
+        train, strategy_class, opt_space, n_trials=n_trials, warm_start=warm_start
+    )
+    best_params = _apply_overrides(opt_space["base_params"], opt_result.best_params)
+
+    backtester = VectorizedBacktester(backtest_config)
+
+    strategy_is = strategy_class(best_params)
+    result_is = backtester.run(train, strategy_is)
+    metrics_is = compute_metrics(result_is.equity_curve, result_is.trades)
+
+    strategy_oos = strategy_class(best_params)
+    result_oos = backtester.run(test, strategy_oos)
+    metrics_oos = compute_metrics(result_oos.equity_curve, result_oos.trades)
+
+    return _WindowResult(
+        is_score=metrics_is.get(objective_name, 0.0),
+        oos_score=metrics_oos.get(objective_name, 0.0),
+        is_return=metrics_is.get("total_return", 0.0),
+        oos_return=metrics_oos.get("total_return", 0.0),
+        oos_equity=result_oos.equity_curve,
+        oos_trades=result_oos.trades,
+        ranked_params=opt_result.ranked_params,
+    )
+
+
+def _run_shared_window(
+    handle: SharedFrameHandle,
+    bounds: tuple[int, int, int],
+    strategy_class,
+    opt_space: dict,
+    n_trials: int,
+    optimizer: BayesianOptimizer | None = None,
+) -> _WindowResult:
+    return _run_window(
+        attach_frame(handle), bounds, strategy_class, opt_space, n_trials, optimizer=optimizer
+    )
+
 
 def _stitch_equity(curves: list[pd.Series], initial_capital: float) -> pd.Series:
     equity = initial_capital
@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import numpy as np
 import pandas as pd
 
 from crypto_backtest.indicators.atr import compute_atr
+from crypto_backtest.indicators.cache import IndicatorCache, cached
 from crypto_backtest.indicators.five_in_one import FiveInOneConfig, FiveInOneFilter
 from crypto_backtest.indicators.ichimoku import Ichimoku, IchimokuConfig
 from crypto_backtest.indicators.mama_fama_kama import compute_kama, compute_mama_fama
+from crypto_backtest.utils.jit import njit
 from .base import BaseStrategy
 
 
+# Per-bar state recorded by ``_arming_kernel`` when debug output is requested.
+_ARMING_STATE_COLUMNS = (
+    "armed_long_strict",
+    "armed_short_strict",
+    "armed_long_grace_ok",
+    "armed_short_grace_ok",
+    "pending_long",
+    "pending_short",
+    "lock_long_cycle",
+    "lock_short_cycle",
+    "allow_long",
+    "allow_short",
+    "trigger_long",
+    "trigger_short",
+    "final_long_active",
+    "final_short_active",
+)
+
+
 @dataclass(frozen=True)
 class FinalTriggerParams:
     grace_bars: int = 1
@@ -39,8 +60,10 @@ class FinalTriggerParams:
 class FinalTriggerStrategy(BaseStrategy):
     """Strategy using Ichimoku + MAMA/KAMA + Five-in-One filters."""
 
-    def __init__(self, params: FinalTriggerParams) -> None:
+    def __init__(self, params: FinalTriggerParams, cache: IndicatorCache | None = None) -> None:
         self.params = params
+        # Optional per-dataset cache shared across optimizer trials.
+        self.cache = cache
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Return signal, entry, SL and TP levels for each bar."""
@@ -48,16 +71,111 @@ class FinalTriggerStrategy(BaseStrategy):
         if missing:
             raise ValueError(f"Missing columns for strategy: {sorted(missing)}")
 
+        if self.params.debug_signals:
+            new_long_close, new_short_close, debug_columns = self._compute_entries(data)
+        else:
+            # Entries do not depend on SL/TP multiples or the ATR length, so
+            # ATR-phase trials reuse one skeleton and only rescale the levels.
+            skeleton_key = replace(
+                self.params,
+                sl_mult=0.0,
+                tp1_mult=0.0,
+                tp2_mult=0.0,
+                tp3_mult=0.0,
+                atr_length=0,
+                debug_signals_path="",
+            )
+            new_long_close, new_short_close, debug_columns = cached(
+                self.cache,
+                data,
+                ("entries", skeleton_key),
+                lambda: self._compute_entries(data),
+            )
+
         close = data["close"]
-        mama_fama = compute_mama_fama(
-            close,
-            self.params.mama_fast_limit,
-            self.params.mama_slow_limit,
-            er_length=self.params.kama_length,
+        atr = cached(
+            self.cache,
+            data,
+            ("atr", self.params.atr_length),
+            lambda: compute_atr(data["high"], data["low"], close, self.params.atr_length),
+        )
+        n = len(data)
+        is_long = new_long_close & self.params.enable_long
+        is_short = new_short_close & ~is_long & self.params.enable_short
+        is_entry = is_long | is_short
+        close_arr = close.to_numpy(dtype=float)
+        atr_arr = atr.to_numpy(dtype=float)
+
+        signal = np.zeros(n, dtype=int)
+        signal[is_long] = 1
+        signal[is_short] = -1
+        entry_price = np.where(is_entry, close_arr, np.nan)
+        sl_price = np.where(
+            is_long,
+            close_arr - self.params.sl_mult * atr_arr,
+            np.where(is_short, close_arr + self.params.sl_mult * atr_arr, np.nan),
+        )
+        tp1_price = self._tp_level(is_long, is_short, close_arr, self.params.tp1_mult * atr_arr)
+        tp2_price = self._tp_level(is_long, is_short, close_arr, self.params.tp2_mult * atr_arr)
+        tp3_price = self._tp_level(is_long, is_short, close_arr, self.params.tp3_mult * atr_arr)
+
+        if debug_columns is not None:
+            debug_df = pd.DataFrame({**debug_columns, "signal": signal}, index=data.index)
+            debug_df.to_csv(self.params.debug_signals_path)
+
+        return pd.DataFrame(
+            {
+                "signal": signal,
+                "entry_price": entry_price,
+                "sl_price": sl_price,
+                "tp1_price": tp1_price,
+                "tp2_price": tp2_price,
+                "tp3_price": tp3_price,
+            },
+            index=data.index,
         )
-        mama = mama_fama["mama"]
-        fama = mama_fama["fama"]
-        kama = compute_kama(close, self.params.kama_length)
+
+    @staticmethod
+    def _tp_level(
+        is_long: np.ndarray, is_short: np.ndarray, close: np.ndarray, offset: np.ndarray
+    ) -> np.ndarray:
+        return np.where(is_long, close + offset, np.where(is_short, close - offset, np.nan))
+
+    def _compute_entries(
+        self, data: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray, dict[str, object] | None]:
+        """Run the arming state machine and return new long/short entry masks."""
+        close = data["close"]
+        debug_enabled = self.params.debug_signals
+
+        if self.params.use_mama_kama_filter or debug_enabled:
+            mama_fama = cached(
+                self.cache,
+                data,
+                (
+                    "mama_fama",
+                    self.params.mama_fast_limit,
+                    self.params.mama_slow_limit,
+                    self.params.kama_length,
+                ),
+                lambda: compute_mama_fama(
+                    close,
+                    self.params.mama_fast_limit,
+                    self.params.mama_slow_limit,
+                    er_length=self.params.kama_length,
+                ),
+            )
+            mama = mama_fama["mama"]
+            fama = mama_fama["fama"]
+            kama = cached(
+                self.cache,
+                data,
+                ("kama", self.params.kama_length),
+                lambda: compute_kama(close, self.params.kama_length),
+            )
+        else:
+            # The MAMA/KAMA conditions are only read when the filter is on.
+            mama = fama = kama = pd.Series(np.nan, index=data.index)
 
         # Apply a small relative tolerance to reduce boundary flips vs Pine.
         tol = close * self.params.price_tol_pct
@@ -79,277 +197,263 @@ class FinalTriggerStrategy(BaseStrategy):
             cross_long_ok &= cond_fama_between_long
             cross_short_ok &= cond_fama_between_short
 
-        ichi = Ichimoku(self.params.ichimoku)
-        ichi.compute(data)
-        all_bullish = ichi.all_bullish(close).fillna(False)
-        all_bearish = ichi.all_bearish(close).fillna(False)
+        (
+            all_bullish,
+            all_bearish,
+            buy_signal_raw,
+            sell_signal_raw,
+            ichi_long_active,
+            ichi_short_active,
+        ) = cached(
+            self.cache,
+            data,
+            (
+                "ichimoku",
+                self.params.ichimoku.tenkan,
+                self.params.ichimoku.kijun,
+                self.params.ichimoku.displacement,
+            ),
+            lambda: self._ichimoku_state(data),
+        )
 
-        n = len(data)
-        debug_enabled = self.params.debug_signals
         enable_long = self.params.enable_long
         enable_short = self.params.enable_short
-        buy_signal_raw = np.zeros(n, dtype=bool)
-        sell_signal_raw = np.zeros(n, dtype=bool)
-        ichi_long_active = np.zeros(n, dtype=bool)
-        ichi_short_active = np.zeros(n, dtype=bool)
-
-        trade_op = False
-        ichi_state = 0
-        for i in range(n):
-            if all_bullish.iloc[i] and not trade_op:
-                buy_signal_raw[i] = True
-            if all_bearish.iloc[i] and trade_op:
-                sell_signal_raw[i] = True
-
-            if buy_signal_raw[i]:
-                trade_op = True
-                ichi_state = 1
-            elif sell_signal_raw[i]:
-                trade_op = False
-                ichi_state = -1
-
-            ichi_long_active[i] = ichi_state == 1
-            ichi_short_active[i] = ichi_state == -1
-
-        five_filter = FiveInOneFilter(self.params.five_in_one)
+
+        five_filter = FiveInOneFilter(self.params.five_in_one, cache=self.cache)
         five_signal = five_filter.compute_combined(
             data, transition_mode=self.params.five_in_one.use_transition_mode
         )
         bullish_signal = five_signal == 1
         bearish_signal = five_signal == -1
 
-        new_long_close = np.zeros(n, dtype=bool)
-        new_short_close = np.zeros(n, dtype=bool)
+        new_long_close, new_short_close, states = _arming_kernel(
+            ichi_long_active,
+            ichi_short_active,
+            buy_signal_raw | sell_signal_raw,
+            bullish_signal.to_numpy(dtype=bool),
+            bearish_signal.to_numpy(dtype=bool),
+            cond_mk_long.to_numpy(dtype=bool),
+            cond_mk_short.to_numpy(dtype=bool),
+            cross_long_ok.to_numpy(dtype=bool),
+            cross_short_ok.to_numpy(dtype=bool),
+            enable_long,
+            enable_short,
+            self.params.use_mama_kama_filter,
+            self.params.strict_lock_5in1_last,
+            self.params.grace_bars == 1,
+            debug_enabled,
+        )
+        debug_columns = None
         if debug_enabled:
-            armed_long_strict_state = np.zeros(n, dtype=bool)
-            armed_short_strict_state = np.zeros(n, dtype=bool)
-            armed_long_grace_state = np.zeros(n, dtype=bool)
-            armed_short_grace_state = np.zeros(n, dtype=bool)
-            pending_long_state = np.zeros(n, dtype=bool)
-            pending_short_state = np.zeros(n, dtype=bool)
-            lock_long_cycle_state = np.zeros(n, dtype=bool)
-            lock_short_cycle_state = np.zeros(n, dtype=bool)
-            allow_long_state = np.zeros(n, dtype=bool)
-            allow_short_state = np.zeros(n, dtype=bool)
-            trigger_long_state = np.zeros(n, dtype=bool)
-            trigger_short_state = np.zeros(n, dtype=bool)
-            final_long_active_state = np.zeros(n, dtype=bool)
-            final_short_active_state = np.zeros(n, dtype=bool)
-
-        lock_long_cycle = False
-        lock_short_cycle = False
-        pending_long = False
-        pending_short = False
-        final_long_active = False
-        final_short_active = False
-
-        for i in range(n):
-            prev_pending_long = pending_long
-            prev_pending_short = pending_short
-
-            armed_long_strict = enable_long and ichi_long_active[i] and (
-                not self.params.use_mama_kama_filter or cond_mk_long.iloc[i]
-            )
-            armed_short_strict = enable_short and ichi_short_active[i] and (
-                not self.params.use_mama_kama_filter or cond_mk_short.iloc[i]
-            )
-            armed_long_grace_ok = enable_long and ichi_long_active[i] and (
-                not self.params.use_mama_kama_filter
-                or cond_mk_long.iloc[i]
-                or cross_long_ok.iloc[i]
-            )
-            armed_short_grace_ok = enable_short and ichi_short_active[i] and (
-                not self.params.use_mama_kama_filter
-                or cond_mk_short.iloc[i]
-                or cross_short_ok.iloc[i]
-            )
+            debug_columns = {
+                "close": close,
+                "mama": mama,
+                "fama": fama,
+                "kama": kama,
+                "tol": tol,
+                "cond_mk_long": cond_mk_long,
+                "cond_mk_short": cond_mk_short,
+                "cross_long_ok": cross_long_ok,
+                "cross_short_ok": cross_short_ok,
+                "all_bullish": all_bullish,
+                "all_bearish": all_bearish,
+                "buy_signal_raw": buy_signal_raw,
+                "sell_signal_raw": sell_signal_raw,
+                "ichi_long_active": ichi_long_active,
+                "ichi_short_active": ichi_short_active,
+                "five_signal": five_signal,
+                "bullish_signal": bullish_signal,
+                "bearish_signal": bearish_signal,
+                **dict(zip(_ARMING_STATE_COLUMNS, states)),
+                "new_long": new_long_close,
+                "new_short": new_short_close,
+            }
+        return new_long_close, new_short_close, debug_columns
+
+    def _ichimoku_state(
+        self, data: pd.DataFrame
+    ) -> tuple[pd.Series, pd.Series, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the Ichimoku bull/bear masks and the trade_op state arrays."""
+        close = data["close"]
+        ichi = Ichimoku(self.params.ichimoku)
+        ichi.compute(data)
+        all_bullish = ichi.all_bullish(close).fillna(False)
+        all_bearish = ichi.all_bearish(close).fillna(False)
 
-            if buy_signal_raw[i] or sell_signal_raw[i]:
-                lock_long_cycle = False
-                lock_short_cycle = False
-                pending_long = False
-                pending_short = False
-
-            if enable_long and not ichi_long_active[i]:
-                final_long_active = False
-            if enable_short and not ichi_short_active[i]:
-                final_short_active = False
-            if not enable_long:
-                pending_long = False
-                lock_long_cycle = False
-                final_long_active = False
-            if not enable_short:
-                pending_short = False
-                lock_short_cycle = False
-                final_short_active = False
-
-            if enable_long and (
-                self.params.strict_lock_5in1_last
-                and bullish_signal.iloc[i]
-                and ichi_long_active[i]
-                and not armed_long_strict
-            ):
-                if self.params.grace_bars == 1:
-                    pending_long = True
-                else:
-                    lock_long_cycle = True
-
-            if enable_short and (
-                self.params.strict_lock_5in1_last
-                and bearish_signal.iloc[i]
-                and ichi_short_active[i]
-                and not armed_short_strict
-            ):
-                if self.params.grace_bars == 1:
-                    pending_short = True
-                else:
-                    lock_short_cycle = True
-
-            if enable_long and prev_pending_long and not armed_long_grace_ok:
-                pending_long = False
-                if self.params.strict_lock_5in1_last:
-                    lock_long_cycle = True
-
-            if enable_short and prev_pending_short and not armed_short_grace_ok:
-                pending_short = False
-                if self.params.strict_lock_5in1_last:
-                    lock_short_cycle = True
-
-            allow_long = enable_long and (
-                not self.params.strict_lock_5in1_last or not lock_long_cycle
-            )
-            allow_short = enable_short and (
-                not self.params.strict_lock_5in1_last or not lock_short_cycle
-            )
+        buy_signal_raw, sell_signal_raw, ichi_long_active, ichi_short_active = (
+            _trade_op_kernel(all_bullish.to_numpy(dtype=bool), all_bearish.to_numpy(dtype=bool))
+        )
 
-            pending_long_ok = (
-                enable_long
-                and self.params.grace_bars == 1
-                and prev_pending_long
-                and armed_long_grace_ok
-            )
-            pending_short_ok = (
-                enable_short
-                and self.params.grace_bars == 1
-                and prev_pending_short
-                and armed_short_grace_ok
-            )
+        return (
+            all_bullish,
+            all_bearish,
+            buy_signal_raw,
+            sell_signal_raw,
+            ichi_long_active,
+            ichi_short_active,
+        )
 
-            trigger_long = enable_long and (
-                (bullish_signal.iloc[i] and armed_long_strict) or pending_long_ok
-            )
-            trigger_short = enable_short and (
-                (bearish_signal.iloc[i] and armed_short_strict) or pending_short_ok
-            )
 
-            new_long = trigger_long and allow_long and not final_long_active
-            new_short = trigger_short and allow_short and not final_short_active
-
-            if new_long:
-                final_long_active = True
-                final_short_active = False
-                pending_long = False
-                new_long_close[i] = True
-
-            if new_short:
-                final_short_active = True
-                final_long_active = False
-                pending_short = False
-                new_short_close[i] = True
-            if debug_enabled:
-                armed_long_strict_state[i] = armed_long_strict
-                armed_short_strict_state[i] = armed_short_strict
-                armed_long_grace_state[i] = armed_long_grace_ok
-                armed_short_grace_state[i] = armed_short_grace_ok
-                pending_long_state[i] = pending_long
-                pending_short_state[i] = pending_short
-                lock_long_cycle_state[i] = lock_long_cycle
-                lock_short_cycle_state[i] = lock_short_cycle
-                allow_long_state[i] = allow_long
-                allow_short_state[i] = allow_short
-                trigger_long_state[i] = trigger_long
-                trigger_short_state[i] = trigger_short
-                final_long_active_state[i] = final_long_active
-                final_short_active_state[i] = final_short_active
-
-        atr = compute_atr(data["high"], data["low"], close, self.params.atr_length)
-        signal = np.zeros(n, dtype=int)
-        entry_price = np.full(n, np.nan)
-        sl_price = np.full(n, np.nan)
-        tp1_price = np.full(n, np.nan)
-        tp2_price = np.full(n, np.nan)
-        tp3_price = np.full(n, np.nan)
-
-        for i in range(n):
-            if enable_long and new_long_close[i]:
-                entry = float(close.iloc[i])
-                atr_val = float(atr.iloc[i])
-                signal[i] = 1
-                entry_price[i] = entry
-                sl_price[i] = entry - self.params.sl_mult * atr_val
-                tp1_price[i] = entry + self.params.tp1_mult * atr_val
-                tp2_price[i] = entry + self.params.tp2_mult * atr_val
-                tp3_price[i] = entry + self.params.tp3_mult * atr_val
-            elif enable_short and new_short_close[i]:
-                entry = float(close.iloc[i])
-                atr_val = float(atr.iloc[i])
-                signal[i] = -1
-                entry_price[i] = entry
-                sl_price[i] = entry + self.params.sl_mult * atr_val
-                tp1_price[i] = entry - self.params.tp1_mult * atr_val
-                tp2_price[i] = entry - self.params.tp2_mult * atr_val
-                tp3_price[i] = entry - self.params.tp3_mult * atr_val
-        if debug_enabled:
-            debug_df = pd.DataFrame(
-                {
-                    "close": close,
-                    "mama": mama,
-                    "fama": fama,
-                    "kama": kama,
-                    "tol": tol,
-                    "cond_mk_long": cond_mk_long,
-                    "cond_mk_short": cond_mk_short,
-                    "cross_long_ok": cross_long_ok,
-                    "cross_short_ok": cross_short_ok,
-                    "all_bullish": all_bullish,
-                    "all_bearish": all_bearish,
-                    "buy_signal_raw": buy_signal_raw,
-                    "sell_signal_raw": sell_signal_raw,
-                    "ichi_long_active": ichi_long_active,
-                    "ichi_short_active": ichi_short_active,
-                    "five_signal": five_signal,
-                    "bullish_signal": bullish_signal,
-                    "bearish_signal": bearish_signal,
-                    "armed_long_strict": armed_long_strict_state,
-                    "armed_short_strict": armed_short_strict_state,
-                    "armed_long_grace_ok": armed_long_grace_state,
-                    "armed_short_grace_ok": armed_short_grace_state,
-                    "pending_long": pending_long_state,
-                    "pending_short": pending_short_state,
-                    "lock_long_cycle": lock_long_cycle_state,
-                    "lock_short_cycle": lock_short_cycle_state,
-                    "allow_long": allow_long_state,
-                    "allow_short": allow_short_state,
-                    "trigger_long": trigger_long_state,
-                    "trigger_short": trigger_short_state,
-                    "final_long_active": final_long_active_state,
-                    "final_short_active": final_short_active_state,
-                    "new_long": new_long_close,
-                    "new_short": new_short_close,
-                    "signal": signal,
-                },
-                index=data.index,
-            )
-            debug_df.to_csv(self.params.debug_signals_path)
+@njit(cache=True)
+def _trade_op_kernel(all_bullish, all_bearish):
+    """Ichimoku trade_op tracking: raw buy/sell flips and the active side."""
+    n = all_bullish.shape[0]
+    buy_signal_raw = np.zeros(n, dtype=np.bool_)
+    sell_signal_raw = np.zeros(n, dtype=np.bool_)
+    ichi_long_active = np.zeros(n, dtype=np.bool_)
+    ichi_short_active = np.zeros(n, dtype=np.bool_)
+
+    trade_op = False
+    ichi_state = 0
+    for i in range(n):
+        if all_bullish[i] and not trade_op:
+            buy_signal_raw[i] = True
+        if all_bearish[i] and trade_op:
+            sell_signal_raw[i] = True
+
+        if buy_signal_raw[i]:
+            trade_op = True
+            ichi_state = 1
+        elif sell_signal_raw[i]:
+            trade_op = False
+            ichi_state = -1
+
+        ichi_long_active[i] = ichi_state == 1
+        ichi_short_active[i] = ichi_state == -1
+
+    return buy_signal_raw, sell_signal_raw, ichi_long_active, ichi_short_active
+
+
+@njit(cache=True)
+def _arming_kernel(
+    ichi_long_active,
+    ichi_short_active,
+    cycle_reset,
+    bullish_signal,
+    bearish_signal,
+    cond_mk_long,
+    cond_mk_short,
+    cross_long_ok,
+    cross_short_ok,
+    enable_long,
+    enable_short,
+    use_mama_kama_filter,
+    strict_lock,
+    grace_one,
+    record_states,
+):
+    """Pending/lock/armed state machine over boolean bar arrays.
+
+    Returns the new long/short entry masks and, when ``record_states`` is set,
+    a ``(len(_ARMING_STATE_COLUMNS), n)`` array of per-bar states (otherwise
+    an empty ``(14, 0)`` array).
+    """
+    n = ichi_long_active.shape[0]
+    new_long_close = np.zeros(n, dtype=np.bool_)
+    new_short_close = np.zeros(n, dtype=np.bool_)
+    states = np.zeros((14, n if record_states else 0), dtype=np.bool_)
+
+    lock_long_cycle = False
+    lock_short_cycle = False
+    pending_long = False
+    pending_short = False
+    final_long_active = False
+    final_short_active = False
+
+    for i in range(n):
+        prev_pending_long = pending_long
+        prev_pending_short = pending_short
+        long_active = enable_long and ichi_long_active[i]
+        short_active = enable_short and ichi_short_active[i]
+
+        armed_long_strict = long_active and (not use_mama_kama_filter or cond_mk_long[i])
+        armed_short_strict = short_active and (not use_mama_kama_filter or cond_mk_short[i])
+        armed_long_grace_ok = long_active and (
+            not use_mama_kama_filter or cond_mk_long[i] or cross_long_ok[i]
+        )
+        armed_short_grace_ok = short_active and (
+            not use_mama_kama_filter or cond_mk_short[i] or cross_short_ok[i]
+        )
 
-        return pd.DataFrame(
-            {
-                "signal": signal,
-                "entry_price": entry_price,
-                "sl_price": sl_price,
-                "tp1_price": tp1_price,
-                "tp2_price": tp2_price,
-                "tp3_price": tp3_price,
-            },
-            index=data.index,
+        if cycle_reset[i]:
+            lock_long_cycle = False
+            lock_short_cycle = False
+            pending_long = False
+            pending_short = False
+
+        if not long_active:
+            final_long_active = False
+        if not short_active:
+            final_short_active = False
+        if not enable_long:
+            pending_long = False
+            lock_long_cycle = False
+        if not enable_short:
+            pending_short = False
+            lock_short_cycle = False
+
+        if strict_lock and long_active and bullish_signal[i] and not armed_long_strict:
+            if grace_one:
+                pending_long = True
+            else:
+                lock_long_cycle = True
+
+        if strict_lock and short_active and bearish_signal[i] and not armed_short_strict:
+            if grace_one:
+                pending_short = True
+            else:
+                lock_short_cycle = True
+
+        if enable_long and prev_pending_long and not armed_long_grace_ok:
+            pending_long = False
+            if strict_lock:
+                lock_long_cycle = True
+
+        if enable_short and prev_pending_short and not armed_short_grace_ok:
+            pending_short = False
+            if strict_lock:
+                lock_short_cycle = True
+
+        allow_long = enable_long and (not strict_lock or not lock_long_cycle)
+        allow_short = enable_short and (not strict_lock or not lock_short_cycle)
+
+        pending_long_ok = enable_long and grace_one and prev_pending_long and armed_long_grace_ok
+        pending_short_ok = (
+            enable_short and grace_one and prev_pending_short and armed_short_grace_ok
         )
+
+        trigger_long = (bullish_signal[i] and armed_long_strict) or pending_long_ok
+        trigger_short = (bearish_signal[i] and armed_short_strict) or pending_short_ok
+
+        new_long = trigger_long and allow_long and not final_long_active
+        new_short = trigger_short and allow_short and not final_short_active
+
+        if new_long:
+            final_long_active = True
+            final_short_active = False
+            pending_long = False
+            new_long_close[i] = True
+
+        if new_short:
+            final_short_active = True
+            final_long_active = False
+            pending_short = False
+            new_short_close[i] = True
+
+        if record_states:
+            states[0, i] = armed_long_strict
+            states[1, i] = armed_short_strict
+            states[2, i] = armed_long_grace_ok
+            states[3, i] = armed_short_grace_ok
+            states[4, i] = pending_long
+            states[5, i] = pending_short
+            states[6, i] = lock_long_cycle
+            states[7, i] = lock_short_cycle
+            states[8, i] = allow_long
+            states[9, i] = allow_short
+            states[10, i] = trigger_long
+            states[11, i] = trigger_short
+            states[12, i] = final_long_active
+            states[13, i] = final_short_active
+
+    return new_long_close, new_short_close, states
@@ -0,0 +1,33 @@
+"""Optional Numba JIT support.
+
+Kernels decorated with ``njit`` are compiled when Numba is installed and run
+as plain Python otherwise, so they must stick to the Numba-compatible subset
+(NumPy arrays, scalars, tuples; no pandas objects).
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - depends on environment
+    _numba_njit = None
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """Compile with ``numba.njit`` when available, otherwise return the function unchanged.
+
+    Supports both ``@njit`` and ``@njit(cache=True)`` forms.
+    """
+    if args and callable(args[0]) and len(args) == 1 and not kwargs:
+        func = args[0]
+        return _numba_njit(func) if _numba_njit is not None else func
+
+    def decorator(func: Callable) -> Callable:
+        if _numba_njit is None:
+            return func
+        return _numba_njit(*args, **kwargs)(func)
+
+    return decorator
@@ -0,0 +1,37 @@
+"""Run-length helpers for consecutive equal values (regime spells, drawdowns)."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def run_starts(values) -> np.ndarray:
+    """Boolean mask of positions where a new run begins.
+
+    Uses pandas ``!=`` against the previous value, so the first element and
+    every missing value start a run of their own.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    return (series != series.shift(1)).to_numpy(dtype=bool)
+
+
+def run_ids(values) -> np.ndarray:
+    """Run number of each position (1 for the first run)."""
+    return np.cumsum(run_starts(values))
+
+
+def run_positions(values) -> np.ndarray:
+    """1-based position of each element within its run (group cumcount + 1)."""
+    starts = run_starts(values)
+    index = np.arange(len(starts))
+    run_begin = np.maximum.accumulate(np.where(starts, index, 0)) if len(starts) else index
+    return index - run_begin + 1
+
+
+def longest_true_run(mask) -> int:
+    """Length of the longest run of consecutive True values."""
+    mask = np.asarray(mask, dtype=bool)
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return int((edges[1::2] - edges[::2]).max())
@@ -36,14 +36,6 @@ def _normalize_params(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _slice_data(data: pd.DataFrame, start_ts: str | None, end_ts: str | None) -> pd.DataFrame:
-    if start_ts:
-        data = data.loc[pd.to_datetime(start_ts) :]
-    if end_ts:
-        data = data.loc[: pd.to_datetime(end_ts)]
-    return data
-
-
 def _bar_returns_from_equity(equity_curve: pd.Series) -> np.ndarray:
     values = equity_curve.to_numpy(dtype=float)
     if len(values) < 2:
@@ -75,16 +67,8 @@ def _top10_concentration(trades: pd.DataFrame) -> float:
     return (top10 / total_pnl) * 100.0
 
 
-def run_coupled_backtest(
-    asset: str,
-    recipe_config: dict[str, Any],
-    mode: str = "combined",
-    start_ts: str | None = None,
-    end_ts: str | None = None,
-) -> dict[str, Any]:
-    enable_long = mode in ("combined", "long_only")
-    enable_short = mode in ("combined", "short_only")
-
+def coupled_strategy_config(recipe_config: dict[str, Any], mode: str = "combined") -> dict[str, Any]:
+    """Strategy params ``run_coupled_backtest`` simulates for ``recipe_config`` in ``mode``."""
     params = recipe_config
     if "long_params" in recipe_config or "short_params" in recipe_config:
         if mode == "short_only":
@@ -93,12 +77,29 @@ def run_coupled_backtest(
             params = recipe_config.get("long_params") or recipe_config.get("short_params") or {}
 
     config = _normalize_params(copy.deepcopy(params))
-    config["enable_long"] = enable_long
-    config["enable_short"] = enable_short
+    config["enable_long"] = mode in ("combined", "long_only")
+    config["enable_short"] = mode in ("combined", "short_only")
+    return config
+
+
+def run_coupled_backtest(
+    asset: str,
+    recipe_config: dict[str, Any],
+    mode: str = "combined",
+    start_ts: str | None = None,
+    end_ts: str | None = None,
+) -> dict[str, Any]:
+    data = load_data(asset, data_dir="data", start=start_ts or None, end=end_ts or None)
+    return run_coupled_backtest_on_data(data, recipe_config, mode)
 
-    data = load_data(asset, data_dir="data")
-    data = _slice_data(data, start_ts, end_ts)
 
+def run_coupled_backtest_on_data(
+    data: pd.DataFrame,
+    recipe_config: dict[str, Any],
+    mode: str = "combined",
+) -> dict[str, Any]:
+    """``run_coupled_backtest`` on already loaded OHLCV ``data``."""
+    config = coupled_strategy_config(recipe_config, mode)
     strategy = _instantiate_strategy(FinalTriggerStrategy, config)
     backtester = VectorizedBacktester(BacktestConfig())
     result = backtester.run(data, strategy)
@@ -0,0 +1,170 @@
+"""Float32 bar returns of v4.2 coupled candidates, written and read by baseline and PBO."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.data.returns_store import DTYPE, ReturnsMatrixStore
+from crypto_backtest.v4.artifacts import get_run_root
+
+INDEX_FILE = "bar_index.npy"
+
+
+def backtest_key(
+    recipe_config: dict[str, Any],
+    mode: str,
+    start_ts: str | None = None,
+    end_ts: str | None = None,
+) -> str:
+    """Identify the backtest ``run_coupled_backtest`` would run for these arguments."""
+    from crypto_backtest.v4.backtest_adapter import coupled_strategy_config
+
+    spec = {
+        "config": coupled_strategy_config(recipe_config, mode),
+        "start_ts": start_ts or None,
+        "end_ts": end_ts or None,
+    }
+    encoded = json.dumps(spec, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class BarReturnsStore:
+    """Candidate bar-return vectors of one run under ``<run_root>/screening``.
+
+    Only baseline selection and the PBO stage write here; despite the
+    directory name, screening itself stores no vectors. Each vector is a
+    float32 row of a ``ReturnsMatrixStore`` tagged with the ``backtest_key``
+    of the run it came from, so a backtest is stored once however many
+    couples or stages use it. All rows share one timestamp
+    index, saved as int64 nanoseconds in ``bar_index.npy``; ``add`` rejects
+    vectors of any other window.
+    """
+
+    def __init__(self, asset: str, run_id: str, root_dir: str | Path | None = None) -> None:
+        if root_dir is None:
+            root_dir = get_run_root(asset, run_id) / "screening"
+        self.directory = Path(root_dir)
+        self.matrix_store = ReturnsMatrixStore(self.directory, asset, run_id)
+        self._rows: dict[str, int] | None = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / INDEX_FILE
+
+    @property
+    def index(self) -> pd.DatetimeIndex | None:
+        if not self.index_path.exists():
+            return None
+        return pd.DatetimeIndex(np.load(self.index_path).view("M8[ns]")).tz_localize("UTC")
+
+    def rows(self) -> dict[str, int]:
+        """``backtest_key`` -> row number of every stored vector."""
+        if self._rows is None:
+            self._rows = {}
+            if self.matrix_store.exists():
+                for trial in self.matrix_store.metadata()["trials"]:
+                    key = trial["params"].get("key")
+                    if key is not None:
+                        self._rows[key] = trial["row"]
+        return self._rows
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rows()
+
+    def add(
+        self,
+        key: str,
+        bar_returns: np.ndarray,
+        index: pd.Index,
+        params: dict[str, Any] | None = None,
+    ) -> int | None:
+        """Store one vector (``index`` labels its bars); return its row, None if empty."""
+        rows = self.rows()
+        if key in rows:
+            return rows[key]
+        if len(bar_returns) == 0:
+            return None
+        if len(index) != len(bar_returns):
+            raise ValueError("index and bar_returns lengths differ")
+        index = pd.DatetimeIndex(index)
+        index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+        stamps = index.as_unit("ns").asi8
+        if self.index_path.exists():
+            stored = np.load(self.index_path)
+            if not np.array_equal(stamps, stored):
+                raise ValueError(
+                    f"bar index of {key} ({len(stamps)} bars) does not match the store's "
+                    f"bar_index.npy ({len(stored)} bars); vectors must cover the same window"
+                )
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as handle:
+                np.save(handle, stamps)
+            os.replace(tmp_path, self.index_path)
+        row = self.matrix_store.append(
+            np.asarray(bar_returns, dtype=DTYPE),
+            params={"key": key, **(params or {})},
+            index=index,
+        )
+        rows[key] = row
+        return row
+
+    def add_result(
+        self, key: str, result: dict[str, Any], params: dict[str, Any] | None = None
+    ) -> int | None:
+        """Store the bar returns of a ``run_coupled_backtest`` result."""
+        equity_curve = result.get("equity_curve")
+        if equity_curve is None or len(equity_curve) < 2:
+            return None
+        return self.add(key, result["bar_returns"], equity_curve.index[1:], params)
+
+    def matrix(self, keys: Sequence[str]) -> np.ndarray:
+        """(len(keys), T) float32 matrix of the stored vectors, in ``keys`` order."""
+        rows = self.rows()
+        missing = [key for key in keys if key not in rows]
+        if missing:
+            raise KeyError(f"{len(missing)} bar-return vectors are not stored")
+        if not keys:
+            return np.empty((0, 0), dtype=DTYPE)
+        return self.matrix_store.load([rows[key] for key in keys])
+
+
+def coupled_returns_matrix(
+    asset: str,
+    run_id: str,
+    recipe_configs: Sequence[dict[str, Any]],
+    mode: str = "combined",
+    start_ts: str | None = None,
+    end_ts: str | None = None,
+    store: BarReturnsStore | None = None,
+) -> np.ndarray:
+    """K x T float32 bar returns of ``recipe_configs``, read from the run's store.
+
+    Backtests not stored yet are run once each (duplicates share a run) and
+    added to the store; recipes without returns are left out of the matrix.
+    """
+    from crypto_backtest.v4.backtest_adapter import run_coupled_backtest
+
+    store = store or BarReturnsStore(asset, run_id)
+    keys = []
+    for recipe_config in recipe_configs:
+        key = backtest_key(recipe_config, mode, start_ts, end_ts)
+        if key not in store:
+            result = run_coupled_backtest(
+                asset=asset,
+                recipe_config=recipe_config,
+                mode=mode,
+                start_ts=start_ts,
+                end_ts=end_ts,
+            )
+            store.add_result(key, result, {"mode": mode})
+        if key in store:
+            keys.append(key)
+    return store.matrix(keys)
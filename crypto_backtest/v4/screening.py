@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import json
+import math
 import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
 from crypto_backtest.v4.artifacts import get_run_root, ensure_run_dirs
 
 
@@ -65,27 +70,57 @@ def _sample_params(rng: random.Random, family_cfg: dict[str, Any]) -> dict[str,
     return params
 
 
-def _run_trial(
-    asset: str,
-    params: dict[str, Any],
-    mode: str,
-    start_ts: str | None,
-    end_ts: str | None,
-) -> dict[str, Any]:
+@dataclass(frozen=True)
+class ScreeningSettings:
+    """Trial budget and executor of one screening run (``policy.screening``)."""
+
+    trials: int = TRIALS
+    top_k: int = TOP_K
+    workers: int = 1
+    chunk_size: int | None = None  # None: about four chunks per worker.
+
+    def __post_init__(self) -> None:
+        if self.trials < 1 or self.top_k < 1:
+            raise ValueError("trials and top_k must be >= 1")
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+    def chunks(self) -> list[range]:
+        size = self.chunk_size or max(1, math.ceil(self.trials / (4 * self.workers)))
+        return [range(start, min(start + size, self.trials)) for start in range(0, self.trials, size)]
+
+
+def screening_settings(policy_cfg: dict[str, Any]) -> ScreeningSettings:
+    """Settings from ``policy.screening`` in families.yaml; missing keys use the defaults."""
+    cfg = policy_cfg.get("screening") or {}
+    return ScreeningSettings(
+        trials=int(cfg.get("trials") or TRIALS),
+        top_k=int(cfg.get("top_k") or TOP_K),
+        workers=int(cfg.get("workers") or 1),
+        chunk_size=int(cfg["chunk_size"]) if cfg.get("chunk_size") else None,
+    )
+
+
+def _trial_data(asset: str, start_ts: str | None, end_ts: str | None) -> pd.DataFrame:
+    from crypto_backtest.optimization.parallel_optimizer import load_data
+
+    return load_data(asset, data_dir="data", start=start_ts or None, end=end_ts or None)
+
+
+def _trial_backtest(data: pd.DataFrame, params: dict[str, Any], mode: str) -> dict[str, Any]:
     try:
-        from crypto_backtest.v4.backtest_adapter import run_coupled_backtest
+        from crypto_backtest.v4.backtest_adapter import run_coupled_backtest_on_data
     except ModuleNotFoundError as exc:
         raise ImportError(
             "backtest_adapter.run_coupled_backtest not available (see PROMPT 13C)"
         ) from exc
 
-    result = run_coupled_backtest(
-        asset=asset,
-        recipe_config=params,
-        mode=mode,
-        start_ts=start_ts,
-        end_ts=end_ts,
-    )
+    return run_coupled_backtest_on_data(data, params, mode)
+
+
+def _candidate(params: dict[str, Any], result: dict[str, Any]) -> dict[str, Any]:
     metrics = result.get("metrics", result)
     score = result.get("score")
     if score is None:
@@ -99,6 +134,27 @@ def _run_trial(
     }
 
 
+def _ranked(candidates: list[dict[str, Any]]) -> list[int]:
+    """Candidate positions by descending score, ties (and NaN last) in trial order."""
+
+    def key(i: int) -> float:
+        score = candidates[i].get("score", 0.0)
+        return score if score == score else -math.inf
+
+    return sorted(range(len(candidates)), key=key, reverse=True)
+
+
+def _screen_chunk(
+    asset: str,
+    mode: str,
+    data_end_ts: str | None,
+    params_chunk: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Backtest a chunk of trials on data loaded once; return their candidates."""
+    data = _trial_data(asset, None, data_end_ts)
+    return [_candidate(params, _trial_backtest(data, params, mode)) for params in params_chunk]
+
+
 def _run_screening(
     asset: str,
     run_id: str,
@@ -106,19 +162,37 @@ def _run_screening(
     mode: str,
     data_end_ts: str | None,
     seed: int = DEFAULT_SEED,
+    settings: ScreeningSettings | None = None,
 ) -> dict[str, Any]:
+    """Backtest ``settings.trials`` seeded random trials and keep the top K.
+
+    All parameter sets are drawn from the seeded RNG up front, so the trials,
+    and the top K, are the same for any ``workers``/``chunk_size``. With
+    several workers the chunks run on a process pool that attaches the
+    asset's OHLCV from shared memory.
+    """
+    settings = settings or ScreeningSettings(trials=TRIALS, top_k=TOP_K)
     rng = random.Random(seed)
-    candidates = []
-    for _ in range(TRIALS):
-        params = _sample_params(rng, family_cfg)
-        candidate = _run_trial(asset, params, mode, None, data_end_ts)
-        candidates.append(candidate)
+    params_list = [_sample_params(rng, family_cfg) for _ in range(settings.trials)]
+    jobs = [
+        (asset, mode, data_end_ts, [params_list[i] for i in chunk])
+        for chunk in settings.chunks()
+    ]
+    if settings.workers > 1 and len(jobs) > 1:
+        from crypto_backtest.data.ohlcv_cache import share_ohlcv
+        from crypto_backtest.optimization.parallel_optimizer import data_path
+
+        workers = min(settings.workers, len(jobs))
+        with share_ohlcv([data_path(asset)]), ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(_screen_chunk, *zip(*jobs)))
+    else:
+        outputs = [_screen_chunk(*job) for job in jobs]
 
-    top_candidates = sorted(candidates, key=lambda c: c.get("score", 0.0), reverse=True)[:TOP_K]
+    candidates = [candidate for chunk_candidates in outputs for candidate in chunk_candidates]
     return {
-        "trials": TRIALS,
+        "trials": settings.trials,
         "seed": seed,
-        "top_candidates": top_candidates,
+        "top_candidates": [candidates[i] for i in _ranked(candidates)[: settings.top_k]],
     }
 
 
@@ -138,6 +212,7 @@ def run_screening_long(
         mode="long_only",
         data_end_ts=data_end_ts,
         seed=policy_cfg.get("random_seed", DEFAULT_SEED),
+        settings=screening_settings(policy_cfg),
     )
     out_path = run_root / "screening" / "screen_long.json"
     out_path.write_text(json.dumps(payload, indent=2, default=str))
@@ -160,6 +235,7 @@ def run_screening_short(
         mode="short_only",
         data_end_ts=data_end_ts,
         seed=policy_cfg.get("random_seed", DEFAULT_SEED),
+        settings=screening_settings(policy_cfg),
     )
     out_path = run_root / "screening" / "screen_short.json"
     out_path.write_text(json.dumps(payload, indent=2, default=str))
@@ -17,6 +17,7 @@ Key features:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from itertools import combinations
 from typing import Generator, List, Tuple, Optional
 
@@ -103,71 +104,33 @@ class CombinatorialPurgedKFold:
         Yields:
             train_indices, test_indices for each combination
         """
+        # Block boundaries depend only on the sample count and the
+        # configuration, so they are cached; index arrays are built lazily.
         n_samples = len(X)
-        split_size = n_samples // self.n_splits
-        embargo_size = int(n_samples * self.embargo_pct)
-
-        # Define split boundaries
-        split_bounds = []
-        for i in range(self.n_splits):
-            start = i * split_size
-            end = (i + 1) * split_size if i < self.n_splits - 1 else n_samples
-            split_bounds.append((start, end))
-
-        # Generate all combinations of test splits
-        all_splits = list(range(self.n_splits))
-        test_combinations = list(combinations(all_splits, self.n_test_splits))
-
-        for test_splits in test_combinations:
-            train_splits = [s for s in all_splits if s not in test_splits]
-
-            # Build test indices
-            test_indices = []
-            for s in test_splits:
-                start, end = split_bounds[s]
-                test_indices.extend(range(start, end))
-
-            # Build train indices with purging and embargo
-            train_indices = []
-            test_set = set(test_indices)
-
-            for s in train_splits:
-                start, end = split_bounds[s]
-                for idx in range(start, end):
-                    # Check purging: skip if too close to test set
-                    if self._is_purged(idx, test_set):
-                        continue
-                    # Check embargo: skip if in embargo period after test
-                    if self._is_embargoed(idx, test_splits, split_bounds, embargo_size):
-                        continue
-                    train_indices.append(idx)
-
-            yield np.array(train_indices), np.array(test_indices)
-
-    def _is_purged(self, idx: int, test_set: set) -> bool:
-        """Check if index should be purged (too close to test set)."""
-        if self.purge_gap == 0:
-            return False
-        for test_idx in test_set:
-            if abs(idx - test_idx) <= self.purge_gap:
-                return True
-        return False
-
-    def _is_embargoed(
-        self,
-        idx: int,
-        test_splits: tuple,
-        split_bounds: List[Tuple[int, int]],
-        embargo_size: int,
-    ) -> bool:
-        """Check if index falls in embargo period after test set."""
-        if embargo_size == 0:
-            return False
-        for s in test_splits:
-            _, test_end = split_bounds[s]
-            if test_end <= idx < test_end + embargo_size:
-                return True
-        return False
+        blocks = _split_blocks(
+            n_samples,
+            self.n_splits,
+            self.n_test_splits,
+            self.purge_gap,
+            self.embargo_pct,
+        )
+        positions = np.arange(n_samples)
+        for test_blocks, excluded_blocks in blocks:
+            test_mask = np.zeros(n_samples, dtype=bool)
+            excluded = np.zeros(n_samples, dtype=bool)
+            for start, end in test_blocks:
+                test_mask[start:end] = True
+            for start, end in excluded_blocks:
+                excluded[start:end] = True
+
+            train_indices = positions[~(test_mask | excluded)]
+            test_indices = positions[test_mask]
+            # Empty index lists have always been returned as float arrays.
+            if not train_indices.size:
+                train_indices = np.array([])
+            if not test_indices.size:
+                test_indices = np.array([])
+            yield train_indices, test_indices
 
     def get_all_splits(
         self,
@@ -192,6 +155,41 @@ class CombinatorialPurgedKFold:
         return splits
 
 
+@lru_cache(maxsize=32)
+def _split_blocks(
+    n_samples: int,
+    n_splits: int,
+    n_test_splits: int,
+    purge_gap: int,
+    embargo_pct: float,
+) -> Tuple[Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]], ...]:
+    """
+    (test, excluded) ``[start, end)`` intervals of every CPCV combination.
+
+    Each test block [start, end) purges [start - purge_gap, end + purge_gap)
+    (every index within ``purge_gap`` of a test index) and embargoes
+    [end, end + embargo_size) from the training set.
+    """
+    split_size = n_samples // n_splits
+    embargo_size = int(n_samples * embargo_pct)
+    starts = [i * split_size for i in range(n_splits)]
+    ends = starts[1:] + [n_samples]
+
+    blocks = []
+    for test_splits in combinations(range(n_splits), n_test_splits):
+        test_blocks = []
+        excluded_blocks = []
+        for s in test_splits:
+            start, end = starts[s], ends[s]
+            test_blocks.append((start, end))
+            if purge_gap > 0 and end > start:
+                excluded_blocks.append((max(start - purge_gap, 0), end + purge_gap))
+            if embargo_size > 0:
+                excluded_blocks.append((end, end + embargo_size))
+        blocks.append((tuple(test_blocks), tuple(excluded_blocks)))
+    return tuple(blocks)
+
+
 def validate_with_cpcv(
     data: pd.DataFrame,
     strategy_func,
@@ -0,0 +1,119 @@
+"""Batched Monte Carlo permutation engines for the MC guards."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+
+from crypto_backtest.analysis.metrics import compute_core_metrics_matrix
+
+# Upper bound for one (iterations x bars) float64 equity block. Small blocks
+# keep the temporaries cache-sized and reuse the allocator's freed memory.
+MAX_CHUNK_BYTES = 4 * 2**20
+
+
+def iteration_chunks(
+    iterations: int, n_bars: int, max_bytes: int = MAX_CHUNK_BYTES
+) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, stop)`` iteration ranges whose equity block fits ``max_bytes``."""
+    rows = max(1, max_bytes // max(1, n_bars * 8))
+    for start in range(0, iterations, rows):
+        yield start, min(start + rows, iterations)
+
+
+def random_entry_equity(
+    prices: np.ndarray,
+    durations: np.ndarray,
+    signs: np.ndarray,
+    quantities: np.ndarray,
+    cost_rate: float,
+    initial_capital: float,
+    uniforms: np.ndarray,
+) -> np.ndarray:
+    """Equity curves with each trade moved to a random entry bar.
+
+    ``uniforms`` is an (iterations, trades) array in [0, 1); trade ``j`` of
+    row ``i`` enters at ``int(uniforms[i, j] * (n_bars - durations[j]))`` and
+    keeps its duration, direction and size. PnL net of costs is booked on the
+    exit bar. Returns an (iterations, n_bars) equity matrix.
+    """
+    n_rows = uniforms.shape[0]
+    n_bars = len(prices)
+    entry_idx = (uniforms * (n_bars - durations)).astype(int)
+    exit_idx = entry_idx + durations
+
+    entry_price = prices[entry_idx]
+    exit_price = prices[exit_idx]
+    pnl = signs * (exit_price - entry_price) * quantities
+    costs = cost_rate * (np.abs(entry_price) + np.abs(exit_price)) * quantities
+
+    # Scatter per-row PnL into flat (row, exit bar) cells; bincount adds in
+    # trade order, like np.add.at on a single curve.
+    cells = (np.arange(n_rows)[:, None] * n_bars + exit_idx).ravel()
+    pnl_by_exit = np.bincount(cells, weights=(pnl - costs).ravel(), minlength=n_rows * n_bars)
+    return initial_capital + np.cumsum(pnl_by_exit.reshape(n_rows, n_bars), axis=1)
+
+
+def trade_permutation_metrics(
+    prices: np.ndarray,
+    durations: np.ndarray,
+    signs: np.ndarray,
+    quantities: np.ndarray,
+    cost_rate: float,
+    initial_capital: float,
+    iterations: int,
+    rng: np.random.Generator,
+    periods_per_year: float,
+    max_bytes: int = MAX_CHUNK_BYTES,
+) -> dict[str, np.ndarray]:
+    """Core metrics of ``iterations`` random-entry curves, built in bounded chunks.
+
+    Draws the same random stream as one ``rng.random(n_trades)`` call per
+    iteration, so results match a sequential loop for the same generator.
+    """
+    prices = np.asarray(prices, dtype=float)
+    durations = np.asarray(durations, dtype=np.int64)
+    metrics = _empty_metrics(iterations)
+    for start, stop in iteration_chunks(iterations, len(prices), max_bytes):
+        uniforms = rng.random((stop - start, len(durations)))
+        equity = random_entry_equity(
+            prices, durations, signs, quantities, cost_rate, initial_capital, uniforms
+        )
+        _store(metrics, start, stop, compute_core_metrics_matrix(equity, periods_per_year))
+    return metrics
+
+
+def bootstrap_return_metrics(
+    bar_returns: np.ndarray,
+    scale: float,
+    initial_capital: float,
+    iterations: int,
+    rng: np.random.Generator,
+    periods_per_year: float,
+    max_bytes: int = MAX_CHUNK_BYTES,
+) -> dict[str, np.ndarray]:
+    """Core metrics of curves compounding bar returns resampled with replacement.
+
+    Each curve is ``initial_capital * cumprod(1 + choice(bar_returns) * scale)``
+    with the same stream as one ``rng.choice`` call per iteration.
+    """
+    bar_returns = np.asarray(bar_returns, dtype=float)
+    n_steps = len(bar_returns)
+    metrics = _empty_metrics(iterations)
+    for start, stop in iteration_chunks(iterations, n_steps, max_bytes):
+        sampled = rng.choice(bar_returns, size=(stop - start, n_steps))
+        equity = initial_capital * np.cumprod(1 + sampled * scale, axis=1)
+        _store(metrics, start, stop, compute_core_metrics_matrix(equity, periods_per_year))
+    return metrics
+
+
+def _empty_metrics(iterations: int) -> dict[str, np.ndarray]:
+    return {key: np.zeros(iterations) for key in ("total_return", "sharpe_ratio", "max_drawdown")}
+
+
+def _store(
+    metrics: dict[str, np.ndarray], start: int, stop: int, chunk: dict[str, np.ndarray]
+) -> None:
+    for key, values in chunk.items():
+        metrics[key][start:stop] = values
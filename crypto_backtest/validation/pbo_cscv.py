@@ -23,6 +23,7 @@ Usage:
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
@@ -44,9 +45,11 @@ class CSCVConfig:
     min_bars_per_fold: int = 500  # Minimum data requirement
     max_paths: Optional[int] = None  # Limit paths for speed (None = all)
     random_seed: int = 42  # For reproducible path sampling
+    n_jobs: int = 1  # Worker processes for path evaluation (1 = in-process)
 
 
 DEFAULT_CONFIG = CSCVConfig()
+PATHS_PER_CHUNK = 1024
 
 
 # =============================================================================
@@ -163,55 +166,41 @@ def cscv_pbo(
             f"Set config.max_paths=None for full CSCV."
         )
     
-    # Step 3: Compute lambda for each path
-    lambda_values = []
-    omega_values = []
-    degradation_ratios = []
-    
-    for is_fold_ids in all_is_combinations:
-        oos_fold_ids = tuple(i for i in range(config.n_folds) if i not in is_fold_ids)
-        
-        # Get bar indices for IS and OOS with purge gap
-        is_bars, oos_bars = _get_purged_indices(
-            fold_indices, is_fold_ids, oos_fold_ids, config.purge_gap
-        )
-        
-        if len(is_bars) < config.min_bars_per_fold or len(oos_bars) < config.min_bars_per_fold:
-            continue  # Skip if insufficient data after purging
-        
-        # Compute Sharpe for each trial on IS and OOS
-        is_sharpes = np.array([
-            _compute_sharpe(returns_matrix[t, is_bars], config.annualization_factor)
-            for t in range(n_trials)
-        ])
-        oos_sharpes = np.array([
-            _compute_sharpe(returns_matrix[t, oos_bars], config.annualization_factor)
-            for t in range(n_trials)
-        ])
-        
-        # Find best trial on IS
-        best_is_idx = np.argmax(is_sharpes)
-        best_is_sharpe = is_sharpes[best_is_idx]
-        
-        # Get OOS performance of best IS trial
-        best_trial_oos_sharpe = oos_sharpes[best_is_idx]
-        
-        # Compute relative rank omega (omega) per Bailey & Lopez de Prado (2014)
-        # omega = rank / (N + 1) in (0, 1), avoids omega = 0 or 1
-        rank = np.sum(oos_sharpes <= best_trial_oos_sharpe)
-        omega = rank / (n_trials + 1)
+    # Step 3: Compute lambda for each path from fold-level aggregates
+    is_member = np.zeros((len(all_is_combinations), config.n_folds), dtype=bool)
+    for path, is_fold_ids in enumerate(all_is_combinations):
+        is_member[path, list(is_fold_ids)] = True
+
+    aggregates = _fold_aggregates(returns_matrix, fold_indices, config.purge_gap)
+    # Paths are evaluated in blocks to bound the (paths x trials) working set
+    n_chunks = max(config.n_jobs, -(-len(is_member) // PATHS_PER_CHUNK))
+    chunks = np.array_split(is_member, min(n_chunks, len(is_member)))
+    if config.n_jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(config.n_jobs, len(chunks))) as executor:
+            evaluated = list(
+                executor.map(
+                    _evaluate_paths,
+                    chunks,
+                    [aggregates] * len(chunks),
+                    [config] * len(chunks),
+                )
+            )
+    else:
+        evaluated = [_evaluate_paths(chunk, aggregates, config) for chunk in chunks]
+    omega_all, best_is_all, best_oos_all = (
+        np.concatenate(parts) for parts in zip(*evaluated)
+    )
 
-        # Compute logit lambda = ln(omega / (1 - omega)) in (-inf, +inf)
-        # lambda < 0 iff omega < 0.5 (underperformance)
-        lambda_val = np.log(omega / (1 - omega))
+    # Paths with insufficient data after purging are flagged with NaN
+    valid = ~np.isnan(omega_all)
+    omega_values = omega_all[valid].tolist()
+    lambda_values = np.log(omega_all[valid] / (1 - omega_all[valid])).tolist()
+
+    # Track degradation (OOS/IS performance ratio)
+    best_is_valid = best_is_all[valid]
+    positive = best_is_valid > 0
+    degradation_ratios = (best_oos_all[valid][positive] / best_is_valid[positive]).tolist()
 
-        omega_values.append(omega)
-        lambda_values.append(lambda_val)
-        
-        # Track degradation (OOS/IS performance ratio)
-        if best_is_sharpe > 0:
-            degradation_ratios.append(best_trial_oos_sharpe / best_is_sharpe)
-    
     if not lambda_values:
         raise ValueError("No valid paths computed. Check data size and purge gap.")
     
@@ -594,6 +583,122 @@ def _get_purged_indices(
     return np.array(is_bars), np.array(oos_bars)
 
 
+def _fold_aggregates(
+    returns_matrix: np.ndarray,
+    fold_indices: List[Tuple[int, int]],
+    purge_gap: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-fold bar counts, sums and sums of squares under every purge state.
+
+    State 0 keeps the whole fold, 1 purges its first ``purge_gap`` bars
+    (previous fold on the other side), 2 its last ``purge_gap`` bars (next
+    fold on the other side), 3 both. Returns are centered on each trial's
+    mean before accumulation to keep the variance numerically stable.
+
+    Returns (counts (4, F), sums (4, T, F), squares (4, T, F), trial_means (T,)).
+    """
+    n_trials, n_bars = returns_matrix.shape
+    n_folds = len(fold_indices)
+    # Accumulate in float64 even for float32 (memory-mapped) inputs
+    trial_means = returns_matrix.mean(axis=1, dtype=np.float64)
+    centered = returns_matrix - trial_means[:, None]
+
+    def bounds(fold_start: int, fold_end: int, state: int) -> Tuple[int, int]:
+        start = fold_start + purge_gap if state & 1 else fold_start
+        end = fold_end - purge_gap if state & 2 else fold_end
+        return start, end
+
+    # Prefix sums are only needed at fold/purge boundaries, so accumulate
+    # segment sums between those points instead of over every bar.
+    points = {0, n_bars}
+    for fold_start, fold_end in fold_indices:
+        for state in range(4):
+            start, end = bounds(fold_start, fold_end, state)
+            if start < end:
+                points.update((start, end))
+    points = np.array(sorted(points))
+    column = {int(point): i for i, point in enumerate(points)}
+
+    zeros = np.zeros((n_trials, 1))
+    prefix = np.hstack(
+        [zeros, np.cumsum(np.add.reduceat(centered, points[:-1], axis=1), axis=1)]
+    )
+    prefix_sq = np.hstack(
+        [zeros, np.cumsum(np.add.reduceat(centered * centered, points[:-1], axis=1), axis=1)]
+    )
+
+    counts = np.zeros((4, n_folds))
+    sums = np.zeros((4, n_trials, n_folds))
+    squares = np.zeros((4, n_trials, n_folds))
+    for fold_id, (fold_start, fold_end) in enumerate(fold_indices):
+        for state in range(4):
+            start, end = bounds(fold_start, fold_end, state)
+            if start < end:
+                a, b = column[start], column[end]
+                counts[state, fold_id] = end - start
+                sums[state, :, fold_id] = prefix[:, b] - prefix[:, a]
+                squares[state, :, fold_id] = prefix_sq[:, b] - prefix_sq[:, a]
+    return counts, sums, squares, trial_means
+
+
+def _evaluate_paths(
+    is_member: np.ndarray,
+    aggregates: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    config: CSCVConfig,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate a block of CSCV paths.
+
+    ``is_member`` is a (paths, folds) mask of IS folds. Returns omega, the
+    best IS trial's IS Sharpe and its OOS Sharpe per path; omega is NaN for
+    paths skipped for insufficient data.
+    """
+    counts, sums, squares, trial_means = aggregates
+    n_trials = sums.shape[1]
+
+    # A fold boundary is purged when the neighbouring fold is on the other side
+    boundary = is_member[:, 1:] != is_member[:, :-1]
+    state = np.zeros(is_member.shape, dtype=np.int64)
+    state[:, 1:] += boundary
+    state[:, :-1] += 2 * boundary
+
+    def side_sharpes(member: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        n = np.zeros(len(member))
+        total = np.zeros((len(member), n_trials))
+        total_sq = np.zeros((len(member), n_trials))
+        for s in range(4):
+            weights = (member & (state == s)).astype(float)
+            n += weights @ counts[s]
+            total += weights @ sums[s].T
+            total_sq += weights @ squares[s].T
+
+        n_col = n[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_centered = total / n_col
+            var = (total_sq - total * mean_centered) / (n_col - 1)
+            std = np.sqrt(np.maximum(var, 0.0))
+            sharpe = (mean_centered + trial_means) / std * config.annualization_factor
+        sharpe = np.where((n_col < 2) | (std < 1e-10), 0.0, sharpe)
+        return sharpe, n
+
+    is_sharpes, is_n = side_sharpes(is_member)
+    oos_sharpes, oos_n = side_sharpes(~is_member)
+
+    rows = np.arange(len(is_member))
+    best_is_idx = np.argmax(is_sharpes, axis=1)
+    best_is_sharpe = is_sharpes[rows, best_is_idx]
+    best_trial_oos_sharpe = oos_sharpes[rows, best_is_idx]
+
+    # omega = rank / (N + 1) in (0, 1), per Bailey & Lopez de Prado (2014)
+    rank = np.sum(oos_sharpes <= best_trial_oos_sharpe[:, None], axis=1)
+    omega = rank / (n_trials + 1)
+
+    valid = (is_n >= config.min_bars_per_fold) & (oos_n >= config.min_bars_per_fold)
+    omega = np.where(valid, omega, np.nan)
+    return omega, best_is_sharpe, best_trial_oos_sharpe
+
+
 def _compute_sharpe(returns: np.ndarray, annualization: float) -> float:
     """Compute annualized Sharpe ratio."""
     if len(returns) < 2:
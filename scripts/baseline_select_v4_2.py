@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from crypto_backtest.optimization.parallel_optimizer import load_data
 from crypto_backtest.v4.artifacts import get_run_root, ensure_run_dirs
+from crypto_backtest.v4.bar_returns import BarReturnsStore, backtest_key
 from crypto_backtest.v4.config import load_yaml, get_policy
 
 
@@ -229,18 +230,27 @@ def main() -> None:
     best = None
     best_result = None
     best_score = float("-inf")
+    # Couples that simulate the same backtest share one run, and its bar
+    # returns are stored for the PBO stage.
+    store = BarReturnsStore(args.asset, args.run_id)
+    results_by_key: dict[str, dict] = {}
     for candidate in candidates:
         recipe_config = {
             "long_params": candidate["long"].get("params", {}),
             "short_params": candidate["short"].get("params", {}),
         }
-        result = run_coupled_backtest(
-            asset=args.asset,
-            recipe_config=recipe_config,
-            mode="combined",
-            start_ts=None,
-            end_ts=data_end_ts,
-        )
+        key = backtest_key(recipe_config, "combined", None, data_end_ts)
+        result = results_by_key.get(key)
+        if result is None:
+            result = run_coupled_backtest(
+                asset=args.asset,
+                recipe_config=recipe_config,
+                mode="combined",
+                start_ts=None,
+                end_ts=data_end_ts,
+            )
+            results_by_key[key] = result
+            store.add_result(key, result, {"mode": "combined"})
         metrics = result.get("metrics", result)
         score = _score_from_metrics(metrics)
         if score > best_score:
@@ -0,0 +1,47 @@
+"""
+Convert cached CSV/parquet OHLCV files to the native .ohlcv layout
+read by load_data (see crypto_backtest/data/columnar.py).
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+
+from crypto_backtest.data.columnar import SUFFIX, OHLCVFile
+from crypto_backtest.data.ohlcv_cache import read_ohlcv
+from crypto_backtest.optimization.parallel_optimizer import data_path
+
+
+def convert_asset(asset: str, data_dir: str = "data") -> Path:
+    """Write ``{asset}_1H.ohlcv`` next to the asset's CSV/parquet file."""
+    source = data_path(asset, data_dir)
+    target = Path(data_dir) / f"{asset}_1H{SUFFIX}"
+    if source == target:
+        return target
+    data = read_ohlcv(source)
+    data = data[~data.index.duplicated(keep="last")].sort_index()
+    OHLCVFile.write(target, data)
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert OHLCV files to the native layout")
+    parser.add_argument("--assets", nargs="+", required=True, help="Assets to convert")
+    parser.add_argument("--data-dir", default="data", help="Data directory")
+    args = parser.parse_args()
+
+    for asset in args.assets:
+        try:
+            target = convert_asset(asset, args.data_dir)
+        except FileNotFoundError as exc:
+            print(f"  [SKIP] {asset}: {exc}")
+            continue
+        header = OHLCVFile(target).header
+        print(f"  [OK] {asset}: {header.n_rows} bars -> {target}")
+
+
+if __name__ == "__main__":
+    main()
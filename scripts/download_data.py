@@ -8,81 +8,26 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import ccxt
 import pandas as pd
-from datetime import datetime, timedelta
-import time
+from datetime import timedelta
 import argparse
 
 from crypto_backtest.config.scan_assets import ALL_ASSETS, SCAN_ASSETS, EXCHANGE_MAP
+from crypto_backtest.data.columnar import SUFFIX as OHLCV_SUFFIX, OHLCVFile
+from crypto_backtest.data.downloader import ConcurrentDownloader, DownloadJob
 
 
-def download_asset(
-    asset: str,
-    timeframe: str = "1h",
-    days_back: int = 730,
-    output_dir: str = "data"
-) -> pd.DataFrame:
-    """Download OHLCV data for a single asset."""
-
-    exchange_id = EXCHANGE_MAP.get(asset, "binance")
-
-    try:
-        exchange = getattr(ccxt, exchange_id)({"enableRateLimit": True})
-    except AttributeError:
-        raise ValueError(f"Unknown exchange: {exchange_id}")
-
-    symbol = f"{asset}/USDT"
-
-    # Calculate start timestamp
-    start_date = datetime.utcnow() - timedelta(days=days_back)
-    since = exchange.parse8601(start_date.isoformat())
-
-    all_ohlcv = []
-    batch_count = 0
-
-    while True:
-        try:
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since, limit=1000)
-        except Exception as e:
-            print(f"    Error fetching {symbol}: {e}")
-            break
-
-        if not ohlcv:
-            break
-
-        all_ohlcv.extend(ohlcv)
-        batch_count += 1
-
-        # Progress indicator
-        if batch_count % 10 == 0:
-            print(f"    {asset}: {len(all_ohlcv)} bars...", end="\r")
+def _native_since_ms(native: OHLCVFile) -> int | None:
+    """First bar to fetch for an existing native file, from its header."""
+    if native.exists() and native.header.n_rows:
+        return native.header.end_ns // 1_000_000 + 1
+    return None
 
-        # Move cursor forward
-        since = ohlcv[-1][0] + 1
-
-        # Check if we've reached the end
-        if len(ohlcv) < 1000:
-            break
-
-        # Respect rate limits
-        time.sleep(exchange.rateLimit / 1000)
-
-    if not all_ohlcv:
-        return pd.DataFrame()
-
-    # Create DataFrame
-    df = pd.DataFrame(
-        all_ohlcv,
-        columns=["timestamp", "open", "high", "low", "close", "volume"]
-    )
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-    df.set_index("timestamp", inplace=True)
-
-    # Remove duplicates
-    df = df[~df.index.duplicated(keep="first")]
-    df = df.sort_index()
 
+def _to_download_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Downloader output as a frame indexed by naive UTC timestamps."""
+    df = data.set_index("timestamp")
+    df.index = df.index.tz_localize(None)
     return df
 
 
@@ -91,9 +36,18 @@ def download_all(
     output_dir: str = "data",
     timeframe: str = "1h",
     days_back: int = 730,
-    format: str = "parquet"
+    format: str = "parquet",
+    workers: int = 8,
+    checkpoint_dir: str | None = None,
 ):
-    """Download data for multiple assets."""
+    """Download data for multiple assets.
+
+    Pages of every asset are fetched concurrently by ``ConcurrentDownloader``
+    with one rate limiter per exchange. Finished pages are checkpointed under
+    ``checkpoint_dir`` (default ``<output_dir>/.download_checkpoints``), so
+    rerunning after an interruption only fetches what is missing. The
+    ``ohlcv`` format appends only bars after each file's last one.
+    """
 
     assets = assets or ALL_ASSETS
     Path(output_dir).mkdir(exist_ok=True)
@@ -104,15 +58,49 @@ def download_all(
     print(f"Timeframe: {timeframe}")
     print(f"Days back: {days_back}")
     print(f"Output: {output_dir}/")
+    print(f"Workers: {workers}")
     print("=" * 60)
 
     results = {"success": [], "failed": []}
 
-    for i, asset in enumerate(assets, 1):
-        print(f"\n[{i}/{len(assets)}] Downloading {asset}...")
+    bar_ms = int(pd.Timedelta(timeframe).total_seconds() * 1000)
+    now = pd.Timestamp.now(tz="UTC")
+    now_ms = int(now.value // 1_000_000)
+    # On the bar grid, so a rerun plans the same pages and reuses checkpoints.
+    default_since = int((now - timedelta(days=days_back)).value // 1_000_000) // bar_ms * bar_ms
+    jobs = []
+    for asset in assets:
+        since_ms = default_since
+        until_ms = now_ms
+        if format == "ohlcv":
+            # The file is append-only: never store the still-open candle.
+            until_ms = now_ms // bar_ms * bar_ms
+            native_since = _native_since_ms(OHLCVFile(Path(output_dir) / f"{asset}_1H{OHLCV_SUFFIX}"))
+            since_ms = native_since if native_since is not None else default_since
+        jobs.append(
+            DownloadJob(EXCHANGE_MAP.get(asset, "binance"), f"{asset}/USDT", timeframe, since_ms, until_ms)
+        )
+
+    downloader = ConcurrentDownloader(
+        max_workers=workers,
+        checkpoint_dir=checkpoint_dir or Path(output_dir) / ".download_checkpoints",
+    )
+    fetched = downloader.fetch_many(jobs)
+
+    for i, (asset, result) in enumerate(zip(assets, fetched), 1):
+        print(f"\n[{i}/{len(assets)}] {asset}")
 
         try:
-            df = download_asset(asset, timeframe, days_back, output_dir)
+            if result.error is not None:
+                raise result.error
+            df = _to_download_frame(result.data)
+
+            if format == "ohlcv":
+                native = OHLCVFile(Path(output_dir) / f"{asset}_1H{OHLCV_SUFFIX}")
+                appended = native.append(df) if not df.empty else 0
+                print(f"  [OK] {asset}: +{appended:,} bars")
+                results["success"].append(asset)
+                continue
 
             if df.empty:
                 print(f"  [FAIL] {asset}: No data returned")
@@ -176,9 +164,15 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["parquet", "csv"],
+        choices=["parquet", "csv", "ohlcv"],
         default="parquet",
-        help="Output format (default: parquet)"
+        help="Output format (default: parquet; ohlcv appends only new bars)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent page requests across assets (default: 8)"
     )
     args = parser.parse_args()
 
@@ -191,7 +185,8 @@ def main():
         assets=assets,
         output_dir=args.output,
         days_back=args.days,
-        format=args.format
+        format=args.format,
+        workers=args.workers,
     )
 
 
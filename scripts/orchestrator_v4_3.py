@@ -13,7 +13,6 @@ import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-import crypto_backtest.v4.screening as screening_mod
 from scripts.artifacts import (
     get_artifact_path,
     ensure_artifact_dir,
@@ -27,8 +26,11 @@ from scripts.polish_oos import run_polish_oos_comparison, save_polish_oos_result
 from crypto_backtest.v4.config import load_yaml, resolve_family, get_policy
 from crypto_backtest.v4.screening import run_screening_long, run_screening_short
 from crypto_backtest.v4.artifacts import get_run_root, ensure_run_dirs
+from crypto_backtest.v4.bar_returns import BarReturnsStore, backtest_key, coupled_returns_matrix
 from crypto_backtest.optimization.parallel_optimizer import load_data
 
+FAST_SCREENING_TRIALS = 10
+
 
 class OrchestratorV43:
     """Main orchestrator for FINAL TRIGGER v4.3 pipeline."""
@@ -90,14 +92,10 @@ class OrchestratorV43:
 
             data_end_ts = self._compute_research_end(policy)
 
-            original_trials = screening_mod.TRIALS
             if state.get("fast_mode"):
-                screening_mod.TRIALS = 10
+                policy.setdefault("screening", {})["trials"] = FAST_SCREENING_TRIALS
 
-            try:
-                result_path = run_screening_long(asset, run_id, family_cfg, policy, data_end_ts)
-            finally:
-                screening_mod.TRIALS = original_trials
+            result_path = run_screening_long(asset, run_id, family_cfg, policy, data_end_ts)
 
             output_path = Path(result_path) if result_path else None
             if output_path is None or not output_path.exists():
@@ -133,14 +131,10 @@ class OrchestratorV43:
             family_cfg = resolve_family(self.config, family_id, rescue_level)
             data_end_ts = self._compute_research_end(policy)
 
-            original_trials = screening_mod.TRIALS
             if state.get("fast_mode"):
-                screening_mod.TRIALS = 10
+                policy.setdefault("screening", {})["trials"] = FAST_SCREENING_TRIALS
 
-            try:
-                result_path = run_screening_short(asset, run_id, family_cfg, policy, data_end_ts)
-            finally:
-                screening_mod.TRIALS = original_trials
+            result_path = run_screening_short(asset, run_id, family_cfg, policy, data_end_ts)
 
             output_path = Path(result_path) if result_path else None
             if output_path is None or not output_path.exists():
@@ -252,19 +246,28 @@ class OrchestratorV43:
             best_score = float("-inf")
             best_result = None
 
+            # Couples that simulate the same backtest share one run, and its
+            # bar returns are stored for the PBO stage.
+            store = BarReturnsStore(asset, run_id)
+            results_by_key: dict[str, dict] = {}
             max_candidates = 5 if state.get("fast_mode") else len(candidates)
             for candidate in candidates[:max_candidates]:
                 recipe_config = {
                     "long_params": candidate["long"].get("params", {}),
                     "short_params": candidate["short"].get("params", {}),
                 }
-                result = run_coupled_backtest(
-                    asset=asset,
-                    recipe_config=recipe_config,
-                    mode="combined",
-                    start_ts=None,
-                    end_ts=data_end_ts,
-                )
+                key = backtest_key(recipe_config, "combined", None, data_end_ts)
+                result = results_by_key.get(key)
+                if result is None:
+                    result = run_coupled_backtest(
+                        asset=asset,
+                        recipe_config=recipe_config,
+                        mode="combined",
+                        start_ts=None,
+                        end_ts=data_end_ts,
+                    )
+                    results_by_key[key] = result
+                    store.add_result(key, result, {"mode": "combined"})
                 metrics = result.get("metrics", {})
                 score = metrics.get("sharpe", metrics.get("score", 0))
 
@@ -449,7 +452,6 @@ class OrchestratorV43:
         self.log(f"[PBO_CSCV] {asset}/{run_id}")
 
         try:
-            from crypto_backtest.v4.backtest_adapter import run_coupled_backtest
             from crypto_backtest.validation.pbo_cscv import cscv_pbo_compat
 
             policy = get_policy(self.config)
@@ -467,33 +469,24 @@ class OrchestratorV43:
             coupled = json.loads(coupled_path.read_text())
             candidates = coupled.get("candidates", [])
 
-            # Collect returns from all candidates
-            returns_list = []
-            for candidate in candidates:
-                recipe_config = {
+            # K x T float32 returns, read from the run's BarReturnsStore; only
+            # couples the baseline stage did not simulate are run here.
+            recipe_configs = [
+                {
                     "long_params": candidate["long"].get("params", {}),
                     "short_params": candidate["short"].get("params", {}),
                 }
-                result = run_coupled_backtest(
-                    asset=asset,
-                    recipe_config=recipe_config,
-                    mode="combined",
-                    start_ts=None,
-                    end_ts=data_end_ts,
-                )
-                returns = self._extract_bar_returns(result)
-                if returns is not None and len(returns) > 0:
-                    returns_list.append(returns)
+                for candidate in candidates
+            ]
+            returns_matrix = coupled_returns_matrix(
+                asset, run_id, recipe_configs, mode="combined", start_ts=None, end_ts=data_end_ts
+            )
 
-            if not returns_list:
+            if returns_matrix.size == 0:
                 self.log("[PBO_CSCV] No returns data available")
                 state["cscv_pass"] = False
                 return state
 
-            # Stack returns matrix (K candidates x T bars)
-            min_len = min(len(r) for r in returns_list)
-            returns_matrix = np.stack([r[:min_len] for r in returns_list], axis=0).astype(np.float32)
-
             K, T = returns_matrix.shape
             self.log(f"[PBO_CSCV] Matrix K={K} candidates, T={T} bars")
 
@@ -670,47 +663,19 @@ class OrchestratorV43:
             "oos_trades": int(oos_trades),
         }
 
-    def _extract_bar_returns(self, result: dict) -> np.ndarray | None:
-        """Extract bar returns from backtest result."""
-        if "bar_returns" in result:
-            return np.asarray(result["bar_returns"], dtype=float)
-        if "returns" in result:
-            return np.asarray(result["returns"], dtype=float)
-        equity = result.get("equity_curve")
-        if equity is not None:
-            equity = np.asarray(equity, dtype=float)
-            if len(equity) < 2:
-                return None
-            return np.diff(equity) / equity[:-1]
-        return None
-
     # ================================================================
     # MAIN RUN METHOD
     # ================================================================
 
-    def run(
+    def initial_state(
         self,
         asset: str,
         run_id: str,
         family_id: str = "A",
-        dry_run: bool = False,
         fast_mode: bool = False,
     ) -> dict:
-        """
-        Run the full pipeline for an asset.
-
-        Args:
-            asset: Asset symbol (e.g., "ETH")
-            run_id: Run identifier (e.g., "v4.3_001")
-            family_id: Starting family ("A", "B", or "C")
-            dry_run: If True, don't execute actions
-
-        Returns:
-            Final state dictionary
-        """
-        self.log(f"Starting pipeline v{PIPELINE_VERSION} for {asset}/{run_id}")
-
-        initial_state = {
+        """State dict the pipeline starts from at ``INIT``."""
+        return {
             # Core identifiers
             "asset": asset,
             "run_id": run_id,
@@ -762,14 +727,35 @@ class OrchestratorV43:
             "rescue_level": "R1",
         }
 
+    def run(
+        self,
+        asset: str,
+        run_id: str,
+        family_id: str = "A",
+        dry_run: bool = False,
+        fast_mode: bool = False,
+    ) -> dict:
+        """
+        Run the full pipeline for an asset.
+
+        Args:
+            asset: Asset symbol (e.g., "ETH")
+            run_id: Run identifier (e.g., "v4.3_001")
+            family_id: Starting family ("A", "B", or "C")
+            dry_run: If True, don't execute actions
+
+        Returns:
+            Final state dictionary
+        """
+        self.log(f"Starting pipeline v{PIPELINE_VERSION} for {asset}/{run_id}")
+
+        initial_state = self.initial_state(asset, run_id, family_id, fast_mode)
+
         final_state = self.state_machine.run(
             initial_state="INIT", state=initial_state, dry_run=dry_run
         )
 
-        if final_state.get("_final_state") == "PROD_READY":
-            final_state["_success"] = True
-        elif final_state.get("_final_state") in ("REJECTED", "REJECT"):
-            final_state["_success"] = False
+        mark_outcome(final_state)
 
         self.state_machine.print_execution_log()
 
@@ -789,6 +775,15 @@ class OrchestratorV43:
         return final_state
 
 
+def mark_outcome(final_state: dict) -> dict:
+    """Set ``_success`` from the terminal state reached."""
+    if final_state.get("_final_state") == "PROD_READY":
+        final_state["_success"] = True
+    elif final_state.get("_final_state") in ("REJECTED", "REJECT"):
+        final_state["_success"] = False
+    return final_state
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="FINAL TRIGGER v4.3 Orchestrator")
     parser.add_argument("--asset", required=True, help="Asset symbol (e.g., ETH)")
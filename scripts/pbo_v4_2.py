@@ -5,14 +5,13 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any
 
-import numpy as np
 import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from crypto_backtest.v4.artifacts import get_run_root, ensure_run_dirs
+from crypto_backtest.v4.bar_returns import coupled_returns_matrix
 from crypto_backtest.v4.config import load_yaml, get_policy
 
 
@@ -31,33 +30,6 @@ def _compute_research_end(cfg: dict, policy: dict, override_end: str | None) ->
     return end_ts.isoformat()
 
 
-def _stack_returns_matrix(series_list: list[np.ndarray]) -> np.ndarray:
-    if not series_list:
-        return np.empty((0, 0), dtype=np.float32)
-    lengths = {len(series) for series in series_list}
-    min_len = min(lengths)
-    stacked = np.stack([series[:min_len] for series in series_list], axis=0)
-    return stacked.astype(np.float32, copy=False)
-
-
-def _extract_bar_returns(result: dict[str, Any]) -> np.ndarray | None:
-    if "bar_returns" in result and result["bar_returns"] is not None:
-        return np.asarray(result["bar_returns"], dtype=float)
-    if "returns" in result and result["returns"] is not None:
-        return np.asarray(result["returns"], dtype=float)
-    equity = result.get("equity_curve")
-    if equity is not None:
-        equity = np.asarray(equity, dtype=float)
-        if equity.size < 2:
-            return None
-        prev = equity[:-1]
-        diff = np.diff(equity)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            returns = np.where(prev != 0, diff / prev, 0.0)
-        return returns
-    return None
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(description="v4.2 calibrated PBO runners")
     parser.add_argument("--asset", required=True)
@@ -79,35 +51,28 @@ def main() -> None:
     coupled = json.loads(coupled_path.read_text())
     candidates = coupled.get("candidates", [])
 
-    try:
-        from crypto_backtest.v4.backtest_adapter import run_coupled_backtest
-    except ModuleNotFoundError as exc:
-        raise ImportError(
-            "backtest_adapter.run_coupled_backtest not available (see PROMPT 13C)"
-        ) from exc
-
-    returns_list: list[np.ndarray] = []
     warnings_list: list[str] = []
 
-    for candidate in candidates:
-        recipe_config = {
+    # Bar returns come from the run's screening store; couples the baseline
+    # stage did not simulate are backtested once and added to it.
+    recipe_configs = [
+        {
             "long_params": candidate["long"].get("params", {}),
             "short_params": candidate["short"].get("params", {}),
         }
-        result = run_coupled_backtest(
-            asset=args.asset,
-            recipe_config=recipe_config,
-            mode="combined",
-            start_ts=None,
-            end_ts=data_end_ts,
-        )
-        returns = _extract_bar_returns(result)
-        if returns is None:
-            warnings_list.append("Missing bar_returns for candidate")
-            continue
-        returns_list.append(returns)
-
-    returns_matrix = _stack_returns_matrix(returns_list)
+        for candidate in candidates
+    ]
+    returns_matrix = coupled_returns_matrix(
+        args.asset,
+        args.run_id,
+        recipe_configs,
+        mode="combined",
+        start_ts=None,
+        end_ts=data_end_ts,
+    )
+    for _ in range(len(candidates) - returns_matrix.shape[0]):
+        warnings_list.append("Missing bar_returns for candidate")
+
     K = int(returns_matrix.shape[0])
     T = int(returns_matrix.shape[1])
 
@@ -0,0 +1,357 @@
+"""Run the v4.3 pipeline of many assets concurrently, with resumable checkpoints."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from crypto_backtest.v4.artifacts import get_run_root
+from scripts.orchestrator_v4_3 import OrchestratorV43, mark_outcome
+
+# Actions sharing a resource class are capped together by ``--limit``;
+# actions not listed here are "light".
+RESOURCE_CLASSES = {
+    "run_screening_long": "screening",
+    "run_screening_short": "screening",
+    "run_baseline": "backtest",
+    "select_and_backtest_best_couple": "backtest",
+    "run_polish_oos_comparison": "backtest",
+    "run_pbo_cscv": "backtest",
+    "compute_pbo_cscv": "backtest",
+    "run_guards": "backtest",
+    "run_rescue": "backtest",
+}
+LIGHT = "light"
+DEFAULT_LIMITS = {"screening": 2, "backtest": 4}
+CHECKPOINT_FILE = "orchestrator_state.json"
+MAX_STEPS = 100
+
+# Orchestrators built by this process, keyed by factory and its arguments.
+_ORCHESTRATORS: dict[tuple, Any] = {}
+
+
+def _orchestrator(factory: Callable[..., Any], factory_args: tuple) -> Any:
+    key = (factory.__module__, factory.__qualname__, factory_args)
+    orchestrator = _ORCHESTRATORS.get(key)
+    if orchestrator is None:
+        orchestrator = _ORCHESTRATORS[key] = factory(*factory_args)
+    return orchestrator
+
+
+def _step(
+    factory: Callable[..., Any],
+    factory_args: tuple,
+    state_name: str,
+    state: dict[str, Any],
+    dry_run: bool,
+) -> tuple[str, dict[str, Any], float]:
+    """Execute one state in a worker; return the next state, the state dict and seconds."""
+    machine = _orchestrator(factory, factory_args).state_machine
+    machine.execution_history.clear()
+    start = time.perf_counter()
+    next_state, state = machine.execute_state(state_name, state, execute_actions=not dry_run)
+    return next_state, state, time.perf_counter() - start
+
+
+def resource_class(action: str | None) -> str:
+    return RESOURCE_CLASSES.get(action, LIGHT) if action else LIGHT
+
+
+def checkpoint_path(asset: str, run_id: str) -> Path:
+    return get_run_root(asset, run_id) / CHECKPOINT_FILE
+
+
+def load_checkpoint(asset: str, run_id: str) -> dict[str, Any] | None:
+    path = checkpoint_path(asset, run_id)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(
+        json.dumps(payload, indent=2, default=_json_default), encoding="utf-8"
+    )
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class AssetRun:
+    """Progress of one asset's state machine."""
+
+    asset: str
+    state_name: str
+    state: dict[str, Any]
+    steps: int = 0
+    done: bool = False
+    running: str | None = None  # Resource class of the state being executed.
+    seconds: float = 0.0
+    history: list[str] = field(default_factory=list)
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {
+            "asset": self.asset,
+            "state_name": self.state_name,
+            "steps": self.steps,
+            "done": self.done,
+            "seconds": round(self.seconds, 3),
+            "history": self.history,
+            "state": self.state,
+        }
+
+    def status(self) -> dict[str, Any]:
+        if self.done:
+            status = "error" if self.state.get("_final_state") == "ERROR" else "done"
+        else:
+            status = "running" if self.running else "pending"
+        return {
+            "status": status,
+            "state": self.state_name,
+            "resource": self.running,
+            "steps": self.steps,
+            "seconds": round(self.seconds, 3),
+            "final_state": self.state.get("_final_state"),
+            "success": self.state.get("_success"),
+            "error": self.state.get("_error"),
+        }
+
+
+def run_batch(
+    assets: Sequence[str],
+    run_id: str,
+    family_id: str = "A",
+    fast_mode: bool = False,
+    dry_run: bool = False,
+    workers: int = 1,
+    limits: dict[str, int] | None = None,
+    status_path: str | Path | None = None,
+    restart: bool = False,
+    orchestrator_factory: Callable[..., Any] = OrchestratorV43,
+    factory_args: tuple = ("configs/families.yaml",),
+) -> dict[str, dict[str, Any]]:
+    """Run every asset's state machine on one process pool; return final states.
+
+    Each state is a task: the parent evaluates the router, so at most
+    ``limits[cls]`` states of a resource class (see ``RESOURCE_CLASSES``)
+    execute at once, and at most ``workers`` overall. After every transition
+    the asset's state dict is checkpointed to
+    ``<run_root>/orchestrator_state.json`` and the aggregated status file
+    (default ``runs/v4_2/batch_status_<run_id>.json``) is rewritten. A rerun
+    resumes each asset from its checkpoint; finished assets are kept unless
+    ``restart``. ``orchestrator_factory(*factory_args)`` must be picklable and
+    return an object with ``state_machine`` and ``initial_state``.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    limits = {**DEFAULT_LIMITS, **(limits or {})}
+    if any(limit < 1 for limit in limits.values()):
+        raise ValueError("resource limits must be >= 1")
+    status_path = (
+        Path(status_path) if status_path else Path("runs") / "v4_2" / f"batch_status_{run_id}.json"
+    )
+
+    orchestrator = _orchestrator(orchestrator_factory, factory_args)
+    machine = orchestrator.state_machine
+    runs: dict[str, AssetRun] = {}
+    for asset in dict.fromkeys(assets):
+        saved = None if restart else load_checkpoint(asset, run_id)
+        if saved is not None:
+            runs[asset] = AssetRun(
+                asset,
+                saved["state_name"],
+                saved["state"],
+                steps=saved["steps"],
+                done=saved["done"],
+                seconds=saved.get("seconds", 0.0),
+                history=saved.get("history", []),
+            )
+        else:
+            state = orchestrator.initial_state(asset, run_id, family_id, fast_mode)
+            runs[asset] = AssetRun(asset, "INIT", state)
+
+    started = datetime.now(timezone.utc).isoformat()
+
+    def write_status() -> None:
+        rows = {asset: run.status() for asset, run in runs.items()}
+        counts: dict[str, int] = {}
+        for row in rows.values():
+            counts[row["status"]] = counts.get(row["status"], 0) + 1
+        _write_json(
+            status_path,
+            {
+                "run_id": run_id,
+                "started_at": started,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "workers": workers,
+                "limits": limits,
+                "counts": counts,
+                "assets": rows,
+            },
+        )
+
+    def finish(run: AssetRun) -> None:
+        """Advance ``run`` through terminal or step-limit states, as ``StateMachine.run``."""
+        state_def = machine.router.get(run.state_name, {})
+        if state_def.get("terminal", False):
+            run.state["_final_state"] = run.state_name
+            run.state["_success"] = state_def.get("success", False)
+            mark_outcome(run.state)
+        elif run.steps >= MAX_STEPS:
+            run.state["_final_state"] = "MAX_STEPS_REACHED"
+        else:
+            return
+        run.state["_total_steps"] = run.steps
+        run.done = True
+
+    def transition(run: AssetRun, next_state: str, state: dict[str, Any]) -> None:
+        run.history.append(f"{run.state_name} -> {next_state}")
+        print(f"[Batch] {run.asset}: {run.state_name} -> {next_state}")
+        run.state_name, run.state = next_state, state
+        run.steps += 1
+        finish(run)
+        _write_json(checkpoint_path(run.asset, run_id), run.checkpoint())
+        write_status()
+
+    def fail(run: AssetRun, exc: BaseException) -> None:
+        print(f"[Batch] {run.asset}: error in {run.state_name}: {exc}")
+        run.state["_error"] = str(exc)
+        run.state["_final_state"] = "ERROR"
+        run.state["_total_steps"] = run.steps
+        run.done = True
+        _write_json(checkpoint_path(run.asset, run_id), run.checkpoint())
+        write_status()
+
+    for run in runs.values():
+        if not run.done:
+            finish(run)
+    write_status()
+
+    running: dict[Future, AssetRun] = {}
+    in_use: dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for run in runs.values():
+                if run.done or run.running:
+                    continue
+                action = machine.next_action(run.state_name, run.state)
+                if action is None:
+                    # Routing only: no need for a worker.
+                    try:
+                        next_state, state = machine.execute_state(
+                            run.state_name, run.state, execute_actions=False
+                        )
+                    except Exception as exc:
+                        fail(run, exc)
+                    else:
+                        transition(run, next_state, state)
+                    continue
+                cls = resource_class(action)
+                if len(running) >= workers or in_use.get(cls, 0) >= limits.get(cls, workers):
+                    continue
+                future = executor.submit(
+                    _step, orchestrator_factory, factory_args, run.state_name, run.state, dry_run
+                )
+                running[future] = run
+                run.running = cls
+                in_use[cls] = in_use.get(cls, 0) + 1
+                write_status()
+
+            if not running:
+                if all(run.done for run in runs.values()):
+                    break
+                continue  # Routing-only transitions made more states ready.
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                run = running.pop(future)
+                in_use[run.running] -= 1
+                run.running = None
+                try:
+                    next_state, state, seconds = future.result()
+                except Exception as exc:
+                    fail(run, exc)
+                    continue
+                run.seconds += seconds
+                transition(run, next_state, state)
+
+    write_status()
+    return {asset: run.state for asset, run in runs.items()}
+
+
+def _parse_limits(values: Sequence[str]) -> dict[str, int]:
+    limits = {}
+    for value in values:
+        name, sep, count = value.partition("=")
+        if not sep or not count.isdigit():
+            raise ValueError(f"Invalid --limit {value!r}, expected CLASS=N")
+        limits[name] = int(count)
+    return limits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Batch runner for the v4.3 orchestrator")
+    parser.add_argument("--assets", nargs="+", required=True, help="Asset symbols")
+    parser.add_argument("--run-id", required=True, help="Run identifier")
+    parser.add_argument("--family", default="A", choices=["A", "B", "C"], help="Starting family")
+    parser.add_argument("--dry-run", action="store_true", help="Dry run without executing actions")
+    parser.add_argument("--fast", action="store_true", help="Fast mode: reduced trials/candidates")
+    parser.add_argument("--config", default="configs/families.yaml", help="Config file path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="CLASS=N",
+        help=f"Max concurrent states of a resource class (default {DEFAULT_LIMITS})",
+    )
+    parser.add_argument("--status-file", default=None, help="Aggregated status JSON path")
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore checkpoints and start every asset at INIT"
+    )
+    args = parser.parse_args()
+
+    results = run_batch(
+        args.assets,
+        args.run_id,
+        family_id=args.family,
+        fast_mode=args.fast,
+        dry_run=args.dry_run,
+        workers=args.workers,
+        limits=_parse_limits(args.limit),
+        status_path=args.status_file,
+        restart=args.restart,
+        factory_args=(args.config,),
+    )
+
+    print("\n" + "=" * 60)
+    print("  BATCH RESULT")
+    print("=" * 60)
+    for asset, state in results.items():
+        print(f"  {asset:<10} {state.get('_final_state', 'UNKNOWN'):<20} success={state.get('_success', False)}")
+    return 0 if all(state.get("_success", False) for state in results.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,10 +4,14 @@ Run full production guards for multiple assets using per-asset params.
 from __future__ import annotations
 
 import argparse
+import heapq
+import json
 import logging
 import os
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -20,13 +24,26 @@ import pandas as pd
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.analysis.metrics import (
+    _periods_per_year,
+    _trade_pnl,
+    compute_core_metrics,
+    compute_metrics,
+)
 from crypto_backtest.analysis.regime import REGIMES_V2, classify_regimes_v2
 from crypto_backtest.config.scan_assets import OPTIM_CONFIG
+from crypto_backtest.data.ohlcv_cache import share_ohlcv
+from crypto_backtest.data.returns_store import ReturnsMatrixStore
 from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.engine.result_cache import RESULT_CACHE_ENV
 from crypto_backtest.optimization.bayesian import _instantiate_strategy
-from crypto_backtest.optimization.parallel_optimizer import build_strategy_params, load_data
+from crypto_backtest.optimization.parallel_optimizer import (
+    build_strategy_params,
+    data_path,
+    load_data,
+)
 from crypto_backtest.strategies.final_trigger import FinalTriggerStrategy
+from crypto_backtest.validation.monte_carlo import trade_permutation_metrics
 from crypto_backtest.validation.overfitting import compute_overfitting_report
 from crypto_backtest.validation.pbo_cscv import guard_pbo_cscv as guard_pbo
 
@@ -41,6 +58,22 @@ BASE_CONFIG = BacktestConfig(
 
 SEED = 42
 
+# Guards dispatched to workers, in report order; "wfe" is read from params.
+WORKER_GUARDS = ("mc", "sensitivity", "bootstrap", "trade_dist", "stress", "regime", "pbo")
+# Rough per-task seconds for (asset, guard) pairs with no recorded runtime;
+# "base" is the per-asset baseline backtest and overfitting report.
+DEFAULT_TASK_SECONDS = {
+    "sensitivity": 120.0,
+    "mc": 30.0,
+    "stress": 20.0,
+    "bootstrap": 15.0,
+    "regime": 5.0,
+    "pbo": 5.0,
+    "base": 2.0,
+    "trade_dist": 1.0,
+}
+RUNTIMES_FILE = "guard_runtimes.json"
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,18 +111,16 @@ def _load_returns_matrix(
     returns_matrix_dir: str | None,
     returns_matrix_run_id: str | None,
 ) -> np.ndarray | None:
+    """Open the asset's returns matrix memory-mapped (read-only, zero-copy)."""
     if not returns_matrix_dir:
         return None
-    output_dir = Path(returns_matrix_dir)
     if returns_matrix_run_id:
-        path = output_dir / f"returns_matrix_{asset}_{returns_matrix_run_id}.npy"
-        if path.exists():
-            return np.load(path)
-        return None
-    matches = sorted(output_dir.glob(f"returns_matrix_{asset}_*.npy"))
-    if not matches:
+        store = ReturnsMatrixStore(returns_matrix_dir, asset, returns_matrix_run_id)
+    else:
+        store = ReturnsMatrixStore.latest(returns_matrix_dir, asset)
+    if store is None or not store.exists():
         return None
-    return np.load(matches[-1])
+    return store.load()
 
 
 def _force_real_array(arr):
@@ -152,36 +183,6 @@ def _map_trade_indices(data: pd.DataFrame, trades: pd.DataFrame) -> pd.DataFrame
     return mapped
 
 
-def _build_random_equity_curve(
-    prices: np.ndarray,
-    durations: np.ndarray,
-    signs: np.ndarray,
-    quantities: np.ndarray,
-    cost_rate: float,
-    initial_capital: float,
-    rng: np.random.Generator,
-) -> np.ndarray:
-    n_bars = len(prices)
-    max_entry = n_bars - durations
-    entry_idx = (rng.random(len(durations)) * max_entry).astype(int)
-    exit_idx = entry_idx + durations
-
-    entry_price = prices[entry_idx]
-    exit_price = prices[exit_idx]
-
-    pnl = signs * (exit_price - entry_price) * quantities
-    costs = cost_rate * (np.abs(entry_price) + np.abs(exit_price)) * quantities
-    pnl_net = pnl - costs
-
-    pnl_by_exit = np.zeros(n_bars, dtype=float)
-    np.add.at(pnl_by_exit, exit_idx, pnl_net)
-    equity = initial_capital + np.cumsum(pnl_by_exit)
-    
-    # FIX V5: Force equity to be real-valued (no complex numbers)
-    equity = _force_real_array(equity)
-    return equity
-
-
 def _monte_carlo_permutation(
     data: pd.DataFrame,
     result,
@@ -213,44 +214,25 @@ def _monte_carlo_permutation(
         logger.warning("MC: high Sharpe detected (%.3f) in Monte Carlo guard", actual_sharpe)
 
     rng = np.random.default_rng(seed)
-    rows = []
-    for i in range(1, iterations + 1):
-        equity = _build_random_equity_curve(
-            prices=prices,
-            durations=durations,
-            signs=signs,
-            quantities=quantities,
-            cost_rate=cost_rate,
-            initial_capital=BASE_CONFIG.initial_capital,
-            rng=rng,
-        )
-        # FIX V5: Force equity to real before creating Series
-        equity = _force_real_array(equity)
-        equity_series = pd.Series(equity, index=data.index)
-        
-        try:
-            metrics = compute_metrics(equity_series, pd.DataFrame())
-        except Exception as e:
-            # Si compute_metrics échoue, continuer avec valeurs par défaut
-            metrics = {"sharpe_ratio": 0.0, "max_drawdown": 0.0}
-        
-        # FIX: Protection contre complexes dans calcul total_return
-        final_equity = _safe_float(equity[-1])
-        total_return = (final_equity / BASE_CONFIG.initial_capital - 1) * 100
-        
-        # FIX: Protection contre complexes dans conversions float
-        sharpe_float = _safe_float(metrics.get("sharpe_ratio", 0.0) or 0.0)
-        max_dd_float = _safe_float(metrics.get("max_drawdown", 0.0) or 0.0)
-        
-        rows.append(
-            {
-                "iteration": i,
-                "sharpe": sharpe_float,
-                "return": _safe_float(total_return),
-                "max_dd": max_dd_float,
-                "actual_sharpe": actual_sharpe,
-            }
-        )
+    metrics = trade_permutation_metrics(
+        prices=prices,
+        durations=durations,
+        signs=signs,
+        quantities=quantities,
+        cost_rate=cost_rate,
+        initial_capital=BASE_CONFIG.initial_capital,
+        iterations=iterations,
+        rng=rng,
+        periods_per_year=_periods_per_year(data.index),
+    )
+    # The first bar never books PnL, so total_return is relative to initial capital.
+    rows = {
+        "iteration": np.arange(1, iterations + 1),
+        "sharpe": metrics["sharpe_ratio"],
+        "return": metrics["total_return"] * 100,
+        "max_dd": metrics["max_drawdown"],
+        "actual_sharpe": actual_sharpe,
+    }
 
     df = pd.DataFrame(rows)
     
@@ -266,10 +248,26 @@ def _monte_carlo_permutation(
     return df, p_value
 
 
+def _sensitivity_metrics(result) -> dict[str, Any]:
+    metrics = compute_core_metrics(
+        result.equity_curve.to_numpy(),
+        _trade_pnl(result.trades).to_numpy(),
+        _periods_per_year(result.equity_curve.index),
+    )
+    # FIX: Protection contre complexes dans conversions float
+    return {
+        "sharpe": _safe_float(metrics.get("sharpe_ratio", 0.0) or 0.0),
+        "return": _safe_float(metrics.get("total_return", 0.0) or 0.0) * 100.0,
+        "max_dd": _safe_float(metrics.get("max_drawdown", 0.0) or 0.0) * 100.0,
+        "trades": int(len(result.trades)),
+    }
+
+
 def _sensitivity_grid(
     data: pd.DataFrame,
     base_params: dict[str, Any],
     radius: int = 2,
+    n_jobs: int = 1,
 ) -> tuple[pd.DataFrame, float]:
     tenkan = int(base_params["tenkan"])
     kijun = int(base_params["kijun"])
@@ -281,41 +279,38 @@ def _sensitivity_grid(
     tenkan_5_range = range(max(1, tenkan_5 - radius), tenkan_5 + radius + 1)
     kijun_5_range = range(max(1, kijun_5 - radius), kijun_5 + radius + 1)
 
-    rows = []
-    for t in tenkan_range:
-        for k in kijun_range:
-            for t5 in tenkan_5_range:
-                for k5 in kijun_5_range:
-                    local_params = build_strategy_params(
-                        sl_mult=base_params["sl_mult"],
-                        tp1_mult=base_params["tp1_mult"],
-                        tp2_mult=base_params["tp2_mult"],
-                        tp3_mult=base_params["tp3_mult"],
-                        tenkan=t,
-                        kijun=k,
-                        tenkan_5=t5,
-                        kijun_5=k5,
-                    )
-                    result = _run_backtest(data, local_params, BASE_CONFIG)
-                    metrics = compute_metrics(result.equity_curve, result.trades)
-                    
-                    # FIX: Protection contre complexes dans conversions float
-                    sharpe_float = _safe_float(metrics.get("sharpe_ratio", 0.0) or 0.0)
-                    return_float = _safe_float(metrics.get("total_return", 0.0) or 0.0)
-                    max_dd_float = _safe_float(metrics.get("max_drawdown", 0.0) or 0.0)
-                    
-                    rows.append(
-                        {
-                            "tenkan": t,
-                            "kijun": k,
-                            "tenkan_5": t5,
-                            "kijun_5": k5,
-                            "sharpe": sharpe_float,
-                            "return": return_float * 100.0,
-                            "max_dd": max_dd_float * 100.0,
-                            "trades": int(len(result.trades)),
-                        }
-                    )
+    # Loop order keeps combos sharing an Ichimoku (tenkan, kijun) adjacent so
+    # run_many computes it once per chunk.
+    combos = [
+        (t, k, t5, k5)
+        for t in tenkan_range
+        for k in kijun_range
+        for t5 in tenkan_5_range
+        for k5 in kijun_5_range
+    ]
+    strategies = [
+        _instantiate_strategy(
+            FinalTriggerStrategy,
+            build_strategy_params(
+                sl_mult=base_params["sl_mult"],
+                tp1_mult=base_params["tp1_mult"],
+                tp2_mult=base_params["tp2_mult"],
+                tp3_mult=base_params["tp3_mult"],
+                tenkan=t,
+                kijun=k,
+                tenkan_5=t5,
+                kijun_5=k5,
+            ),
+        )
+        for t, k, t5, k5 in combos
+    ]
+    grid_metrics = VectorizedBacktester(BASE_CONFIG).run_many(
+        data, strategies, n_jobs=n_jobs, evaluate=_sensitivity_metrics
+    )
+    rows = [
+        {"tenkan": t, "kijun": k, "tenkan_5": t5, "kijun_5": k5, **metrics}
+        for (t, k, t5, k5), metrics in zip(combos, grid_metrics)
+    ]
 
     df = pd.DataFrame(rows)
     
@@ -419,53 +414,67 @@ def _trade_distribution(pnls: np.ndarray) -> dict[str, float]:
     }
 
 
-def _run_scenario(
+def _generate_signals(data: pd.DataFrame, params: dict[str, Any]) -> pd.DataFrame:
+    strategy = _instantiate_strategy(FinalTriggerStrategy, params)
+    return strategy.generate_signals(data)
+
+
+def _run_scenarios(
+    data: pd.DataFrame,
+    signals: pd.DataFrame,
+    scenarios: list[tuple[float, float]],
+) -> list[dict[str, Any]]:
+    """Evaluate (fees_bps, slippage_bps) scenarios against one signal frame."""
+    backtester = VectorizedBacktester(BASE_CONFIG)
+    sweep = backtester.run_cost_scenarios(data, signals, scenarios)
+    rows = []
+    for (fees_bps, slippage_bps), row in zip(scenarios, sweep.itertuples(index=False)):
+        final_equity = _safe_float(row.final_equity, BASE_CONFIG.initial_capital)
+        rows.append(
+            {
+                "fees_bps": fees_bps,
+                "slippage_bps": slippage_bps,
+                "total_return_pct": (final_equity / BASE_CONFIG.initial_capital - 1) * 100.0,
+                "sharpe": _safe_float(row.sharpe_ratio),
+                "max_drawdown_pct": _safe_float(row.max_drawdown) * 100.0,
+                "profit_factor": _safe_float(row.profit_factor),
+                "trades": int(row.trades),
+            }
+        )
+    return rows
+
+
+def _find_break_even_fees(
     data: pd.DataFrame,
     params: dict[str, Any],
-    fees_bps: float,
-    slippage_bps: float,
-) -> dict[str, Any]:
-    config = BacktestConfig(
-        initial_capital=BASE_CONFIG.initial_capital,
-        fees_bps=fees_bps,
-        slippage_bps=slippage_bps,
-        sizing_mode=BASE_CONFIG.sizing_mode,
-        intrabar_order=BASE_CONFIG.intrabar_order,
-    )
-    result = _run_backtest(data, params, config)
-    final_equity = (
-        _safe_float(result.equity_curve.iloc[-1])
-        if len(result.equity_curve)
-        else config.initial_capital
-    )
-    total_return = (final_equity / config.initial_capital - 1) * 100.0
+    signals: pd.DataFrame | None = None,
+) -> float:
+    """Highest integer fee level (0-50 bps, slippage = 0.4 * fees) that stays profitable.
 
-    metrics = compute_metrics(result.equity_curve, result.trades)
-    
-    # FIX: Protection contre complexes dans conversions float
-    sharpe_float = _safe_float(metrics.get("sharpe_ratio", 0.0) or 0.0)
-    max_dd_float = _safe_float(metrics.get("max_drawdown", 0.0) or 0.0)
-    pf_float = _safe_float(metrics.get("profit_factor", 0.0) or 0.0)
-    
-    return {
-        "fees_bps": fees_bps,
-        "slippage_bps": slippage_bps,
-        "total_return_pct": total_return,
-        "sharpe": sharpe_float,
-        "max_drawdown_pct": max_dd_float * 100.0,
-        "profit_factor": pf_float,
-        "trades": int(len(result.trades)),
-    }
+    Net PnL only decreases as costs rise, so profitability is treated as
+    monotone in fees and the boundary is found by bisection on a signal
+    frame generated once.
+    """
+    if signals is None:
+        signals = _generate_signals(data, params)
 
+    def _profitable(fees: int) -> bool:
+        metrics = _run_scenarios(data, signals, [(fees, fees * 0.4)])[0]
+        return metrics["total_return_pct"] > 0 and metrics["sharpe"] > 0
 
-def _find_break_even_fees(data: pd.DataFrame, params: dict[str, Any]) -> float:
-    break_even = 0.0
-    for fees in range(0, 51):
-        slippage = fees * 0.4
-        metrics = _run_scenario(data, params, fees_bps=fees, slippage_bps=slippage)
-        if metrics["total_return_pct"] > 0 and metrics["sharpe"] > 0:
-            break_even = fees
-    return _safe_float(break_even)
+    low, high = 0, 50
+    if not _profitable(low):
+        return 0.0
+    if _profitable(high):
+        return _safe_float(high)
+    # Invariant: ``low`` is profitable, ``high`` is not.
+    while high - low > 1:
+        mid = (low + high) // 2
+        if _profitable(mid):
+            low = mid
+        else:
+            high = mid
+    return _safe_float(low)
 
 
 def _regime_reconciliation(
@@ -563,11 +572,12 @@ def _guard_sensitivity(
     outputs_path: Path,
     asset: str,
     run_id: str,
+    n_jobs: int = 1,
 ) -> dict[str, Any]:
     """Sensitivity guard wrapper - returns standardized result dict."""
     try:
         sens_df, variance_pct = _sensitivity_grid(
-            data, base_params, radius=sensitivity_range
+            data, base_params, radius=sensitivity_range, n_jobs=n_jobs
         )
         variance_pct = _safe_float(variance_pct)
         sens_path = outputs_path / f"{asset}_sensitivity_{run_id}.csv"
@@ -667,13 +677,14 @@ def _guard_stress(
         for idx, (fees, slippage) in enumerate(stress_scenarios, start=1):
             scenarios.append((f"Stress{idx}", fees, slippage))
         
-        stress_rows = []
-        for label, fees, slippage in scenarios:
-            metrics = _run_scenario(data, full_params, fees_bps=fees, slippage_bps=slippage)
+        signals = _generate_signals(data, full_params)
+        stress_rows = _run_scenarios(
+            data, signals, [(fees, slippage) for _, fees, slippage in scenarios]
+        )
+        for (label, _, _), metrics in zip(scenarios, stress_rows):
             metrics["scenario"] = label
-            stress_rows.append(metrics)
         
-        break_even_fees = _find_break_even_fees(data, full_params)
+        break_even_fees = _find_break_even_fees(data, full_params, signals=signals)
         edge_buffer_bps = break_even_fees - 5
         for row in stress_rows:
             row["break_even_fees_bps"] = break_even_fees
@@ -784,6 +795,58 @@ def _guard_pbo(
         }
 
 
+def _guard_call(
+    name: str,
+    *,
+    data: pd.DataFrame,
+    params: dict[str, Any],
+    full_params: dict[str, Any],
+    base_result,
+    pnls: np.ndarray,
+    outputs_path: Path,
+    asset: str,
+    run_id: str,
+    mc_iterations: int,
+    bootstrap_samples: int,
+    sensitivity_range: int,
+    stress_scenarios: list[tuple[float, float]],
+    returns_matrix: np.ndarray | None = None,
+    pbo_n_splits: int = 16,
+    pbo_threshold: float = 0.50,
+    sensitivity_workers: int = 1,
+):
+    """``(wrapper, args)`` for one guard, or None when it does not apply."""
+    if name == "mc":
+        return _guard_monte_carlo, (
+            data, base_result, mc_iterations, SEED, outputs_path, asset, run_id
+        )
+    if name == "sensitivity":
+        return _guard_sensitivity, (
+            data, params, sensitivity_range, outputs_path, asset, run_id,
+            sensitivity_workers,
+        )
+    if name == "bootstrap" and len(pnls) > 0:
+        return _guard_bootstrap, (
+            pnls, BASE_CONFIG.initial_capital, bootstrap_samples, SEED,
+            outputs_path, asset, run_id
+        )
+    if name == "trade_dist" and len(pnls) > 0:
+        return _guard_trade_dist, (
+            pnls, BASE_CONFIG.initial_capital, outputs_path, asset, run_id
+        )
+    if name == "stress":
+        return _guard_stress, (
+            data, full_params, stress_scenarios, outputs_path, asset, run_id
+        )
+    if name == "regime":
+        return _guard_regime, (data, base_result, outputs_path, asset, run_id)
+    if name == "pbo":
+        return _guard_pbo, (
+            returns_matrix, pbo_n_splits, pbo_threshold, outputs_path, asset, run_id
+        )
+    return None
+
+
 def _run_guards_parallel(
     data: pd.DataFrame,
     params: dict[str, Any],
@@ -803,6 +866,7 @@ def _run_guards_parallel(
     returns_matrix: np.ndarray | None = None,
     pbo_n_splits: int = 16,
     pbo_threshold: float = 0.50,
+    sensitivity_workers: int = 1,
 ) -> dict[str, Any]:
     """
     Execute all requested guards in parallel using joblib.
@@ -812,56 +876,39 @@ def _run_guards_parallel(
     
     Args:
         n_jobs: Number of parallel workers (default 4, max 6 guards)
+        sensitivity_workers: Processes used by the sensitivity grid batch
     
     Returns:
         Dict with all guard results in standardized format
     """
     tasks = []
     guard_names = []
-    
-    # Build task list based on requested guards
-    if "mc" in guards:
-        tasks.append(delayed(_guard_monte_carlo)(
-            data, base_result, mc_iterations, SEED, outputs_path, asset, run_id
-        ))
-        guard_names.append("mc")
-    
-    if "sensitivity" in guards:
-        tasks.append(delayed(_guard_sensitivity)(
-            data, params, sensitivity_range, outputs_path, asset, run_id
-        ))
-        guard_names.append("sensitivity")
-    
-    if "bootstrap" in guards and len(pnls) > 0:
-        tasks.append(delayed(_guard_bootstrap)(
-            pnls, BASE_CONFIG.initial_capital, bootstrap_samples, SEED,
-            outputs_path, asset, run_id
-        ))
-        guard_names.append("bootstrap")
-    
-    if "trade_dist" in guards and len(pnls) > 0:
-        tasks.append(delayed(_guard_trade_dist)(
-            pnls, BASE_CONFIG.initial_capital, outputs_path, asset, run_id
-        ))
-        guard_names.append("trade_dist")
-    
-    if "stress" in guards:
-        tasks.append(delayed(_guard_stress)(
-            data, full_params, stress_scenarios, outputs_path, asset, run_id
-        ))
-        guard_names.append("stress")
-    
-    if "regime" in guards:
-        tasks.append(delayed(_guard_regime)(
-            data, base_result, outputs_path, asset, run_id
-        ))
-        guard_names.append("regime")
-
-    if "pbo" in guards:
-        tasks.append(delayed(_guard_pbo)(
-            returns_matrix, pbo_n_splits, pbo_threshold, outputs_path, asset, run_id
-        ))
-        guard_names.append("pbo")
+    for name in WORKER_GUARDS:
+        if name not in guards:
+            continue
+        call = _guard_call(
+            name,
+            data=data,
+            params=params,
+            full_params=full_params,
+            base_result=base_result,
+            pnls=pnls,
+            outputs_path=outputs_path,
+            asset=asset,
+            run_id=run_id,
+            mc_iterations=mc_iterations,
+            bootstrap_samples=bootstrap_samples,
+            sensitivity_range=sensitivity_range,
+            stress_scenarios=stress_scenarios,
+            returns_matrix=returns_matrix,
+            pbo_n_splits=pbo_n_splits,
+            pbo_threshold=pbo_threshold,
+            sensitivity_workers=sensitivity_workers,
+        )
+        if call is not None:
+            func, args = call
+            tasks.append(delayed(func)(*args))
+            guard_names.append(name)
 
     # Execute in parallel
     if tasks:
@@ -879,16 +926,20 @@ def _run_guards_parallel(
     
     # Add WFE (instant, no parallel needed)
     if "wfe" in guards:
-        guard_results["wfe"] = {
-            "guard": "wfe",
-            "value": wfe_value,
-            "pass": wfe_value is not None and _safe_float(wfe_value) >= 0.6,
-            "error": None,
-        }
+        guard_results["wfe"] = _wfe_result(wfe_value)
     
     return guard_results
 
 
+def _wfe_result(wfe_value: float | None) -> dict[str, Any]:
+    return {
+        "guard": "wfe",
+        "value": wfe_value,
+        "pass": wfe_value is not None and _safe_float(wfe_value) >= 0.6,
+        "error": None,
+    }
+
+
 def _write_report(
     path: str,
     asset: str,
@@ -959,29 +1010,7 @@ def _load_params(params_file: str) -> dict[str, dict[str, Any]]:
     return params_map
 
 
-def _asset_guard_worker(
-    asset: str,
-    params: dict[str, Any],
-    data_dir: str,
-    outputs_dir: str,
-    run_id: str,
-    guards: set[str],
-    mc_iterations: int,
-    bootstrap_samples: int,
-    sensitivity_range: int,
-    stress_scenarios: list[tuple[float, float]],
-    returns_matrix_dir: str | None,
-    returns_matrix_run_id: str | None,
-    overfit_trials: int | None = None,
-) -> dict[str, Any]:
-    data = load_data(asset, data_dir)
-    if data.index.tz is None:
-        data.index = data.index.tz_localize("UTC")
-    else:
-        data.index = data.index.tz_convert("UTC")
-    warmup = OPTIM_CONFIG["warmup_bars"]
-    data = data.iloc[warmup:]
-
+def _strategy_params(params: dict[str, Any]) -> dict[str, Any]:
     full_params = build_strategy_params(
         sl_mult=params["sl_mult"],
         tp1_mult=params["tp1_mult"],
@@ -996,8 +1025,30 @@ def _asset_guard_worker(
         disp = int(params["displacement"])
         full_params["ichimoku"]["displacement"] = disp
         full_params["five_in_one"]["displacement_5"] = disp
+    return full_params
+
+
+def _asset_data(asset: str, data_dir: str) -> pd.DataFrame:
+    """Post-warmup UTC OHLCV of ``asset``."""
+    data = load_data(asset, data_dir)
+    if data.index.tz is None:
+        data.index = data.index.tz_localize("UTC")
+    else:
+        data.index = data.index.tz_convert("UTC")
+    return data.iloc[OPTIM_CONFIG["warmup_bars"]:]
 
+
+def _prepare_asset(asset: str, params: dict[str, Any], data_dir: str) -> tuple:
+    """Post-warmup data, strategy params, base backtest and trade PnLs."""
+    data = _asset_data(asset, data_dir)
+    full_params = _strategy_params(params)
     base_result = _run_backtest(data, full_params, BASE_CONFIG)
+    pnls = _pnl_series(base_result.trades).to_numpy()
+    return data, full_params, base_result, pnls
+
+
+def _base_summary(base_result, overfit_trials: int | None):
+    """Base Sharpe and the (report-only) overfitting report of the base run."""
     base_metrics = compute_metrics(base_result.equity_curve, base_result.trades)
     
     # FIX: Protection contre complexes dans conversion float
@@ -1010,6 +1061,33 @@ def _asset_guard_worker(
         risk_free=0.0,
         n_trials=overfit_trials,
     )
+    return base_sharpe, overfit
+
+
+def _check_trades(pnls: np.ndarray, guards: set[str]) -> None:
+    needs_trades = any(g in guards for g in ["bootstrap", "trade_dist", "stress", "regime"])
+    if needs_trades and len(pnls) == 0:
+        raise RuntimeError("No trades for guard calculations.")
+
+
+def _asset_guard_worker(
+    asset: str,
+    params: dict[str, Any],
+    data_dir: str,
+    outputs_dir: str,
+    run_id: str,
+    guards: set[str],
+    mc_iterations: int,
+    bootstrap_samples: int,
+    sensitivity_range: int,
+    stress_scenarios: list[tuple[float, float]],
+    returns_matrix_dir: str | None,
+    returns_matrix_run_id: str | None,
+    overfit_trials: int | None = None,
+    sensitivity_workers: int = 1,
+) -> dict[str, Any]:
+    data, full_params, base_result, pnls = _prepare_asset(asset, params, data_dir)
+    base_sharpe, overfit = _base_summary(base_result, overfit_trials)
 
     outputs_path = Path(outputs_dir)
     outputs_path.mkdir(exist_ok=True)
@@ -1017,10 +1095,7 @@ def _asset_guard_worker(
     wfe_value = params.get("wfe")
     
     # Get pnls for guards that need trades
-    pnls = _pnl_series(base_result.trades).to_numpy()
-    needs_trades = any(g in guards for g in ["bootstrap", "trade_dist", "stress", "regime"])
-    if needs_trades and len(pnls) == 0:
-        raise RuntimeError("No trades for guard calculations.")
+    _check_trades(pnls, guards)
 
     # ===== PARALLEL EXECUTION OF GUARDS =====
     returns_matrix = None
@@ -1048,9 +1123,25 @@ def _asset_guard_worker(
         n_jobs=4,
         returns_matrix=returns_matrix,
         pbo_n_splits=16,
+        sensitivity_workers=sensitivity_workers,
         pbo_threshold=0.50,
     )
+    return _asset_row(
+        asset, guards, guard_results, wfe_value, base_sharpe, overfit, outputs_path, run_id
+    )
+
 
+def _asset_row(
+    asset: str,
+    guards: set[str],
+    guard_results: dict[str, Any],
+    wfe_value: float | None,
+    base_sharpe: float,
+    overfit,
+    outputs_path: Path,
+    run_id: str,
+) -> dict[str, Any]:
+    """Summary row for one asset; also writes its validation report."""
     # ===== Extract results from parallel execution =====
     mc_result = guard_results.get("mc", {"value": None, "pass": True, "error": None})
     sens_result = guard_results.get("sensitivity", {"value": None, "pass": True, "error": None})
@@ -1165,6 +1256,224 @@ def _asset_guard_worker(
     }
 
 
+@dataclass(frozen=True)
+class GuardSettings:
+    """Guard options shared by every task of a run."""
+
+    guards: frozenset[str]
+    mc_iterations: int = 1000
+    bootstrap_samples: int = 10000
+    sensitivity_range: int = 2
+    stress_scenarios: tuple[tuple[float, float], ...] = ()
+    returns_matrix_dir: str | None = None
+    returns_matrix_run_id: str | None = None
+    overfit_trials: int | None = None
+    sensitivity_workers: int = 1
+
+
+def _error_row(asset: str, error: str) -> dict[str, Any]:
+    return {
+        "asset": asset,
+        "guard001_pass": False,
+        "guard002_pass": False,
+        "guard003_pass": False,
+        "guard005_pass": False,
+        "guard006_pass": False,
+        "guard007_pass": False,
+        "all_pass": False,
+        "error": error,
+    }
+
+
+def _load_runtimes(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_runtimes(path: Path, runtimes: dict[str, dict[str, float]]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(runtimes, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _expected_seconds(runtimes: dict[str, dict[str, float]], asset: str, task: str) -> float:
+    """Last recorded runtime, else the mean over other assets, else a default."""
+    recorded = runtimes.get(asset, {}).get(task)
+    if recorded is not None:
+        return float(recorded)
+    seen = [float(by_task[task]) for by_task in runtimes.values() if task in by_task]
+    if seen:
+        return float(np.mean(seen))
+    return DEFAULT_TASK_SECONDS.get(task, 1.0)
+
+
+def _schedule(
+    assets: list[str],
+    guards: set[str] | frozenset[str],
+    runtimes: dict[str, dict[str, float]],
+) -> list[tuple[str, str]]:
+    """(asset, task) pairs ordered longest expected runtime first."""
+    names = ["base"] + [name for name in WORKER_GUARDS if name in guards]
+    tasks = [(asset, name) for asset in assets for name in names]
+    return sorted(tasks, key=lambda item: -_expected_seconds(runtimes, *item))
+
+
+def _asset_task(
+    asset: str,
+    task: str,
+    params: dict[str, Any],
+    data_dir: str,
+    outputs_dir: str,
+    run_id: str,
+    settings: GuardSettings,
+    base_result=None,
+) -> tuple[Any, float]:
+    """Run one (asset, task) pair in a pool worker; return (result, seconds).
+
+    The "base" task runs the asset's baseline backtest and returns
+    ``((base_sharpe, overfit), base_result)``; guard tasks get that
+    ``base_result`` instead of rebuilding it.
+    """
+    started = time.perf_counter()
+    if task == "base":
+        _, _, base_result, pnls = _prepare_asset(asset, params, data_dir)
+        _check_trades(pnls, settings.guards)
+        summary = _base_summary(base_result, settings.overfit_trials)
+        return (summary, base_result), time.perf_counter() - started
+
+    data = _asset_data(asset, data_dir)
+    returns_matrix = None
+    if task == "pbo":
+        returns_matrix = _load_returns_matrix(
+            asset, settings.returns_matrix_dir, settings.returns_matrix_run_id
+        )
+    call = _guard_call(
+        task,
+        data=data,
+        params=params,
+        full_params=_strategy_params(params),
+        base_result=base_result,
+        pnls=_pnl_series(base_result.trades).to_numpy(),
+        outputs_path=Path(outputs_dir),
+        asset=asset,
+        run_id=run_id,
+        mc_iterations=settings.mc_iterations,
+        bootstrap_samples=settings.bootstrap_samples,
+        sensitivity_range=settings.sensitivity_range,
+        stress_scenarios=list(settings.stress_scenarios),
+        returns_matrix=returns_matrix,
+        sensitivity_workers=settings.sensitivity_workers,
+    )
+    result = None if call is None else call[0](*call[1])
+    return result, time.perf_counter() - started
+
+
+def run_guards_flat(
+    params_map: dict[str, dict[str, Any]],
+    data_dir: str,
+    outputs_dir: str,
+    run_id: str,
+    settings: GuardSettings,
+    workers: int = 1,
+    runtimes_path: str | Path | None = None,
+) -> list[dict[str, Any]]:
+    """Run every (asset, guard) pair of ``params_map`` as a task on one process pool.
+
+    Each asset's OHLCV file is parsed once and published in shared memory.
+    An asset's "base" task runs its baseline backtest once; the result is
+    sent to its guard tasks, which are only submitted after the base task
+    succeeded. At most ``workers`` tasks are in flight, and the next one is
+    the ready task with the longest expected runtime, using the runtimes
+    recorded by previous runs in ``runtimes_path`` (default
+    ``<outputs_dir>/guard_runtimes.json``), which is updated with this run's
+    timings. Returns one summary row per asset, in ``params_map`` order, in
+    the same format as ``_asset_guard_worker``.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    outputs_path = Path(outputs_dir)
+    outputs_path.mkdir(exist_ok=True)
+    runtimes_path = Path(runtimes_path) if runtimes_path else outputs_path / RUNTIMES_FILE
+    runtimes = _load_runtimes(runtimes_path)
+
+    assets = list(params_map)
+    paths = []
+    for asset in assets:
+        try:
+            paths.append(data_path(asset, data_dir))
+        except FileNotFoundError:
+            pass  # Reported through the asset's base task.
+
+    order = _schedule(assets, settings.guards, runtimes)
+    ready = [(rank, asset, task) for rank, (asset, task) in enumerate(order) if task == "base"]
+    guard_tasks: dict[str, list[tuple[int, str, str]]] = {asset: [] for asset in assets}
+    for rank, (asset, task) in enumerate(order):
+        if task != "base":
+            guard_tasks[asset].append((rank, asset, task))
+    heapq.heapify(ready)
+
+    results: dict[str, dict[str, Any]] = {asset: {} for asset in assets}
+    base_results: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    with share_ohlcv(paths), ProcessPoolExecutor(max_workers=workers) as executor:
+        running: dict[Future, tuple[str, str]] = {}
+        while ready or running:
+            while ready and len(running) < workers:
+                _, asset, task = heapq.heappop(ready)
+                future = executor.submit(
+                    _asset_task, asset, task, params_map[asset], data_dir, outputs_dir,
+                    run_id, settings, base_results.get(asset),
+                )
+                running[future] = (asset, task)
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                asset, task = running.pop(future)
+                try:
+                    result, seconds = future.result()
+                except Exception as exc:
+                    errors.setdefault(asset, str(exc))
+                    continue
+                runtimes.setdefault(asset, {})[task] = round(seconds, 3)
+                if task == "base":
+                    result, base_results[asset] = result
+                    for item in guard_tasks[asset]:
+                        heapq.heappush(ready, item)
+                results[asset][task] = result
+    _save_runtimes(runtimes_path, runtimes)
+
+    rows = []
+    for asset in assets:
+        try:
+            if asset in errors:
+                raise RuntimeError(errors[asset])
+            base_sharpe, overfit = results[asset]["base"]
+            guard_results = {
+                name: result
+                for name, result in results[asset].items()
+                if name != "base" and result is not None
+            }
+            wfe_value = params_map[asset].get("wfe")
+            if "wfe" in settings.guards:
+                guard_results["wfe"] = _wfe_result(wfe_value)
+            rows.append(
+                _asset_row(
+                    asset,
+                    set(settings.guards),
+                    guard_results,
+                    wfe_value,
+                    base_sharpe,
+                    overfit,
+                    outputs_path,
+                    run_id,
+                )
+            )
+        except Exception as exc:
+            rows.append(_error_row(asset, str(exc)))
+    return rows
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run full guard suite for multiple assets.")
     parser.add_argument("--assets", nargs="+", required=True, help="Assets to validate")
@@ -1181,6 +1490,12 @@ def main() -> None:
     parser.add_argument("--mc-iterations", type=int, default=1000)
     parser.add_argument("--bootstrap-samples", type=int, default=10000)
     parser.add_argument("--sensitivity-range", type=int, default=2)
+    parser.add_argument(
+        "--sensitivity-workers",
+        type=int,
+        default=1,
+        help="Processes per asset for the sensitivity grid (-1 = all cores)",
+    )
     parser.add_argument(
         "--overfit-trials",
         type=int,
@@ -1204,7 +1519,27 @@ def main() -> None:
         default=None,
         help="Run ID suffix used in returns matrix filenames (defaults to latest)",
     )
+    parser.add_argument(
+        "--scheduler",
+        choices=("flat", "per-asset"),
+        default="flat",
+        help="flat: one process-pool task per (asset, guard); "
+        "per-asset: one worker per asset running its guards on threads",
+    )
+    parser.add_argument(
+        "--runtimes-file",
+        default=None,
+        help="JSON of recorded task runtimes used to order flat tasks "
+        f"(default <outputs-dir>/{RUNTIMES_FILE})",
+    )
+    parser.add_argument(
+        "--result-cache",
+        default=None,
+        help="Directory of the on-disk backtest result cache shared by all workers",
+    )
     args = parser.parse_args()
+    if args.result_cache:
+        os.environ[RESULT_CACHE_ENV] = args.result_cache
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     print(f"[GUARDS] Run ID: {run_id}")
 
@@ -1220,60 +1555,77 @@ def main() -> None:
         stress_scenarios.append((float(fees_str), float(slip_str)))
 
     rows = []
-    with ProcessPoolExecutor(max_workers=args.workers) as executor:
-        futures = {}
-        for asset in assets:
-            if asset not in params_map:
-                rows.append(
-                    {
-                        "asset": asset,
-                        "guard001_pass": False,
-                        "guard002_pass": False,
-                        "guard003_pass": False,
-                        "guard005_pass": False,
-                        "guard006_pass": False,
-                        "guard007_pass": False,
-                        "guard_wfe_pass": False,
-                        "all_pass": False,
-                        "error": "missing_params",
-                    }
-                )
-                continue
-            futures[executor.submit(
-                _asset_guard_worker,
-                asset,
-                params_map[asset],
+    runnable = {}
+    for asset in assets:
+        if asset not in params_map:
+            rows.append(
+                {
+                    "asset": asset,
+                    "guard001_pass": False,
+                    "guard002_pass": False,
+                    "guard003_pass": False,
+                    "guard005_pass": False,
+                    "guard006_pass": False,
+                    "guard007_pass": False,
+                    "guard_wfe_pass": False,
+                    "all_pass": False,
+                    "error": "missing_params",
+                }
+            )
+            continue
+        runnable[asset] = params_map[asset]
+
+    if args.scheduler == "flat":
+        settings = GuardSettings(
+            guards=frozenset(guards),
+            mc_iterations=args.mc_iterations,
+            bootstrap_samples=args.bootstrap_samples,
+            sensitivity_range=args.sensitivity_range,
+            stress_scenarios=tuple(stress_scenarios),
+            returns_matrix_dir=args.returns_matrix_dir,
+            returns_matrix_run_id=args.returns_matrix_run_id,
+            overfit_trials=args.overfit_trials,
+            sensitivity_workers=args.sensitivity_workers,
+        )
+        rows.extend(
+            run_guards_flat(
+                runnable,
                 args.data_dir,
                 args.outputs_dir,
                 run_id,
-                guards,
-                args.mc_iterations,
-                args.bootstrap_samples,
-                args.sensitivity_range,
-                stress_scenarios,
-                args.returns_matrix_dir,
-                args.returns_matrix_run_id,
-                args.overfit_trials,
-            )] = asset
-
-        for future in as_completed(futures):
-            asset = futures[future]
-            try:
-                rows.append(future.result())
-            except Exception as exc:
-                rows.append(
-                    {
-                        "asset": asset,
-                        "guard001_pass": False,
-                        "guard002_pass": False,
-                        "guard003_pass": False,
-                        "guard005_pass": False,
-                        "guard006_pass": False,
-                        "guard007_pass": False,
-                        "all_pass": False,
-                        "error": str(exc),
-                    }
-                )
+                settings,
+                workers=args.workers,
+                runtimes_path=args.runtimes_file,
+            )
+        )
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {}
+            for asset, params in runnable.items():
+                futures[executor.submit(
+                    _asset_guard_worker,
+                    asset,
+                    params,
+                    args.data_dir,
+                    args.outputs_dir,
+                    run_id,
+                    guards,
+                    args.mc_iterations,
+                    args.bootstrap_samples,
+                    args.sensitivity_range,
+                    stress_scenarios,
+                    args.returns_matrix_dir,
+                    args.returns_matrix_run_id,
+                    args.overfit_trials,
+                    args.sensitivity_workers,
+                )] = asset
+
+            for future in as_completed(futures):
+                asset = futures[future]
+                try:
+                    rows.append(future.result())
+                except Exception as exc:
+                    rows.append(_error_row(asset, str(exc)))
 
     summary_df = pd.DataFrame(rows)
     if args.summary_output:
@@ -134,6 +134,32 @@ class StateMachine:
         print(f"[StateMachine] Warning: no handler for action '{action}'")
         return state
 
+    def _select_transition(
+        self, state_def: Dict[str, Any], state: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """First transition whose condition holds (unconditional and else always do)."""
+        for transition in state_def.get("transitions", []):
+            condition = transition.get("if")
+            if condition in (None, "else") or "else" in transition or self._eval_condition(condition, state):
+                return transition
+        return None
+
+    def next_action(self, state_name: str, state: Dict[str, Any]) -> Optional[str]:
+        """
+        Action that ``execute_state`` would run next from ``state_name``.
+
+        Returns the state-level action if defined, else the action of the
+        transition ``execute_state`` would take; None for terminal or unknown
+        states and for transitions without an action.
+        """
+        state_def = self.router.get(state_name, {})
+        if state_def.get("terminal", False):
+            return None
+        if state_def.get("action"):
+            return state_def["action"]
+        transition = self._select_transition(state_def, state)
+        return transition.get("action") if transition is not None else None
+
     def execute_state(
         self,
         state_name: str,
@@ -164,52 +190,27 @@ class StateMachine:
         if action and execute_actions:
             state = self._execute_action(action, state)
 
-        transitions = state_def.get("transitions", [])
+        transition = self._select_transition(state_def, state)
+        if transition is not None:
+            if execute_actions and transition.get("action"):
+                state = self._execute_action(transition["action"], state)
 
-        for transition in transitions:
-            condition = transition.get("if")
-            if condition is None or condition == "else" or "else" in transition:
-                if condition in (None, "else") or "else" in transition or self._eval_condition(condition, state):
-                    if execute_actions and transition.get("action"):
-                        state = self._execute_action(transition["action"], state)
-
-                    updates = transition.get("set", {})
-                    state = self._apply_state_updates(state, updates)
-
-                    next_state = transition.get("then")
-                    reason = transition.get("reason", "")
-
-                    self.execution_history.append(
-                        StateExecutionResult(
-                            state_name=state_name,
-                            action_executed=action or transition.get("action"),
-                            transition=TransitionResult(next_state, updates, reason),
-                            state_after=state.copy(),
-                        )
-                    )
-
-                    return next_state, state
-            else:
-                if self._eval_condition(condition, state):
-                    if execute_actions and transition.get("action"):
-                        state = self._execute_action(transition["action"], state)
-
-                    updates = transition.get("set", {})
-                    state = self._apply_state_updates(state, updates)
-
-                    next_state = transition.get("then")
-                    reason = transition.get("reason", "")
-
-                    self.execution_history.append(
-                        StateExecutionResult(
-                            state_name=state_name,
-                            action_executed=action or transition.get("action"),
-                            transition=TransitionResult(next_state, updates, reason),
-                            state_after=state.copy(),
-                        )
-                    )
-
-                    return next_state, state
+            updates = transition.get("set", {})
+            state = self._apply_state_updates(state, updates)
+
+            next_state = transition.get("then")
+            reason = transition.get("reason", "")
+
+            self.execution_history.append(
+                StateExecutionResult(
+                    state_name=state_name,
+                    action_executed=action or transition.get("action"),
+                    transition=TransitionResult(next_state, updates, reason),
+                    state_after=state.copy(),
+                )
+            )
+
+            return next_state, state
 
         raise ValueError(f"No valid transition from state '{state_name}' with state: {state}")
 
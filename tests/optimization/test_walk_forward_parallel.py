@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.data.shared import SharedFrame, attach_frame
+from crypto_backtest.optimization.bayesian import BayesianOptimizer
+from crypto_backtest.optimization.walk_forward import (
+    WalkForwardAnalyzer,
+    WalkForwardConfig,
+    _window_bounds,
+)
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(days: int = 75, seed: int = 9) -> pd.DataFrame:
+    rows = days * 24
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": 1.0},
+        index=index,
+    )
+
+
+def _param_space() -> dict:
+    return {
+        "base_params": FinalTriggerParams(),
+        "search_space": {"sl_mult": {"type": "float", "low": 1.5, "high": 4.0, "step": 0.5}},
+        "seed": 7,
+    }
+
+
+def test_window_bounds_match_boolean_masks():
+    data = _sample_ohlcv()
+    in_sample, out_sample = pd.Timedelta(days=20), pd.Timedelta(days=7)
+
+    windows = _window_bounds(data.index, in_sample, out_sample)
+
+    assert len(windows) == 2
+    window_start = data.index[0]
+    for first, split, last in windows:
+        train_end = window_start + in_sample
+        test_end = train_end + out_sample
+        train = data[(data.index >= window_start) & (data.index < train_end)]
+        test = data[(data.index >= train_end) & (data.index < test_end)]
+        pd.testing.assert_frame_equal(data.iloc[first:split], train)
+        pd.testing.assert_frame_equal(data.iloc[split:last], test)
+        window_start = test_end
+
+
+def test_shared_frame_round_trip():
+    data = _sample_ohlcv(days=2)
+
+    with SharedFrame(data) as shared:
+        frame = attach_frame(shared.handle)
+        pd.testing.assert_frame_equal(frame, data, check_freq=False)
+        assert not frame["close"].to_numpy().flags.writeable
+
+
+def test_parallel_windows_match_sequential():
+    data = _sample_ohlcv()
+    config = WalkForwardConfig(in_sample_days=20, out_of_sample_days=7, n_trials=3)
+
+    sequential = WalkForwardAnalyzer(config).analyze(data, FinalTriggerStrategy, _param_space())
+    parallel = WalkForwardAnalyzer(
+        WalkForwardConfig(in_sample_days=20, out_of_sample_days=7, n_trials=3, n_jobs=2)
+    ).analyze(data, FinalTriggerStrategy, _param_space())
+
+    assert parallel == sequential
+
+
+def test_warm_start_enqueues_params_first():
+    data = _sample_ohlcv(days=10)
+    params = {"sl_mult": 3.5}
+
+    result = BayesianOptimizer().optimize(
+        data, FinalTriggerStrategy, _param_space(), n_trials=1, warm_start=[params]
+    )
+
+    assert result.best_params == params
+    assert result.ranked_params == (params,)
+
+
+def test_warm_start_requires_sequential_windows():
+    config = WalkForwardConfig(n_jobs=2, warm_start_top_k=3)
+
+    with pytest.raises(ValueError, match="warm_start_top_k"):
+        WalkForwardAnalyzer(config).analyze(_sample_ohlcv(days=2), FinalTriggerStrategy, _param_space())
+
+
+def test_warm_started_walk_forward_runs():
+    data = _sample_ohlcv()
+    config = WalkForwardConfig(
+        in_sample_days=20, out_of_sample_days=7, n_trials=3, warm_start_top_k=2
+    )
+
+    result = WalkForwardAnalyzer(config).analyze(data, FinalTriggerStrategy, _param_space())
+
+    assert "sharpe_ratio" in result.combined_metrics
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import crypto_backtest.v4.backtest_adapter as adapter
+from crypto_backtest.v4.bar_returns import BarReturnsStore, backtest_key, coupled_returns_matrix
+
+INDEX = pd.date_range("2024-01-01", periods=6, freq="h", tz="UTC")
+
+
+def _fake_result(params: dict, mode: str) -> dict:
+    seed = int(params["sl_mult"] * 100) + (0 if mode == "long_only" else 7)
+    equity = 1000 + np.cumsum(np.random.default_rng(seed).normal(0, 5, len(INDEX)))
+    equity_curve = pd.Series(equity, index=INDEX)
+    return {
+        "metrics": {"sharpe": float(params["sl_mult"])},
+        "equity_curve": equity_curve,
+        "bar_returns": adapter._bar_returns_from_equity(equity_curve),
+    }
+
+
+def test_key_follows_simulated_config():
+    long_params = {"sl_mult": 2.0}
+    couple_a = {"long_params": long_params, "short_params": {"sl_mult": 3.0}}
+    couple_b = {"long_params": long_params, "short_params": {"sl_mult": 4.0}}
+
+    # Combined runs only simulate the long params, so these share a backtest.
+    assert backtest_key(couple_a, "combined") == backtest_key(couple_b, "combined")
+    assert backtest_key(couple_a, "short_only") != backtest_key(couple_b, "short_only")
+    assert backtest_key(long_params, "long_only") != backtest_key(long_params, "combined")
+    assert backtest_key(couple_a, "combined", end_ts="2024") != backtest_key(couple_a, "combined")
+
+
+def test_store_round_trips_float32_rows_with_shared_index(tmp_path):
+    store = BarReturnsStore("BTC", "run", root_dir=tmp_path)
+    first = _fake_result({"sl_mult": 1.0}, "long_only")
+    second = _fake_result({"sl_mult": 2.0}, "long_only")
+
+    assert store.add_result("a", first) == 0
+    assert store.add_result("b", second) == 1
+    assert store.add_result("a", second) == 0  # Already stored.
+
+    reopened = BarReturnsStore("BTC", "run", root_dir=tmp_path)
+    matrix = reopened.matrix(["b", "a", "b"])
+    assert matrix.dtype == np.float32 and matrix.shape == (3, len(INDEX) - 1)
+    np.testing.assert_array_equal(matrix[1], first["bar_returns"].astype(np.float32))
+    assert reopened.index.equals(INDEX[1:])
+    with pytest.raises(KeyError):
+        reopened.matrix(["missing"])
+
+
+def test_store_rejects_vectors_of_another_window(tmp_path):
+    store = BarReturnsStore("BTC", "run", root_dir=tmp_path)
+    store.add_result("a", _fake_result({"sl_mult": 1.0}, "long_only"))
+    shifted = _fake_result({"sl_mult": 2.0}, "long_only")
+    shifted["equity_curve"].index = INDEX + pd.Timedelta(hours=1)
+
+    with pytest.raises(ValueError, match="does not match"):
+        store.add_result("b", shifted)
+    with pytest.raises(ValueError, match="does not match"):
+        store.add("c", np.zeros(3), INDEX[1:4])
+    assert "b" not in store and "c" not in store
+
+
+def test_pbo_matrix_reuses_stored_backtests(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_backtest(asset, recipe_config, mode, start_ts=None, end_ts=None):
+        calls.append(mode)
+        params = adapter.coupled_strategy_config(recipe_config, mode)
+        return _fake_result(params, mode)
+
+    monkeypatch.setattr(adapter, "run_coupled_backtest", fake_backtest)
+    couples = [
+        {"long_params": {"sl_mult": sl}, "short_params": {}} for sl in (1.0, 2.0, 3.0)
+    ]
+    first = coupled_returns_matrix("BTC", "run", couples + couples[:1])
+    assert calls == ["combined"] * 3
+    second = coupled_returns_matrix("BTC", "run", couples)
+    assert calls == ["combined"] * 3
+    assert second.shape == (3, len(INDEX) - 1)
+    np.testing.assert_array_equal(first[:3], second)
+    np.testing.assert_array_equal(first[3], first[0])
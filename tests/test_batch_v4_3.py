@@ -0,0 +1,150 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts.run_batch_v4_3 import checkpoint_path, load_checkpoint, run_batch
+from scripts.state_machine import StateMachine
+
+ROUTER = """
+states: ["INIT", "SCREEN", "SCORE", "PROD_READY", "REJECT"]
+transitions:
+  INIT:
+    - then: "SCREEN"
+  SCREEN:
+    - action: "run_screening_long"
+      then: "SCORE"
+  SCORE:
+    - if: "score > 0"
+      action: "run_guards"
+      then: "PROD_READY"
+    - else:
+      then: "REJECT"
+  PROD_READY:
+    - terminal: true
+  REJECT:
+    - terminal: true
+"""
+
+
+def _record(state, action):
+    log_dir = Path(state["log_dir"])
+    start = time.time()
+    time.sleep(0.2)
+    line = json.dumps({"asset": state["asset"], "action": action, "start": start, "end": time.time()})
+    with open(log_dir / f"{state['asset']}.{action}.{start}.json", "w") as handle:
+        handle.write(line)
+
+
+def _screen(state):
+    _record(state, "screen")
+    if state["asset"] == "BAD":
+        raise RuntimeError("no data")
+    return {**state, "score": 0 if state["asset"] == "FLAT" else 1}
+
+
+def _guards(state):
+    _record(state, "guards")
+    return state
+
+
+class FakeOrchestrator:
+    def __init__(self, router_path, log_dir):
+        self.log_dir = log_dir
+        self.state_machine = StateMachine(router_path=router_path)
+        self.state_machine.register_handlers(
+            {"run_screening_long": _screen, "run_guards": _guards}
+        )
+
+    def initial_state(self, asset, run_id, family_id="A", fast_mode=False):
+        return {"asset": asset, "run_id": run_id, "log_dir": self.log_dir, "score": None}
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    router = tmp_path / "router.yaml"
+    router.write_text(ROUTER, encoding="utf-8")
+    log_dir = tmp_path / "log"
+    log_dir.mkdir()
+
+    def run(assets, **kwargs):
+        return run_batch(
+            assets,
+            "r1",
+            orchestrator_factory=FakeOrchestrator,
+            factory_args=(str(router), str(log_dir)),
+            status_path=tmp_path / "status.json",
+            **kwargs,
+        )
+
+    def calls():
+        return [json.loads(path.read_text()) for path in log_dir.glob("*.json")]
+
+    return run, calls, tmp_path
+
+
+def _max_overlap(intervals):
+    events = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    current = peak = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def test_batch_respects_resource_limits_and_writes_status(batch):
+    run, calls, tmp_path = batch
+
+    results = run(["A", "B", "FLAT", "BAD"], workers=3, limits={"screening": 1})
+
+    assert results["A"]["_final_state"] == "PROD_READY" and results["A"]["_success"] is True
+    assert results["FLAT"]["_final_state"] == "REJECT" and results["FLAT"]["_success"] is False
+    assert results["BAD"]["_final_state"] == "ERROR" and "no data" in results["BAD"]["_error"]
+    screens = [(call["start"], call["end"]) for call in calls() if call["action"] == "screen"]
+    assert len(screens) == 4
+    assert _max_overlap(screens) == 1
+
+    status = json.loads((tmp_path / "status.json").read_text())
+    assert status["counts"] == {"done": 3, "error": 1}
+    assert status["assets"]["B"]["state"] == "PROD_READY"
+    assert status["assets"]["BAD"]["status"] == "error"
+    assert load_checkpoint("A", "r1")["history"] == [
+        "INIT -> SCREEN",
+        "SCREEN -> SCORE",
+        "SCORE -> PROD_READY",
+    ]
+
+
+def test_batch_resumes_from_checkpoints(batch):
+    run, calls, tmp_path = batch
+    run(["A", "B"], workers=2)
+    assert len(calls()) == 4
+
+    # Pretend B was interrupted while its guards were running.
+    saved = load_checkpoint("B", "r1")
+    saved.update(state_name="SCORE", steps=2, done=False, history=saved["history"][:2])
+    for key in ("_final_state", "_success", "_total_steps"):
+        saved["state"].pop(key)
+    checkpoint_path("B", "r1").write_text(json.dumps(saved))
+
+    results = run(["A", "B"], workers=2)
+
+    new_calls = sorted((call["asset"], call["action"]) for call in calls())
+    assert new_calls.count(("B", "guards")) == 2 and new_calls.count(("B", "screen")) == 1
+    assert new_calls.count(("A", "screen")) == 1
+    assert results["B"]["_final_state"] == "PROD_READY"
+    assert results["B"]["_total_steps"] == 3
+
+
+def test_next_action_follows_transition_conditions(tmp_path):
+    router = tmp_path / "router.yaml"
+    router.write_text(ROUTER, encoding="utf-8")
+    machine = StateMachine(router_path=str(router))
+
+    assert machine.next_action("INIT", {}) is None
+    assert machine.next_action("SCREEN", {}) == "run_screening_long"
+    assert machine.next_action("SCORE", {"score": 1}) == "run_guards"
+    assert machine.next_action("SCORE", {"score": 0}) is None
+    assert machine.next_action("PROD_READY", {}) is None
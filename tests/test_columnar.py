@@ -0,0 +1,130 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.data.columnar import HEADER_SIZE, RECORD, OHLCVFile
+from crypto_backtest.data.storage import CacheKey, ColumnarStore
+from crypto_backtest.optimization.parallel_optimizer import data_path, load_data
+
+
+def _sample_ohlcv(rows: int = 48, start: str = "2024-01-01", seed: int = 2) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.DatetimeIndex(
+        pd.date_range(start, periods=rows, freq="h", tz="UTC"), freq=None, name="timestamp"
+    )
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, rows))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.uniform(1.0, 10.0, rows),
+        },
+        index=index,
+    )
+
+
+def test_roundtrip_and_header(tmp_path):
+    data = _sample_ohlcv()
+    file = OHLCVFile.write(tmp_path / "BTC_1H.ohlcv", data)
+
+    header = file.header
+    assert header.n_rows == len(data)
+    assert header.interval_ns == pd.Timedelta(hours=1).value
+    assert header.regular
+    assert (tmp_path / "BTC_1H.ohlcv").stat().st_size == HEADER_SIZE + len(data) * RECORD.itemsize
+    pd.testing.assert_frame_equal(file.read(), data)
+
+
+@pytest.mark.parametrize("gap", [False, True])
+def test_timestamp_slices_match_loc(tmp_path, gap):
+    data = _sample_ohlcv()
+    if gap:
+        data = data.drop(data.index[10:15])
+    file = OHLCVFile.write(tmp_path / "BTC_1H.ohlcv", data)
+    assert file.header.regular is not gap
+
+    windows = [
+        ("2024-01-01 05:00", "2024-01-01 20:00"),
+        ("2024-01-01 05:30", "2024-01-01 19:59"),
+        ("2023-12-31", "2024-01-01 03:00"),
+        ("2024-01-02 20:00", "2024-01-05"),
+        ("2024-01-01 11:00", "2024-01-01 13:00"),
+        ("2024-02-01", None),
+        (None, "2023-01-01"),
+    ]
+    for start, end in windows:
+        expected = data.loc[
+            pd.Timestamp(start, tz="UTC") if start else None : pd.Timestamp(end, tz="UTC") if end else None
+        ]
+        pd.testing.assert_frame_equal(file.read(start, end), expected)
+
+
+def test_append_only_adds_newer_bars(tmp_path):
+    data = _sample_ohlcv(72)
+    file = OHLCVFile.write(tmp_path / "BTC_1H.ohlcv", data.iloc[:40])
+
+    assert file.append(data.iloc[30:60]) == 20
+    assert file.append(data.iloc[50:60]) == 0
+    assert file.append(data.iloc[60:]) == 12
+    assert file.header.regular
+    pd.testing.assert_frame_equal(file.read(), data)
+
+    with pytest.raises(ValueError):
+        file.append(data.iloc[::-1])
+
+
+def test_columnar_store_appends(tmp_path):
+    store = ColumnarStore(str(tmp_path))
+    key = CacheKey("binance", "BTC/USDT", "1h")
+    data = _sample_ohlcv(30).reset_index()
+
+    assert store.load(key) is None
+    store.save(key, data.iloc[:20])
+    assert store.append(key, data.iloc[15:]) == 10
+    pd.testing.assert_frame_equal(store.load(key), data)
+
+
+def test_load_data_prefers_native_file_and_windows(tmp_path):
+    data = _sample_ohlcv()
+    OHLCVFile.write(tmp_path / "TEST_1H.ohlcv", data)
+
+    pd.testing.assert_frame_equal(load_data("TEST", str(tmp_path)), data)
+    window = load_data("TEST", str(tmp_path), start="2024-01-01T06:00:00+00:00", end="2024-01-01T09:00:00+00:00")
+    pd.testing.assert_frame_equal(window, data.iloc[6:10])
+
+
+def test_load_data_reads_a_newer_parquet_over_a_stale_native_file(tmp_path):
+    pytest.importorskip("pyarrow")
+    data = _sample_ohlcv()
+    native = OHLCVFile.write(tmp_path / "TEST_1H.ohlcv", data.iloc[:24]).path
+    refreshed = tmp_path / "TEST_1H.parquet"
+    data.to_parquet(refreshed)
+    os.utime(native, ns=(1, 1))
+
+    assert data_path("TEST", str(tmp_path)) == refreshed
+    assert len(load_data("TEST", str(tmp_path))) == len(data)
+
+    os.utime(refreshed, ns=(1, 1))  # Same mtime: the native file wins.
+    assert data_path("TEST", str(tmp_path)) == native
+
+
+def test_misaligned_bar_falls_back_to_binary_search(tmp_path):
+    data = _sample_ohlcv(4)
+    data.index = pd.DatetimeIndex(
+        pd.to_datetime(["2024-01-01 00:00", "2024-01-01 01:30", "2024-01-01 02:00", "2024-01-01 03:00"], utc=True),
+        name="timestamp",
+    )
+    file = OHLCVFile.write(tmp_path / "BTC_1H.ohlcv", data, interval=pd.Timedelta(hours=1))
+    assert not file.header.regular
+    assert file.read("2024-01-01 01:00", "2024-01-01 01:00").empty
+
+    appended = OHLCVFile.write(tmp_path / "ETH_1H.ohlcv", data.iloc[:1], interval=pd.Timedelta(hours=1))
+    appended.append(data.iloc[1:])
+    assert not appended.header.regular
+    for start, end in [("2024-01-01 01:00", "2024-01-01 01:00"), ("2024-01-01 00:30", "2024-01-01 02:00")]:
+        expected = data.loc[pd.Timestamp(start, tz="UTC") : pd.Timestamp(end, tz="UTC")]
+        pd.testing.assert_frame_equal(appended.read(start, end), expected)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.analysis.metrics import (
+    CORE_METRICS,
+    _periods_per_year,
+    _trade_pnl,
+    compute_core_metrics,
+    compute_metrics,
+)
+from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(rows: int = 1500, seed: int = 21) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": 1.0},
+        index=index,
+    )
+
+
+def _assert_core_parity(equity: pd.Series, trades: pd.DataFrame) -> None:
+    full = compute_metrics(equity, trades)
+    core = compute_core_metrics(
+        equity.to_numpy(),
+        _trade_pnl(trades).to_numpy(),
+        _periods_per_year(equity.dropna().index),
+    )
+    assert tuple(core) == CORE_METRICS
+    for key in CORE_METRICS:
+        assert core[key] == pytest.approx(full[key], rel=1e-12, abs=1e-15), key
+
+
+def test_core_metrics_match_full_metrics_on_backtest():
+    data = _sample_ohlcv()
+    result = VectorizedBacktester(BacktestConfig()).run(
+        data, FinalTriggerStrategy(FinalTriggerParams())
+    )
+
+    assert len(result.trades) > 0
+    _assert_core_parity(result.equity_curve, result.trades)
+
+
+@pytest.mark.parametrize("freq", ["h", "4h", "D"])
+def test_core_metrics_match_full_metrics_on_equity(freq):
+    rng = np.random.default_rng(4)
+    index = pd.date_range("2023-01-01", periods=700, freq=freq, tz="UTC")
+    equity = pd.Series(10_000.0 * np.cumprod(1.0 + rng.normal(0.0002, 0.01, 700)), index=index)
+    equity.iloc[[0, 350]] = np.nan
+    trades = pd.DataFrame(
+        {
+            "entry_time": np.repeat(index[:40], 3),
+            "pnl": rng.normal(5.0, 50.0, 120),
+        }
+    )
+
+    _assert_core_parity(equity, trades)
+
+
+def test_core_metrics_edge_cases():
+    assert compute_core_metrics(np.array([])) == {}
+
+    flat = compute_core_metrics(np.full(10, 100.0), np.array([1.0, 2.0]))
+    assert flat["sharpe_ratio"] == 0.0
+    assert flat["max_drawdown_duration"] == 0.0
+    assert flat["profit_factor"] == 0.0  # infinite profit factor maps to 0 as in compute_metrics
+
+    underwater = compute_core_metrics(np.array([100.0, 90.0, 95.0, 101.0, 99.0, 98.0, 97.0, 102.0]))
+    assert underwater["max_drawdown_duration"] == 3.0
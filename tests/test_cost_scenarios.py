@@ -0,0 +1,84 @@
+"""Cost sweep on a fixed signal frame versus one full backtest per scenario."""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.analysis.metrics import compute_metrics
+from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.strategies.base import BaseStrategy
+
+
+class _FixedSignals(BaseStrategy):
+    def __init__(self, signals: pd.DataFrame) -> None:
+        self.signals = signals
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        return self.signals
+
+
+def _market(rows: int = 2000, seed: int = 5) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2021-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0002, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0.0, 0.006, rows)) * close
+    data = pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": 1.0,
+        },
+        index=index,
+    )
+    signal = rng.choice([-1, 0, 0, 0, 0, 0, 1], size=rows)
+    atr = pd.Series(data["high"] - data["low"]).rolling(14, min_periods=1).mean().to_numpy()
+    direction = signal.astype(float)
+    entry = np.where(signal != 0, close, np.nan)
+    signals = pd.DataFrame(
+        {
+            "signal": signal,
+            "entry_price": entry,
+            "sl_price": entry - direction * 2.0 * atr,
+            "tp1_price": entry + direction * 1.5 * atr,
+            "tp2_price": entry + direction * 3.0 * atr,
+            "tp3_price": entry + direction * 5.0 * atr,
+        },
+        index=index,
+    )
+    return data, signals
+
+
+@pytest.mark.parametrize("sizing_mode", ["fixed", "equity"])
+def test_cost_sweep_matches_individual_runs(sizing_mode):
+    data, signals = _market()
+    config = BacktestConfig(sizing_mode=sizing_mode)
+    scenarios = [(0.0, 0.0), (5.0, 2.0), (10.0, 5.0), (20.0, 8.0)]
+
+    sweep = VectorizedBacktester(config).run_cost_scenarios(data, signals, scenarios)
+
+    assert list(sweep[["fees_bps", "slippage_bps"]].itertuples(index=False, name=None)) == scenarios
+    for row, (fees, slippage) in zip(sweep.itertuples(index=False), scenarios):
+        scenario_config = replace(config, fees_bps=fees, slippage_bps=slippage)
+        result = VectorizedBacktester(scenario_config).run(data, _FixedSignals(signals))
+        metrics = compute_metrics(result.equity_curve, result.trades)
+
+        assert row.trades == len(result.trades)
+        assert row.final_equity == pytest.approx(result.equity_curve.iloc[-1], rel=1e-12)
+        for key in ("total_return", "sharpe_ratio", "max_drawdown", "profit_factor", "win_rate"):
+            assert getattr(row, key) == pytest.approx(metrics[key], rel=1e-9, abs=1e-12), key
+
+
+def test_cost_sweep_without_trades_is_flat():
+    data, signals = _market(rows=100)
+    signals["signal"] = 0
+
+    sweep = VectorizedBacktester(BacktestConfig()).run_cost_scenarios(data, signals, [(5.0, 2.0)])
+
+    assert sweep.loc[0, "trades"] == 0
+    assert sweep.loc[0, "final_equity"] == 10_000.0
+    assert sweep.loc[0, "sharpe_ratio"] == 0.0
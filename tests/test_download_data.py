@@ -0,0 +1,50 @@
+import types
+
+import pandas as pd
+
+from crypto_backtest.data import downloader as downloader_module
+from scripts.download_data import download_all
+
+HOUR_MS = 3_600_000
+DAY_MS = 24 * HOUR_MS
+
+
+class LiveExchange:
+    """Hourly candles up to now; pages starting before ``fail_before`` raise."""
+
+    rateLimit = 0
+
+    def __init__(self, fail_before: int | None = None) -> None:
+        self.fail_before = fail_before
+        self.calls: list[int] = []
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return 3600
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append(since)
+        if self.fail_before is not None and since < self.fail_before:
+            raise ConnectionError("page unavailable")
+        now_ms = int(pd.Timestamp.now(tz="UTC").value // 1_000_000)
+        first = -(-since // HOUR_MS) * HOUR_MS
+        return [[ts, 1.0, 1.0, 1.0, 1.0, 1.0] for ts in range(first, now_ms, HOUR_MS)][:limit]
+
+
+def test_rerun_resumes_from_checkpoints(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader_module, "time", types.SimpleNamespace(sleep=lambda _: None))
+    now_ms = int(pd.Timestamp.now(tz="UTC").value // 1_000_000)
+    failing = LiveExchange(fail_before=now_ms - 99 * DAY_MS)
+    monkeypatch.setattr(downloader_module, "_ccxt_exchange", lambda _: failing)
+
+    first = download_all(["BTC"], output_dir=str(tmp_path), days_back=100, format="csv", workers=2)
+    assert first["failed"] == ["BTC"]
+    saved_page = sorted(set(failing.calls))[1]
+
+    healthy = LiveExchange()
+    monkeypatch.setattr(downloader_module, "_ccxt_exchange", lambda _: healthy)
+    second = download_all(["BTC"], output_dir=str(tmp_path), days_back=100, format="csv", workers=2)
+
+    assert second["success"] == ["BTC"]
+    assert saved_page not in healthy.calls
+    assert len(healthy.calls) == 2
+    assert len(pd.read_csv(tmp_path / "BTC_1H.csv")) >= 100 * 24
@@ -0,0 +1,169 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.data.downloader import ConcurrentDownloader, DownloadJob, TokenBucket
+
+HOUR_MS = 3_600_000
+START_MS = int(pd.Timestamp("2024-01-01", tz="UTC").value // 1_000_000)
+
+
+def _candle(bar: int) -> list[float]:
+    price = 100.0 + 10.0 * np.sin(bar / 5.0)
+    return [START_MS + bar * HOUR_MS, price, price + 1.0, price - 1.0, price, float(bar)]
+
+
+class FakeExchange:
+    """Serves fixture candles like ccxt's ``fetch_ohlcv`` (bars from ``since``, up to ``limit``)."""
+
+    rateLimit = 0
+
+    def __init__(self, n_bars: int, missing: set[int] = frozenset(), latency: float = 0.0, fail_on=None):
+        self.candles = [_candle(bar) for bar in range(n_bars) if bar not in missing]
+        self.latency = latency
+        self.fail_on = set(fail_on or ())
+        self.calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return 3600
+
+    def milliseconds(self) -> int:
+        return START_MS + len(self.candles) * HOUR_MS
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        with self._lock:
+            self.calls.append(since)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if since in self.fail_on:
+                raise ConnectionError(f"page {since} unavailable")
+            time.sleep(self.latency)
+            rows = [row for row in self.candles if row[0] >= since]
+            return rows[:limit]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _expected(exchange: FakeExchange, until_ms: int) -> pd.DataFrame:
+    frame = pd.DataFrame(
+        [row for row in exchange.candles if row[0] < until_ms],
+        columns=["timestamp", "open", "high", "low", "close", "volume"],
+    )
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"].astype(np.int64), unit="ms", utc=True)
+    return frame
+
+
+def test_parallel_pages_match_fixture_with_gaps():
+    exchange = FakeExchange(250, missing={3, 40, 41, 199})
+    downloader = ConcurrentDownloader(lambda _: exchange, max_workers=4, page_limit=50)
+    until_ms = START_MS + 240 * HOUR_MS
+
+    data = downloader.fetch(DownloadJob("fake", "BTC/USDT", "1h", START_MS, until_ms))
+
+    pd.testing.assert_frame_equal(data, _expected(exchange, until_ms))
+    assert sorted(exchange.calls) == [START_MS + k * 50 * HOUR_MS for k in range(5)]
+    assert exchange.max_active > 1
+
+
+def test_each_thread_uses_its_own_client():
+    clients = []
+
+    class ThreadBoundExchange(FakeExchange):
+        def __init__(self):
+            super().__init__(200, latency=0.01)
+            self.owner = threading.get_ident()
+
+        def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+            assert threading.get_ident() == self.owner
+            return super().fetch_ohlcv(symbol, timeframe, since, limit)
+
+    def factory(_):
+        client = ThreadBoundExchange()
+        clients.append(client)
+        return client
+
+    downloader = ConcurrentDownloader(factory, max_workers=4, page_limit=10)
+    data = downloader.fetch(DownloadJob("fake", "BTC/USDT", "1h", START_MS, START_MS + 200 * HOUR_MS))
+
+    assert len(data) == 200
+    assert 1 < len(clients) <= 5
+    assert sum(len(client.calls) for client in clients) == 20
+
+
+def test_failed_pages_resume_from_checkpoint(tmp_path):
+    failing = FakeExchange(200, fail_on={START_MS + 100 * HOUR_MS})
+    downloader = ConcurrentDownloader(
+        lambda _: failing, max_workers=2, page_limit=50, checkpoint_dir=tmp_path, retries=0
+    )
+    job = DownloadJob("fake", "ETH/USDT", "1h", START_MS, START_MS + 200 * HOUR_MS)
+
+    result = downloader.fetch_many([job])[0]
+    assert isinstance(result.error, ConnectionError)
+    assert len(list((tmp_path / job.name).glob("*.npy"))) == 3
+
+    healthy = FakeExchange(200)
+    resumed = ConcurrentDownloader(lambda _: healthy, page_limit=50, checkpoint_dir=tmp_path)
+    data = resumed.fetch(job)
+
+    assert healthy.calls == [START_MS + 100 * HOUR_MS]
+    pd.testing.assert_frame_equal(data, _expected(healthy, job.until_ms))
+    assert not (tmp_path / job.name).exists()
+
+
+def test_fetch_many_reports_errors_per_job():
+    exchanges = {"good": FakeExchange(30)}
+
+    def factory(exchange_id):
+        if exchange_id not in exchanges:
+            raise ValueError(f"Unsupported exchange: {exchange_id}")
+        return exchanges[exchange_id]
+
+    downloader = ConcurrentDownloader(factory, page_limit=10)
+    results = downloader.fetch_many(
+        [DownloadJob("good", "A/USDT", "1h", START_MS), DownloadJob("bad", "B/USDT", "1h", START_MS)]
+    )
+
+    assert len(results[0].data) == 30 and results[0].error is None
+    assert results[1].data is None and isinstance(results[1].error, ValueError)
+
+
+def test_token_bucket_paces_requests():
+    now = [0.0]
+    waits = []
+
+    def sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=4.0, capacity=2.0, clock=lambda: now[0], sleep=sleep)
+    for _ in range(6):
+        bucket.acquire()
+
+    assert now[0] == pytest.approx(1.0)
+    assert waits == pytest.approx([0.25, 0.25, 0.25, 0.25])
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0.0)
+
+
+def test_rate_limit_is_shared_per_exchange():
+    exchange = FakeExchange(100)
+    downloader = ConcurrentDownloader(
+        lambda _: exchange, max_workers=8, page_limit=10, requests_per_second={"fake": 50.0}
+    )
+    jobs = [DownloadJob("fake", f"S{i}/USDT", "1h", START_MS) for i in range(2)]
+
+    started = time.monotonic()
+    results = downloader.fetch_many(jobs)
+    elapsed = time.monotonic() - started
+
+    assert all(result.error is None for result in results)
+    # 20 requests at 50/s with a one-token burst take at least 19 / 50 s.
+    assert elapsed >= 19 / 50 - 0.02
@@ -0,0 +1,192 @@
+"""Parity between the FinalTrigger arming kernel and the original bar loop."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.strategies.final_trigger import (
+    _ARMING_STATE_COLUMNS,
+    _arming_kernel,
+    _trade_op_kernel,
+)
+
+
+def _reference_arming(inputs, enable_long, enable_short, use_mk, strict_lock, grace_bars):
+    """Original ``generate_signals`` loop, kept verbatim as the reference."""
+    (
+        ichi_long_active,
+        ichi_short_active,
+        cycle_reset,
+        bullish_signal,
+        bearish_signal,
+        cond_mk_long,
+        cond_mk_short,
+        cross_long_ok,
+        cross_short_ok,
+    ) = inputs
+    n = len(ichi_long_active)
+    new_long_close = np.zeros(n, dtype=bool)
+    new_short_close = np.zeros(n, dtype=bool)
+    states = np.zeros((len(_ARMING_STATE_COLUMNS), n), dtype=bool)
+
+    lock_long_cycle = lock_short_cycle = False
+    pending_long = pending_short = False
+    final_long_active = final_short_active = False
+
+    for i in range(n):
+        prev_pending_long = pending_long
+        prev_pending_short = pending_short
+
+        armed_long_strict = enable_long and ichi_long_active[i] and (
+            not use_mk or cond_mk_long[i]
+        )
+        armed_short_strict = enable_short and ichi_short_active[i] and (
+            not use_mk or cond_mk_short[i]
+        )
+        armed_long_grace_ok = enable_long and ichi_long_active[i] and (
+            not use_mk or cond_mk_long[i] or cross_long_ok[i]
+        )
+        armed_short_grace_ok = enable_short and ichi_short_active[i] and (
+            not use_mk or cond_mk_short[i] or cross_short_ok[i]
+        )
+
+        if cycle_reset[i]:
+            lock_long_cycle = lock_short_cycle = False
+            pending_long = pending_short = False
+
+        if enable_long and not ichi_long_active[i]:
+            final_long_active = False
+        if enable_short and not ichi_short_active[i]:
+            final_short_active = False
+        if not enable_long:
+            pending_long = lock_long_cycle = final_long_active = False
+        if not enable_short:
+            pending_short = lock_short_cycle = final_short_active = False
+
+        if enable_long and (
+            strict_lock and bullish_signal[i] and ichi_long_active[i] and not armed_long_strict
+        ):
+            if grace_bars == 1:
+                pending_long = True
+            else:
+                lock_long_cycle = True
+
+        if enable_short and (
+            strict_lock and bearish_signal[i] and ichi_short_active[i] and not armed_short_strict
+        ):
+            if grace_bars == 1:
+                pending_short = True
+            else:
+                lock_short_cycle = True
+
+        if enable_long and prev_pending_long and not armed_long_grace_ok:
+            pending_long = False
+            if strict_lock:
+                lock_long_cycle = True
+
+        if enable_short and prev_pending_short and not armed_short_grace_ok:
+            pending_short = False
+            if strict_lock:
+                lock_short_cycle = True
+
+        allow_long = enable_long and (not strict_lock or not lock_long_cycle)
+        allow_short = enable_short and (not strict_lock or not lock_short_cycle)
+        pending_long_ok = enable_long and grace_bars == 1 and prev_pending_long and armed_long_grace_ok
+        pending_short_ok = (
+            enable_short and grace_bars == 1 and prev_pending_short and armed_short_grace_ok
+        )
+        trigger_long = enable_long and ((bullish_signal[i] and armed_long_strict) or pending_long_ok)
+        trigger_short = enable_short and (
+            (bearish_signal[i] and armed_short_strict) or pending_short_ok
+        )
+
+        new_long = trigger_long and allow_long and not final_long_active
+        new_short = trigger_short and allow_short and not final_short_active
+        if new_long:
+            final_long_active, final_short_active = True, False
+            pending_long = False
+            new_long_close[i] = True
+        if new_short:
+            final_short_active, final_long_active = True, False
+            pending_short = False
+            new_short_close[i] = True
+
+        states[:, i] = (
+            armed_long_strict,
+            armed_short_strict,
+            armed_long_grace_ok,
+            armed_short_grace_ok,
+            pending_long,
+            pending_short,
+            lock_long_cycle,
+            lock_short_cycle,
+            allow_long,
+            allow_short,
+            trigger_long,
+            trigger_short,
+            final_long_active,
+            final_short_active,
+        )
+    return new_long_close, new_short_close, states
+
+
+def _random_inputs(rows: int = 2000, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    all_bullish = rng.random(rows) < 0.2
+    all_bearish = rng.random(rows) < 0.2
+    buy_raw, sell_raw, long_active, short_active = _trade_op_kernel(all_bullish, all_bearish)
+    return (
+        long_active,
+        short_active,
+        buy_raw | sell_raw,
+        rng.random(rows) < 0.3,
+        rng.random(rows) < 0.3,
+        rng.random(rows) < 0.5,
+        rng.random(rows) < 0.5,
+        rng.random(rows) < 0.2,
+        rng.random(rows) < 0.2,
+    )
+
+
+def test_trade_op_kernel_tracks_active_side():
+    all_bullish = np.array([0, 1, 1, 0, 1, 0, 0, 1], dtype=bool)
+    all_bearish = np.array([1, 0, 0, 1, 1, 1, 0, 0], dtype=bool)
+
+    buy_raw, sell_raw, long_active, short_active = _trade_op_kernel(all_bullish, all_bearish)
+
+    np.testing.assert_array_equal(buy_raw, [0, 1, 0, 0, 1, 0, 0, 1])
+    np.testing.assert_array_equal(sell_raw, [0, 0, 0, 1, 0, 1, 0, 0])
+    np.testing.assert_array_equal(long_active, [0, 1, 1, 0, 1, 0, 0, 1])
+    np.testing.assert_array_equal(short_active, [0, 0, 0, 1, 0, 1, 1, 0])
+
+
+@pytest.mark.parametrize(
+    "enable_long,enable_short,use_mk,strict_lock,grace_bars",
+    list(itertools.product([True, False], [True, False], [True, False], [True, False], [0, 1])),
+)
+def test_arming_kernel_matches_reference(enable_long, enable_short, use_mk, strict_lock, grace_bars):
+    inputs = _random_inputs(seed=grace_bars + 2 * strict_lock)
+    flags = (enable_long, enable_short, use_mk, strict_lock, grace_bars)
+
+    new_long, new_short, states = _arming_kernel(*inputs, *flags[:4], grace_bars == 1, True)
+    expected = _reference_arming(inputs, *flags)
+
+    np.testing.assert_array_equal(new_long, expected[0])
+    np.testing.assert_array_equal(new_short, expected[1])
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(dict(zip(_ARMING_STATE_COLUMNS, states))),
+        pd.DataFrame(dict(zip(_ARMING_STATE_COLUMNS, expected[2]))),
+    )
+
+
+def test_arming_kernel_skips_states_unless_requested():
+    inputs = _random_inputs(rows=300)
+
+    with_states = _arming_kernel(*inputs, True, True, True, True, True, True)
+    without_states = _arming_kernel(*inputs, True, True, True, True, True, False)
+
+    assert without_states[2].shape == (len(_ARMING_STATE_COLUMNS), 0)
+    np.testing.assert_array_equal(with_states[0], without_states[0])
+    np.testing.assert_array_equal(with_states[1], without_states[1])
@@ -2,6 +2,7 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 # Allow importing scripts as modules
 SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
@@ -22,3 +23,103 @@ def test_pvalue_minimum_bound():
     actual = 10.0
     p_value = rgm._mc_pvalue(shuffled, actual)
     assert p_value >= 1.0 / (len(shuffled) + 1)
+
+
+@pytest.mark.parametrize("threshold", [-1, 0, 1, 17, 49, 50, 60])
+def test_break_even_bisection_matches_linear_scan(monkeypatch, threshold):
+    calls = []
+
+    def fake_scenarios(data, signals, scenarios):
+        fees, _ = scenarios[0]
+        calls.append(fees)
+        edge = threshold - fees + 0.5
+        return [{"total_return_pct": edge, "sharpe": edge}]
+
+    monkeypatch.setattr(rgm, "_run_scenarios", fake_scenarios)
+    expected = max([fees for fees in range(0, 51) if fees <= threshold], default=0)
+
+    result = rgm._find_break_even_fees(None, {}, signals=object())
+
+    assert result == float(expected)
+    assert len(calls) <= 8
+
+
+def test_schedule_orders_longest_recorded_runtime_first():
+    runtimes = {"BTC": {"mc": 5.0, "sensitivity": 1.0}, "ETH": {"mc": 50.0}}
+
+    order = rgm._schedule(["BTC", "ETH"], {"mc", "sensitivity", "wfe"}, runtimes)
+
+    assert order[0] == ("ETH", "mc")
+    assert order[1] == ("BTC", "mc")
+    # ETH has no sensitivity record: it is estimated from BTC's.
+    assert rgm._expected_seconds(runtimes, "ETH", "sensitivity") == 1.0
+    assert rgm._expected_seconds(runtimes, "ETH", "base") == rgm.DEFAULT_TASK_SECONDS["base"]
+    assert len(order) == 6
+
+
+PARAMS = {
+    "sl_mult": 3.0, "tp1_mult": 2.0, "tp2_mult": 4.0, "tp3_mult": 6.0,
+    "tenkan": 9, "kijun": 26, "tenkan_5": 9, "kijun_5": 26, "wfe": 0.7,
+}
+
+
+def _btc_data_dir(tmp_path):
+    source = Path(__file__).resolve().parents[1] / "data" / "Binance_BTCUSDT_1h.csv"
+    if not source.exists():
+        pytest.skip("BTC sample data not available")
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    lines = source.read_text().splitlines()
+    (data_dir / source.name).write_text("\n".join(lines[:4001]) + "\n")
+    return data_dir
+
+
+def test_flat_scheduler_matches_per_asset_rows(tmp_path, monkeypatch):
+    data_dir = _btc_data_dir(tmp_path)
+    params = PARAMS
+    guards = {"mc", "bootstrap", "trade_dist", "regime", "wfe"}
+    expected = rgm._asset_guard_worker(
+        "BTC", params, str(data_dir), str(tmp_path / "a"), "run",
+        guards, 20, 100, 1, [], None, None,
+    )
+
+    # Count baseline backtests across the pool's (forked) workers.
+    backtests = tmp_path / "backtests.log"
+    run_backtest = rgm._run_backtest
+
+    def counted_backtest(*args, **kwargs):
+        with open(backtests, "a") as handle:
+            handle.write("x")
+        return run_backtest(*args, **kwargs)
+
+    monkeypatch.setattr(rgm, "_run_backtest", counted_backtest)
+
+    settings = rgm.GuardSettings(guards=frozenset(guards), mc_iterations=20, bootstrap_samples=100)
+    rows = rgm.run_guards_flat(
+        {"BTC": params, "NOPE": params}, str(data_dir), str(tmp_path / "b"), "run", settings,
+        workers=2,
+    )
+
+    assert rows[0] == expected
+    assert rows[1]["asset"] == "NOPE" and "No data found" in rows[1]["error"]
+    runtimes = rgm._load_runtimes(tmp_path / "b" / rgm.RUNTIMES_FILE)
+    assert set(runtimes["BTC"]) == {"base", "mc", "bootstrap", "trade_dist", "regime"}
+    assert backtests.read_text() == "x"
+
+
+def test_flat_scheduler_skips_guards_after_failed_base(tmp_path, monkeypatch):
+    data_dir = _btc_data_dir(tmp_path)
+
+    def no_trades(pnls, guards):
+        raise RuntimeError("No trades for guard calculations.")
+
+    def guard_call(name, **kwargs):
+        raise AssertionError("guard task submitted")
+
+    monkeypatch.setattr(rgm, "_check_trades", no_trades)
+    monkeypatch.setattr(rgm, "_guard_call", guard_call)
+    settings = rgm.GuardSettings(guards=frozenset({"mc", "bootstrap"}), mc_iterations=20)
+
+    rows = rgm.run_guards_flat({"BTC": PARAMS}, str(data_dir), str(tmp_path / "b"), "run", settings)
+
+    assert rows[0]["error"] == "No trades for guard calculations."
@@ -0,0 +1,74 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.indicators.cache import IndicatorCache
+from crypto_backtest.indicators.five_in_one import FiveInOneConfig
+from crypto_backtest.indicators.ichimoku import IchimokuConfig
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(rows: int = 800, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    volume = rng.uniform(100.0, 200.0, rows)
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
+
+
+def test_cache_lru_eviction_and_stats():
+    data = _sample_ohlcv(10)
+    cache = IndicatorCache(maxsize=2)
+
+    cache.get_or_compute(data, "a", lambda: 1)
+    cache.get_or_compute(data, "b", lambda: 2)
+    assert cache.get_or_compute(data, "a", lambda: -1) == 1
+    cache.get_or_compute(data, "c", lambda: 3)
+
+    assert len(cache) == 2
+    assert cache.get_or_compute(data, "b", lambda: 20) == 20
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+
+def test_cache_is_cleared_for_a_different_dataset():
+    cache = IndicatorCache()
+    first = _sample_ohlcv(10)
+    second = first.copy()
+
+    cache.get_or_compute(first, "atr", lambda: "first")
+
+    assert cache.get_or_compute(second, "atr", lambda: "second") == "second"
+
+
+def test_cached_strategy_matches_uncached_and_reuses_skeleton():
+    data = _sample_ohlcv()
+    cache = IndicatorCache()
+    base = FinalTriggerParams(
+        use_mama_kama_filter=True,
+        ichimoku=IchimokuConfig(tenkan=7, kijun=22, displacement=52),
+        five_in_one=FiveInOneConfig(use_kama_oscillator=True, tenkan_5=8, kijun_5=21),
+    )
+
+    for sl_mult, tp1_mult in [(2.0, 1.0), (3.5, 2.5), (1.25, 0.75)]:
+        params = replace(base, sl_mult=sl_mult, tp1_mult=tp1_mult)
+        expected = FinalTriggerStrategy(params).generate_signals(data)
+        result = FinalTriggerStrategy(params, cache=cache).generate_signals(data)
+        pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+    misses_after_atr_phase = cache.misses
+    params = replace(base, sl_mult=4.0)
+    FinalTriggerStrategy(params, cache=cache).generate_signals(data)
+    assert cache.misses == misses_after_atr_phase
+
+    params = replace(base, five_in_one=replace(base.five_in_one, kijun_5=30))
+    expected = FinalTriggerStrategy(params).generate_signals(data)
+    result = FinalTriggerStrategy(params, cache=cache).generate_signals(data)
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
@@ -0,0 +1,84 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.data import shared
+from crypto_backtest.data.ohlcv_cache import OHLCVCache, load_ohlcv, read_ohlcv, share_ohlcv
+
+
+def _write_csv(path, rows: int = 50, seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, rows))
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="h").strftime("%Y-%m-%d %H:%M:%S"),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.integers(1, 100, rows),
+        }
+    )
+    frame.to_csv(path, index=False)
+    return frame
+
+
+def test_read_ohlcv_normalizes_index_and_dtypes(tmp_path):
+    path = tmp_path / "Binance_TESTUSDT_1h.csv"
+    _write_csv(path)
+
+    data = read_ohlcv(path)
+
+    assert list(data.columns) == ["open", "high", "low", "close", "volume"]
+    assert str(data.index.tz) == "UTC"
+    assert all(dtype == np.float64 for dtype in data.dtypes)
+
+
+def test_cache_reuses_parsed_frame_until_mtime_changes(tmp_path):
+    path = tmp_path / "Binance_TESTUSDT_1h.csv"
+    _write_csv(path)
+    cache = OHLCVCache()
+
+    first = cache.load(path)
+    second = cache.load(path)
+    assert (cache.hits, cache.misses) == (1, 1)
+    pd.testing.assert_frame_equal(first, second)
+
+    second.index = second.index.tz_convert("Europe/Paris")
+    second["extra"] = 1.0
+    assert list(cache.load(path).columns) == list(first.columns)
+    assert str(cache.load(path).index.tz) == "UTC"
+    with pytest.raises(ValueError):
+        first.iloc[0, 0] = 0.0
+
+    _write_csv(path, seed=5)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = cache.load(path)
+    assert cache.misses == 2
+    pd.testing.assert_frame_equal(reloaded, read_ohlcv(path))
+
+
+def _worker_load(path: str) -> tuple[float, bool]:
+    data = load_ohlcv(path)
+    return float(data["close"].sum()), bool(shared._ATTACHED)
+
+
+def test_share_ohlcv_lets_workers_attach(tmp_path):
+    path = tmp_path / "Binance_TESTUSDT_1h.csv"
+    _write_csv(path)
+    expected = float(read_ohlcv(path)["close"].sum())
+
+    context = multiprocessing.get_context("spawn")
+    with share_ohlcv([path]) as handles:
+        assert len(handles) == 1
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            total, attached = executor.submit(_worker_load, str(path)).result()
+
+    assert attached
+    assert total == pytest.approx(expected, rel=0, abs=0)
+    assert "CRYPTO_BACKTEST_SHARED_OHLCV" not in os.environ
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.data.fetcher import DataFetcher, FetchRequest
+from crypto_backtest.data.storage import CacheKey, ColumnarStore, ParquetStore
+
+HOUR_MS = 3_600_000
+START_MS = int(pd.Timestamp("2024-01-30", tz="UTC").value // 1_000_000)
+
+
+def _rows(first: int, count: int) -> list[list[float]]:
+    rows = []
+    for bar in range(first, first + count):
+        price = 100.0 + 10.0 * np.sin(bar / 7.0)
+        rows.append([START_MS + bar * HOUR_MS, price, price + 1.0, price - 1.0, price, 1.0])
+    return rows
+
+
+def _frame(first: int, count: int) -> pd.DataFrame:
+    frame = pd.DataFrame(_rows(first, count), columns=["timestamp", "open", "high", "low", "close", "volume"])
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="ms", utc=True)
+    return frame
+
+
+class _FakeExchange:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.requested_since: list[int | None] = []
+
+    def load_markets(self):
+        return {}
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        return 3600
+
+    def milliseconds(self) -> int:
+        return START_MS + (self.total + 1) * HOUR_MS
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.requested_since.append(since)
+        first = 0 if since is None else (since - START_MS) // HOUR_MS
+        count = min(limit or 1000, self.total - first)
+        return _rows(first, max(count, 0))
+
+
+def test_partitioned_append_rewrites_only_touched_months(tmp_path):
+    store = ParquetStore(str(tmp_path))
+    key = CacheKey("binance", "BTC/USDT", "1h")
+    store.save(key, _frame(0, 60))
+    directory = tmp_path / "binance" / "BTC_USDT-1h"
+    assert sorted(path.name for path in directory.glob("*.parquet")) == ["2024-01.parquet", "2024-02.parquet"]
+    january_mtime = (directory / "2024-01.parquet").stat().st_mtime_ns
+
+    assert store.append(key, _frame(50, 40)) == 30
+    assert store.append(key, _frame(80, 5)) == 0
+
+    assert (directory / "2024-01.parquet").stat().st_mtime_ns == january_mtime
+    assert store.last_timestamp(key) == _frame(89, 1)["timestamp"].iloc[0]
+    pd.testing.assert_frame_equal(store.load(key), _frame(0, 90))
+
+
+def test_append_rerun_after_crash_before_meta_is_idempotent(tmp_path, monkeypatch):
+    store = ParquetStore(str(tmp_path))
+    key = CacheKey("binance", "BTC/USDT", "1h")
+    store.save(key, _frame(0, 10))
+    write_meta = store._write_meta
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(store, "_write_meta", crash)
+    try:
+        store.append(key, _frame(5, 10))
+    except KeyboardInterrupt:
+        pass
+    monkeypatch.setattr(store, "_write_meta", write_meta)
+
+    assert store.append(key, _frame(5, 8)) == 0
+    pd.testing.assert_frame_equal(store.load(key), _frame(0, 15))
+    assert store._read_meta(key)["rows"] == 15
+    assert store.last_timestamp(key) == _frame(14, 1)["timestamp"].iloc[0]
+    assert store.append(key, _frame(10, 10)) == 5
+    assert store._read_meta(key)["rows"] == 20
+
+
+def test_legacy_single_file_migrates_on_append(tmp_path):
+    store = ParquetStore(str(tmp_path))
+    key = CacheKey("binance", "ETH/USDT", "1h")
+    legacy = tmp_path / "binance" / "ETH_USDT-1h.parquet"
+    legacy.parent.mkdir(parents=True)
+    _frame(0, 10).to_parquet(legacy, index=False)
+
+    assert store.last_timestamp(key) == _frame(9, 1)["timestamp"].iloc[0]
+    assert store.append(key, _frame(5, 10)) == 5
+    assert not legacy.exists()
+    pd.testing.assert_frame_equal(store.load(key), _frame(0, 15))
+
+
+def test_fetcher_update_fetches_only_new_bars(tmp_path):
+    for store in (ParquetStore(str(tmp_path / "parquet")), ColumnarStore(str(tmp_path / "native"))):
+        fetcher = DataFetcher("binance", store=store)
+        fetcher._exchange = _FakeExchange(total=50)
+        request = FetchRequest("BTC/USDT", "1h", since=START_MS, limit=20)
+
+        assert fetcher.update(request) == 50
+        fetcher._exchange = _FakeExchange(total=75)
+        assert fetcher.update(request) == 25
+        assert fetcher._exchange.requested_since[0] == START_MS + 50 * HOUR_MS
+
+        key = CacheKey("binance", "BTC/USDT", "1h")
+        pd.testing.assert_frame_equal(store.load(key), _frame(0, 75), check_names=False)
+
+
+def test_fetch_range_keeps_requests_of_one_key_on_one_client(tmp_path, monkeypatch):
+    clients = []
+
+    def own_client(fetcher):
+        if fetcher._exchange is None:
+            fetcher._exchange = _FakeExchange(total=50)
+            clients.append(fetcher._exchange)
+        return fetcher._exchange
+
+    monkeypatch.setattr(DataFetcher, "_get_exchange", own_client)
+    store = ParquetStore(str(tmp_path))
+    requests = [
+        FetchRequest("BTC/USDT", "1h", since=START_MS, limit=20),
+        FetchRequest("ETH/USDT", "1h", since=START_MS, limit=20),
+        FetchRequest("BTC/USDT", "1h", since=START_MS + 10 * HOUR_MS, limit=20),
+    ]
+
+    DataFetcher("binance", store=store).fetch_ohlcv_range(requests, max_workers=4)
+
+    assert len(clients) == 2
+    for symbol in ("BTC/USDT", "ETH/USDT"):
+        pd.testing.assert_frame_equal(
+            store.load(CacheKey("binance", symbol, "1h")), _frame(0, 50), check_names=False
+        )
@@ -0,0 +1,92 @@
+"""Parity between the array simulation kernel and the pandas reference loop."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.engine.position_manager import MultiTPPositionManager, PositionLeg
+
+
+def _random_market(rows: int = 3000, seed: int = 7) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2021-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0.0, 0.008, rows)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    data = pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": 1.0},
+        index=index,
+    )
+
+    signal = rng.choice([-1, 0, 0, 0, 1], size=rows)
+    atr = pd.Series(high - low, index=index).rolling(14, min_periods=1).mean().to_numpy()
+    direction = signal.astype(float)
+    entry = np.where(signal != 0, close, np.nan)
+    signals = pd.DataFrame(
+        {
+            "signal": signal,
+            "entry_price": entry,
+            "sl_price": entry - direction * 1.5 * atr,
+            "tp1_price": entry + direction * 1.0 * atr,
+            "tp2_price": entry + direction * 2.5 * atr,
+            "tp3_price": entry + direction * 4.0 * atr,
+        },
+        index=index,
+    )
+    return data, signals
+
+
+@pytest.mark.parametrize("intrabar_order", ["stop_first", "tp_first"])
+@pytest.mark.parametrize("sizing_mode", ["fixed", "equity"])
+def test_simulate_matches_reference(intrabar_order, sizing_mode):
+    data, signals = _random_market()
+    manager = MultiTPPositionManager(
+        [
+            PositionLeg(size=0.5, tp_multiple=2.0),
+            PositionLeg(size=0.3, tp_multiple=6.0),
+            PositionLeg(size=0.2, tp_multiple=10.0),
+        ]
+    )
+    kwargs = dict(
+        initial_capital=10_000.0,
+        sizing_mode=sizing_mode,
+        intrabar_order=intrabar_order,
+        fees_bps=5.0,
+        slippage_bps=2.0,
+    )
+
+    fast = manager.simulate(signals, data, **kwargs)
+    reference = manager.simulate_reference(signals, data, **kwargs)
+
+    assert len(reference) > 100
+    pd.testing.assert_frame_equal(fast, reference, check_exact=True)
+
+
+@pytest.mark.parametrize("enable_long,enable_short", [(True, False), (False, True)])
+def test_simulate_matches_reference_with_direction_toggles(enable_long, enable_short):
+    data, signals = _random_market(rows=1500, seed=11)
+    manager = MultiTPPositionManager([PositionLeg(size=1, tp_multiple=2)])
+    kwargs = dict(
+        initial_capital=10_000.0,
+        intrabar_order="tp_first",
+        enable_long=enable_long,
+        enable_short=enable_short,
+    )
+
+    fast = manager.simulate(signals, data, **kwargs)
+    reference = manager.simulate_reference(signals, data, **kwargs)
+
+    pd.testing.assert_frame_equal(fast, reference, check_exact=True)
+
+
+def test_simulate_no_trades_returns_empty_frame():
+    data, signals = _random_market(rows=50)
+    signals["signal"] = 0
+    manager = MultiTPPositionManager([PositionLeg(size=1.0, tp_multiple=2.0)])
+
+    trades = manager.simulate(signals, data, initial_capital=10_000.0)
+
+    assert trades.empty
+    assert trades.columns.empty
@@ -0,0 +1,207 @@
+"""Compiled recursive-filter kernels must match their pure-Python loops and the
+per-element loops they replaced."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.indicators import mama_fama_kama as mfk
+from crypto_backtest.indicators.five_in_one import FiveInOneConfig, FiveInOneFilter, _kama_distance_kernel
+
+# Compiled code uses libm atan, which can differ from NumPy's by one ulp.
+RTOL = 1e-12
+
+
+def _python(kernel):
+    return getattr(kernel, "py_func", kernel)
+
+
+@pytest.fixture(scope="module")
+def price() -> np.ndarray:
+    rng = np.random.default_rng(21)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 5000)))
+
+
+def test_mesa_period_kernel_matches_python(price):
+    np.testing.assert_allclose(
+        mfk._mesa_period_kernel(price), _python(mfk._mesa_period_kernel)(price), rtol=RTOL
+    )
+
+
+@pytest.mark.parametrize("er_length", [None, 10])
+def test_alpha_and_mama_fama_kernels_match_python(price, er_length):
+    n = len(price)
+    if er_length is None:
+        fast, slow = np.full(n, 0.5), np.full(n, 0.05)
+    else:
+        er = mfk._efficiency_ratio(pd.Series(price), er_length)
+        fast, slow = er, er * 0.1
+
+    alpha = mfk._alpha_kernel(price, fast, slow)
+    np.testing.assert_allclose(alpha, _python(mfk._alpha_kernel)(price, fast, slow), rtol=RTOL)
+
+    mama, fama = mfk._mama_fama_kernel(price, alpha, alpha / 2.0)
+    ref_mama, ref_fama = _python(mfk._mama_fama_kernel)(price, alpha, alpha / 2.0)
+    np.testing.assert_array_equal(mama, ref_mama)
+    np.testing.assert_array_equal(fama, ref_fama)
+
+
+def test_kama_kernels_match_python(price):
+    smooth = np.random.default_rng(3).uniform(0.0, 0.5, len(price))
+
+    np.testing.assert_array_equal(
+        mfk._kama_kernel(price, smooth), _python(mfk._kama_kernel)(price, smooth)
+    )
+    np.testing.assert_array_equal(
+        _kama_distance_kernel(price, smooth), _python(_kama_distance_kernel)(price, smooth)
+    )
+
+
+def test_public_wrappers_keep_index_and_names(price):
+    src = pd.Series(price, index=pd.date_range("2023-01-01", periods=len(price), freq="h"))
+
+    period = mfk.compute_mesa_period(src)
+    mama_fama = mfk.compute_mama_fama(src, 0.5, 0.05)
+    kama = mfk.compute_kama(src, 20)
+    distance = FiveInOneFilter(FiveInOneConfig())._kama_distance(src, 10)
+
+    assert period.name == "mesa_period" and period.index.equals(src.index)
+    assert list(mama_fama.columns) == ["mama", "fama"]
+    assert kama.name == "kama" and kama.iloc[0] == src.iloc[0]
+    assert distance.index.equals(src.index) and distance.iloc[0] == src.iloc[0]
+    assert np.isfinite(mama_fama.to_numpy()).all()
+
+
+# Reference loops: the per-element implementations the kernels replaced.
+
+
+def _reference_mesa(price, fast, slow):
+    """(period, alpha) of the former compute_alpha loop.
+
+    The former compute_mesa_period ran the same cycle measurement and gave the
+    same period.
+    """
+    n = len(price)
+    smooth, detrender, i1, q1, j_i, j_q, i2, q2, re, im, period, phase, alpha = (
+        np.zeros(n) for _ in range(13)
+    )
+    alpha[0] = slow[0]
+
+    def ht(x, i, adj):
+        return (0.0962 * x[i] + 0.5769 * x[i - 2] - 0.5769 * x[i - 4] - 0.0962 * x[i - 6]) * adj
+
+    for i in range(1, n):
+        if i >= 3:
+            smooth[i] = (4 * price[i] + 3 * price[i - 1] + 2 * price[i - 2] + price[i - 3]) / 10.0
+        if i < 6:
+            alpha[i] = slow[i]
+            continue
+        adj = 0.075 * period[i - 1] + 0.54 if period[i - 1] else 0.54
+        detrender[i] = ht(smooth, i, adj)
+        q1[i] = ht(detrender, i, adj)
+        i1[i] = detrender[i - 3]
+        j_i[i] = ht(i1, i, adj)
+        j_q[i] = ht(q1, i, adj)
+        i2[i] = i1[i] - j_q[i]
+        q2[i] = q1[i] + j_i[i]
+        i2[i] = 0.2 * i2[i] + 0.8 * i2[i - 1]
+        q2[i] = 0.2 * q2[i] + 0.8 * q2[i - 1]
+        re[i] = 0.2 * (i2[i] * i2[i - 1] + q2[i] * q2[i - 1]) + 0.8 * re[i - 1]
+        im[i] = 0.2 * (i2[i] * q2[i - 1] - q2[i] * i2[i - 1]) + 0.8 * im[i - 1]
+
+        if im[i] != 0 and re[i] != 0:
+            period_raw = 2 * np.pi / np.arctan(im[i] / re[i])
+        else:
+            period_raw = period[i - 1]
+        if period[i - 1] > 0:
+            period_raw = min(period_raw, 1.5 * period[i - 1])
+            period_raw = max(period_raw, 0.67 * period[i - 1])
+        period_raw = min(max(period_raw, 6.0), 50.0)
+        period[i] = 0.2 * period_raw + 0.8 * period[i - 1]
+
+        phase[i] = np.degrees(np.arctan(q1[i] / i1[i])) if i1[i] != 0 else phase[i - 1]
+        delta_phase = phase[i - 1] - phase[i]
+        if delta_phase < 1:
+            delta_phase = 1
+        alpha_val = fast[i] / delta_phase
+        alpha[i] = slow[i] if alpha_val < slow[i] else alpha_val
+    return period, alpha
+
+
+def _reference_ema(price, alpha):
+    out = np.zeros(len(price))
+    out[0] = price[0]
+    for i in range(1, len(price)):
+        out[i] = alpha[i] * price[i] + (1 - alpha[i]) * out[i - 1]
+    return out
+
+
+def _reference_mama_fama(price, alpha):
+    beta = alpha / 2.0
+    mama = _reference_ema(price, alpha)
+    fama = np.zeros(len(price))
+    fama[0] = price[0]
+    for i in range(1, len(price)):
+        fama[i] = beta[i] * mama[i] + (1 - beta[i]) * fama[i - 1]
+    return mama, fama
+
+
+def _reference_kama(src, length):
+    price = src.to_numpy(dtype=float)
+    er = mfk._efficiency_ratio(src, length)
+    _, alpha = _reference_mesa(price, er, er * 0.1)
+    return _reference_ema(price, (er * (alpha / 2.0 - alpha) + alpha) ** 2)
+
+
+def _reference_kama_distance(src, length):
+    price = src.to_numpy(dtype=float)
+    smooth = (mfk._efficiency_ratio(src, length) * (0.666 - 0.0645) + 0.0645) ** 2
+    kama = np.zeros(len(price))
+    kama[0] = price[0]
+    for i in range(1, len(price)):
+        kama[i] = kama[i - 1] + smooth[i] * (price[i] - kama[i - 1])
+    return kama
+
+
+def _inputs():
+    rng = np.random.default_rng(8)
+    long = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 3000)))
+    nan_led = long[:400].copy()
+    nan_led[:12] = np.nan
+    return {
+        "long": long,
+        "one_bar": long[:1],
+        "short": long[:5],
+        "warmup": long[:7],
+        "nan_led": nan_led,
+    }
+
+
+@pytest.mark.parametrize("name", list(_inputs()))
+def test_public_wrappers_match_former_loops(name):
+    price = _inputs()[name]
+    src = pd.Series(price, index=pd.date_range("2023-01-01", periods=len(price), freq="h"))
+    n = len(price)
+    fast, slow = np.full(n, 0.5), np.full(n, 0.05)
+    ref_period, ref_alpha = _reference_mesa(price, fast, slow)
+
+    np.testing.assert_allclose(mfk.compute_mesa_period(src).to_numpy(), ref_period, rtol=RTOL)
+    alpha, beta = mfk.compute_alpha(src, 0.5, 0.05)
+    np.testing.assert_allclose(alpha.to_numpy(), ref_alpha, rtol=RTOL)
+    np.testing.assert_allclose(beta.to_numpy(), ref_alpha / 2.0, rtol=RTOL)
+
+    mama_fama = mfk.compute_mama_fama(src, 0.5, 0.05)
+    ref_mama, ref_fama = _reference_mama_fama(price, ref_alpha)
+    np.testing.assert_allclose(mama_fama["mama"].to_numpy(), ref_mama, rtol=RTOL)
+    np.testing.assert_allclose(mama_fama["fama"].to_numpy(), ref_fama, rtol=RTOL)
+
+    er = mfk._efficiency_ratio(src, 10)
+    _, er_alpha = _reference_mesa(price, er, er * 0.1)
+    er_mama, er_fama = _reference_mama_fama(price, er_alpha)
+    adaptive = mfk.compute_mama_fama(src, 0.5, 0.05, er_length=10)
+    np.testing.assert_allclose(adaptive["mama"].to_numpy(), er_mama, rtol=RTOL)
+    np.testing.assert_allclose(adaptive["fama"].to_numpy(), er_fama, rtol=RTOL)
+
+    np.testing.assert_allclose(mfk.compute_kama(src, 20).to_numpy(), _reference_kama(src, 20), rtol=RTOL)
+    distance = FiveInOneFilter(FiveInOneConfig())._kama_distance(src, 10)
+    np.testing.assert_allclose(distance.to_numpy(), _reference_kama_distance(src, 10), rtol=RTOL)
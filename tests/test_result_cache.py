@@ -0,0 +1,116 @@
+import os
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from crypto_backtest.engine import result_cache
+from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.engine.result_cache import (
+    RESULT_CACHE_ENV,
+    BacktestResultCache,
+    result_cache_key,
+)
+from crypto_backtest.strategies.base import BaseStrategy
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(rows: int = 800, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.004,
+            "low": np.minimum(open_, close) * 0.996,
+            "close": close,
+            "volume": rng.uniform(100.0, 200.0, rows),
+        },
+        index=index,
+    )
+
+
+def _assert_same(left, right):
+    pdt.assert_series_equal(left.equity_curve, right.equity_curve)
+    pdt.assert_frame_equal(left.trades, right.trades)
+
+
+def test_second_run_is_a_hit_with_identical_result(tmp_path):
+    data = _sample_ohlcv()
+    cache = BacktestResultCache(tmp_path)
+    backtester = VectorizedBacktester(BacktestConfig(), result_cache=cache)
+
+    first = backtester.run(data, FinalTriggerStrategy(FinalTriggerParams()))
+    second = backtester.run(data, FinalTriggerStrategy(FinalTriggerParams()))
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    _assert_same(first, second)
+    uncached = VectorizedBacktester(BacktestConfig()).run(
+        data, FinalTriggerStrategy(FinalTriggerParams())
+    )
+    _assert_same(first, uncached)
+
+
+def test_key_covers_data_params_config_and_engine(monkeypatch):
+    data = _sample_ohlcv()
+    strategy = FinalTriggerStrategy(FinalTriggerParams())
+    config = BacktestConfig()
+    key = result_cache_key(data, strategy, config)
+
+    assert key == result_cache_key(data.copy(), FinalTriggerStrategy(FinalTriggerParams()), config)
+    assert key != result_cache_key(data.iloc[1:], strategy, config)
+    assert key != result_cache_key(
+        data, FinalTriggerStrategy(replace(FinalTriggerParams(), sl_mult=9.0)), config
+    )
+    assert key != result_cache_key(data, strategy, replace(config, fees_bps=9.0))
+    monkeypatch.setattr(result_cache, "ENGINE_VERSION", "next")
+    assert key != result_cache_key(data, strategy, config)
+
+
+def test_strategies_without_params_are_not_cached(tmp_path):
+    class _Flat(BaseStrategy):
+        def generate_signals(self, data):
+            raise AssertionError("not reached")
+
+    assert result_cache_key(_sample_ohlcv(), _Flat(), BacktestConfig()) is None
+    cache = BacktestResultCache(tmp_path)
+    assert cache.get_or_run(_sample_ohlcv(), _Flat(), BacktestConfig(), lambda: "ran") == "ran"
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    data = _sample_ohlcv()
+    result = VectorizedBacktester(BacktestConfig()).run(
+        data, FinalTriggerStrategy(FinalTriggerParams())
+    )
+    cache = BacktestResultCache(tmp_path)
+    cache.put("aa1", result)
+    entry_size = cache.size_bytes
+    cache.max_bytes = 2 * entry_size
+    cache.put("bb2", result)
+    os.utime(cache._path("aa1"), ns=(1, 1))
+    os.utime(cache._path("bb2"), ns=(2, 2))
+    assert cache.get("aa1") is not None  # Now the most recently used.
+
+    cache.put("cc3", result)
+
+    assert cache.get("bb2") is None
+    assert cache.get("aa1") is not None and cache.get("cc3") is not None
+    assert cache.evictions == 1
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_environment_enables_default_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESULT_CACHE_ENV, str(tmp_path))
+    data = _sample_ohlcv()
+
+    VectorizedBacktester(BacktestConfig()).run(data, FinalTriggerStrategy(FinalTriggerParams()))
+    VectorizedBacktester(BacktestConfig()).run(data, FinalTriggerStrategy(FinalTriggerParams()))
+
+    cache = result_cache.default_result_cache()
+    assert cache.root_dir == tmp_path
+    assert cache.hits == 1 and len(cache) == 1
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.data.returns_store import ReturnsMatrixStore
+
+
+def test_append_rows_and_memmap_load(tmp_path):
+    store = ReturnsMatrixStore(tmp_path, "BTC", "run1")
+    index = pd.date_range("2024-01-01", periods=6, freq="h", tz="UTC")
+    rows = np.random.default_rng(0).normal(0.0, 0.01, (4, 6))
+
+    for i, row in enumerate(rows):
+        assert store.append(row, params={"tenkan": 9 + i, "kijun": 26}, index=index) == i
+
+    matrix = store.load()
+    assert isinstance(matrix, np.memmap)
+    assert not matrix.flags.writeable
+    np.testing.assert_array_equal(matrix, rows.astype(np.float32))
+    np.testing.assert_array_equal(np.load(store.data_path), rows.astype(np.float32))
+
+    meta = store.metadata()
+    assert meta["asset"] == "BTC" and meta["run_id"] == "run1"
+    assert meta["n_bars"] == 6
+    assert meta["bar_start"] == str(index[0]) and meta["bar_end"] == str(index[-1])
+    assert store.find_rows(tenkan=11) == [2]
+    assert len(store.find_rows(kijun=26)) == 4
+    np.testing.assert_array_equal(store.load(rows=[1, 3]), rows[[1, 3]].astype(np.float32))
+
+
+def test_append_rejects_length_mismatch(tmp_path):
+    store = ReturnsMatrixStore(tmp_path, "ETH", "run1")
+    store.append(np.zeros(5))
+
+    with pytest.raises(ValueError, match="n_bars"):
+        store.append(np.zeros(4))
+    assert store.shape == (1, 5)
+
+
+def test_latest_and_legacy_npy(tmp_path):
+    legacy = np.ones((2, 3), dtype=np.float32)
+    np.save(tmp_path / "returns_matrix_SOL_20260101_000000.npy", legacy)
+    ReturnsMatrixStore(tmp_path, "SOL", "20260102_000000").append(np.zeros(3))
+
+    store = ReturnsMatrixStore.latest(tmp_path, "SOL")
+    assert store.run_id == "20260102_000000"
+
+    old = ReturnsMatrixStore(tmp_path, "SOL", "20260101_000000")
+    np.testing.assert_array_equal(old.load(), legacy)
+    assert [t["row"] for t in old.metadata()["trials"]] == [0, 1]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from crypto_backtest.analysis.regime_v3 import compute_regime_features
+from crypto_backtest.indicators.rolling import rolling_percentile_rank
+
+
+def _reference_rank(series: pd.Series, length: int) -> pd.Series:
+    return series.rolling(length).apply(
+        lambda x: stats.percentileofscore(x.dropna(), x.iloc[-1]) / 100, raw=False
+    )
+
+
+def _sample_ohlcv(rows: int = 1200, seed: int = 8) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.003,
+            "low": np.minimum(open_, close) * 0.997,
+            "close": close,
+            "volume": rng.uniform(100.0, 200.0, rows),
+        },
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("length", [1, 3, 20, 200])
+def test_rolling_percentile_rank_matches_percentileofscore(length):
+    rng = np.random.default_rng(1)
+    # Rounded values give plenty of ties.
+    series = pd.Series(np.round(rng.normal(size=1500), 1))
+    series.iloc[[4, 600, 601, 1400]] = np.nan
+
+    result = rolling_percentile_rank(series, length)
+
+    np.testing.assert_array_equal(result.to_numpy(), _reference_rank(series, length).to_numpy())
+
+
+def test_regime_feature_percentiles_match_rolling_apply():
+    lookback = 50
+    features = compute_regime_features(_sample_ohlcv(), lookback=lookback)
+
+    for source, column in (("atr_14", "vol_percentile"), ("range_20", "range_percentile")):
+        expected = _reference_rank(features[source], lookback).shift(1)
+        pd.testing.assert_series_equal(features[column], expected, check_names=False)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.indicators.rolling import rolling_slope
+
+
+def _reference_slope(series: pd.Series, length: int) -> pd.Series:
+    x = np.arange(1, length + 1, dtype=float)
+    denom = length * (x**2).sum() - x.sum() ** 2
+
+    def slope(values: np.ndarray) -> float:
+        return (length * (values * x).sum() - x.sum() * values.sum()) / denom
+
+    return series.rolling(length).apply(slope, raw=True)
+
+
+def _price_series(rows: int = 5000, seed: int = 5) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2021-01-01", periods=rows, freq="h", tz="UTC")
+    close = 30_000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    return pd.Series(close, index=index, name="close")
+
+
+@pytest.mark.parametrize("length", [2, 3, 10, 50, 200, 500])
+def test_rolling_slope_matches_rolling_apply(length):
+    series = _price_series()
+    series.iloc[[3, 900, 901, 4000]] = np.nan
+
+    result = rolling_slope(series, length)
+    expected = _reference_slope(series, length)
+
+    pd.testing.assert_index_equal(result.index, series.index)
+    np.testing.assert_array_equal(result.isna(), expected.isna())
+    np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("rows", [0, 1, 9, 10, 11, 41])
+def test_rolling_slope_short_series(rows):
+    series = pd.Series(np.arange(rows, dtype=float) ** 1.5)
+
+    result = rolling_slope(series, 10)
+
+    np.testing.assert_allclose(result, _reference_slope(series, 10), rtol=1e-12)
+
+
+def test_rolling_slope_degenerate_length_is_zero():
+    series = _price_series(rows=20)
+
+    assert (rolling_slope(series, 1) == 0.0).all()
@@ -0,0 +1,77 @@
+"""Batch backtests must match one ``run`` call per strategy."""
+
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.indicators.five_in_one import FiveInOneConfig
+from crypto_backtest.indicators.ichimoku import IchimokuConfig
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(rows: int = 1200, seed: int = 9) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.004,
+            "low": np.minimum(open_, close) * 0.996,
+            "close": close,
+            "volume": rng.uniform(100.0, 200.0, rows),
+        },
+        index=index,
+    )
+
+
+def _grid() -> list[FinalTriggerStrategy]:
+    base = FinalTriggerParams(
+        ichimoku=IchimokuConfig(tenkan=9, kijun=26),
+        five_in_one=FiveInOneConfig(tenkan_5=9, kijun_5=26),
+    )
+    return [
+        FinalTriggerStrategy(
+            replace(
+                base,
+                ichimoku=replace(base.ichimoku, tenkan=t),
+                five_in_one=replace(base.five_in_one, kijun_5=k5),
+            )
+        )
+        for t in (8, 9)
+        for k5 in (25, 26, 27)
+    ]
+
+
+def _final_equity(result) -> float:
+    return float(result.equity_curve.iloc[-1])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_many_matches_individual_runs(n_jobs):
+    data = _sample_ohlcv()
+    backtester = VectorizedBacktester(BacktestConfig())
+    strategies = _grid()
+
+    expected = [backtester.run(data, strategy) for strategy in _grid()]
+    results = backtester.run_many(data, strategies, n_jobs=n_jobs)
+
+    assert len(results) == len(expected)
+    for result, reference in zip(results, expected):
+        pd.testing.assert_series_equal(result.equity_curve, reference.equity_curve, check_exact=True)
+        pd.testing.assert_frame_equal(result.trades, reference.trades, check_exact=True)
+    assert all(strategy.cache is None for strategy in strategies)
+
+
+def test_run_many_applies_evaluate_in_order():
+    data = _sample_ohlcv()
+    backtester = VectorizedBacktester(BacktestConfig())
+
+    expected = [_final_equity(backtester.run(data, strategy)) for strategy in _grid()]
+
+    assert backtester.run_many(data, _grid(), n_jobs=2, evaluate=_final_equity) == expected
+    assert backtester.run_many(data, [], n_jobs=2) == []
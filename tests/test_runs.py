@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.analysis.metrics import _max_drawdown
+from crypto_backtest.analysis.regime_v3 import CryptoRegimeAnalyzer
+from crypto_backtest.utils.runs import longest_true_run, run_ids, run_positions, run_starts
+
+
+def _reference_positions(series: pd.Series) -> np.ndarray:
+    groups = (series != series.shift(1)).cumsum()
+    return (series.groupby(groups).cumcount() + 1).to_numpy()
+
+
+def test_run_positions_match_group_cumcount():
+    series = pd.Series(["a", "a", "b", None, None, "b", "b", "b", np.nan, "a"])
+
+    np.testing.assert_array_equal(run_positions(series), _reference_positions(series))
+    np.testing.assert_array_equal(run_ids(series), [1, 1, 2, 3, 4, 5, 5, 5, 6, 7])
+    assert run_starts([]).size == 0
+    assert run_positions([]).size == 0
+
+
+@pytest.mark.parametrize(
+    "mask, expected",
+    [([], 0), ([False, False], 0), ([True], 1), ([True, True, False, True, True, True, False], 3)],
+)
+def test_longest_true_run(mask, expected):
+    assert longest_true_run(mask) == expected
+
+
+def test_compute_stability_counts_bars_in_regime():
+    rng = np.random.default_rng(3)
+    regimes = pd.Series(rng.choice(["BULL", "BEAR", "RANGE"], 500, p=[0.8, 0.1, 0.1]))
+
+    stability = CryptoRegimeAnalyzer()._compute_stability(regimes)
+
+    assert stability.dtype == float
+    np.testing.assert_array_equal(stability.to_numpy(), _reference_positions(regimes))
+
+
+def test_max_drawdown_duration_is_longest_underwater_spell():
+    equity = pd.Series([100.0, 110.0, 105.0, 104.0, 111.0, 108.0, 107.0, 106.0, 112.0])
+
+    _, max_dd, duration = _max_drawdown(equity)
+
+    assert duration == 3
+    assert max_dd == pytest.approx(104.0 / 110.0 - 1.0)
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from crypto_backtest.v4 import screening
+from crypto_backtest.v4.screening import ScreeningSettings, screening_settings
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+FAMILY = {"filters": {"preset": "baseline"}}
+
+
+def test_settings_come_from_policy():
+    settings = screening_settings({"screening": {"trials": 1000, "workers": 4, "chunk_size": None}})
+
+    assert settings == ScreeningSettings(trials=1000, top_k=screening.TOP_K, workers=4)
+    chunks = settings.chunks()
+    assert len(chunks) == 16
+    assert [i for chunk in chunks for i in chunk] == list(range(1000))
+    assert screening_settings({}) == ScreeningSettings()
+    with pytest.raises(ValueError):
+        ScreeningSettings(workers=0)
+
+
+def test_ranking_keeps_trial_order_on_ties_and_puts_nan_last():
+    candidates = [{"score": 1.0}, {"score": float("nan")}, {"score": 2.0}, {"score": 1.0}]
+
+    assert screening._ranked(candidates) == [2, 0, 3, 1]
+
+
+@pytest.mark.skipif(not (DATA_DIR / "Binance_BTCUSDT_1h.csv").exists(), reason="needs BTC data")
+def test_parallel_chunks_select_the_serial_top_k(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").symlink_to(DATA_DIR)
+    end_ts = "2024-06-01T00:00:00"
+
+    serial = screening._run_screening(
+        "BTC", "serial", FAMILY, "long_only", end_ts,
+        settings=ScreeningSettings(trials=8, top_k=3),
+    )
+    parallel = screening._run_screening(
+        "BTC", "parallel", FAMILY, "long_only", end_ts,
+        settings=ScreeningSettings(trials=8, top_k=3, workers=2, chunk_size=3),
+    )
+
+    assert parallel == serial
+    assert len(serial["top_candidates"]) == 3
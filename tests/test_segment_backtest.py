@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from crypto_backtest.engine.backtest import BacktestConfig, VectorizedBacktester
+from crypto_backtest.optimization.parallel_optimizer import (
+    run_backtest,
+    run_segment_backtests,
+    split_bounds,
+)
+from crypto_backtest.strategies.final_trigger import FinalTriggerParams, FinalTriggerStrategy
+
+
+def _sample_ohlcv(rows: int = 1500, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2022-01-01", periods=rows, freq="h", tz="UTC")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) * 1.004
+    low = np.minimum(open_, close) * 0.996
+    volume = rng.uniform(100.0, 200.0, rows)
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
+
+
+PARAMS = {"sl_mult": 2.0, "tp1_mult": 1.5, "tp2_mult": 3.0, "tp3_mult": 5.0}
+
+
+def test_strict_isolation_matches_separate_runs():
+    data = _sample_ohlcv()
+    bounds = split_bounds(len(data))
+
+    segments = run_segment_backtests(data, PARAMS, bounds, strict_isolation=True)
+
+    expected = [run_backtest(data.iloc[start:stop], PARAMS) for start, stop in bounds]
+    assert segments == expected
+
+
+def test_segments_simulate_full_history_signals_per_range():
+    data = _sample_ohlcv()
+    bounds = split_bounds(len(data))
+    backtester = VectorizedBacktester(BacktestConfig())
+    strategy = FinalTriggerStrategy(FinalTriggerParams())
+    signals = strategy.generate_signals(data)
+
+    results = backtester.run_segments(data, strategy, bounds)
+
+    class _Precomputed(FinalTriggerStrategy):
+        def generate_signals(self, frame):
+            return signals.loc[frame.index]
+
+    for (start, stop), result in zip(bounds, results):
+        expected = backtester.run(data.iloc[start:stop], _Precomputed(FinalTriggerParams()))
+        pd.testing.assert_series_equal(result.equity_curve, expected.equity_curve)
+        pd.testing.assert_frame_equal(result.trades, expected.trades)
+
+
+def test_carry_state_partitions_full_run_trades():
+    data = _sample_ohlcv()
+    bounds = split_bounds(len(data))
+    backtester = VectorizedBacktester(BacktestConfig())
+    strategy = FinalTriggerStrategy(FinalTriggerParams())
+
+    full = backtester.run(data, strategy)
+    results = backtester.run_segments(data, strategy, bounds, carry_state=True)
+
+    assert not full.trades.empty
+    combined = pd.concat([result.trades for result in results], ignore_index=True)
+    pd.testing.assert_frame_equal(combined, full.trades)
+    for (start, stop), result in zip(bounds, results):
+        assert result.equity_curve.index.equals(data.index[start:stop])
+
+
+@pytest.mark.parametrize("carry_state", [False, True])
+def test_segment_metrics_share_periods_per_year(carry_state):
+    data = _sample_ohlcv()
+    rows = run_segment_backtests(data, PARAMS, split_bounds(len(data)), carry_state=carry_state)
+
+    assert len(rows) == 3
+    assert all(np.isfinite(row["sharpe"]) for row in rows)
@@ -1,7 +1,14 @@
+from itertools import combinations
+
 import numpy as np
 import pandas as pd
+import pytest
 
-from crypto_backtest.validation.cpcv import CombinatorialPurgedKFold, validate_with_cpcv
+from crypto_backtest.validation.cpcv import (
+    CombinatorialPurgedKFold,
+    _split_blocks,
+    validate_with_cpcv,
+)
 
 
 def _dummy_data(n_rows: int = 120) -> pd.DataFrame:
@@ -50,6 +57,73 @@ def test_cpcv_embargo_enforced():
         assert test_end - test_start == split_size
 
 
+def _reference_splits(n_samples, n_splits, n_test_splits, purge_gap, embargo_pct):
+    """Brute-force per-index purge/embargo checks (original implementation)."""
+    split_size = n_samples // n_splits
+    embargo_size = int(n_samples * embargo_pct)
+    bounds = [
+        (i * split_size, (i + 1) * split_size if i < n_splits - 1 else n_samples)
+        for i in range(n_splits)
+    ]
+    for test_splits in combinations(range(n_splits), n_test_splits):
+        test_idx = [i for s in test_splits for i in range(*bounds[s])]
+        train_idx = []
+        for s in range(n_splits):
+            if s in test_splits:
+                continue
+            for idx in range(*bounds[s]):
+                if purge_gap and any(abs(idx - t) <= purge_gap for t in test_idx):
+                    continue
+                if embargo_size and any(
+                    bounds[t][1] <= idx < bounds[t][1] + embargo_size for t in test_splits
+                ):
+                    continue
+                train_idx.append(idx)
+        yield np.array(train_idx), np.array(test_idx)
+
+
+@pytest.mark.parametrize(
+    "n_samples,n_splits,n_test_splits,purge_gap,embargo_pct",
+    [
+        (120, 6, 2, 3, 0.01),
+        (257, 5, 2, 7, 0.05),
+        (100, 4, 3, 0, 0.0),
+        (61, 6, 1, 2, 0.2),
+        (5, 6, 2, 1, 0.5),
+    ],
+)
+def test_cpcv_split_matches_reference(n_samples, n_splits, n_test_splits, purge_gap, embargo_pct):
+    cpcv = CombinatorialPurgedKFold(
+        n_splits=n_splits,
+        n_test_splits=n_test_splits,
+        purge_gap=purge_gap,
+        embargo_pct=embargo_pct,
+    )
+    expected = list(
+        _reference_splits(n_samples, n_splits, n_test_splits, purge_gap, embargo_pct)
+    )
+    result = list(cpcv.split(np.zeros(n_samples)))
+
+    assert len(result) == len(expected) == cpcv.get_n_splits()
+    for (train_idx, test_idx), (ref_train, ref_test) in zip(result, expected):
+        np.testing.assert_array_equal(train_idx, ref_train)
+        np.testing.assert_array_equal(test_idx, ref_test)
+        assert train_idx.dtype == ref_train.dtype
+        assert test_idx.dtype == ref_test.dtype
+
+
+def test_cpcv_split_is_lazy_and_caches_only_boundaries():
+    cpcv = CombinatorialPurgedKFold(n_splits=16, n_test_splits=8)
+    splits = cpcv.split(np.zeros(30_000))
+
+    train_idx, test_idx = next(splits)
+    assert len(test_idx) == 8 * (30_000 // 16)
+    assert not (set(train_idx) & set(test_idx))
+    blocks = _split_blocks(30_000, 16, 8, cpcv.purge_gap, cpcv.embargo_pct)
+    assert len(blocks) == cpcv.get_n_splits() == 12870
+    assert all(len(test_blocks) == 8 for test_blocks, _ in blocks)
+
+
 def test_validate_with_cpcv_returns_keys():
     data = _dummy_data(120)
 
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from crypto_backtest.analysis.metrics import compute_core_metrics, compute_core_metrics_matrix
+from crypto_backtest.validation.monte_carlo import (
+    bootstrap_return_metrics,
+    iteration_chunks,
+    trade_permutation_metrics,
+)
+
+KEYS = ("total_return", "sharpe_ratio", "max_drawdown")
+
+
+def _market(n_bars: int = 900, n_trades: int = 40, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    prices = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n_bars)))
+    durations = rng.integers(1, 30, n_trades)
+    signs = np.where(rng.random(n_trades) < 0.5, -1.0, 1.0)
+    quantities = rng.uniform(1.0, 5.0, n_trades)
+    return prices, durations, signs, quantities
+
+
+def _reference_trade_permutation(prices, durations, signs, quantities, iterations, seed, ppy):
+    """One curve and one ``compute_core_metrics`` call per iteration."""
+    rng = np.random.default_rng(seed)
+    n_bars = len(prices)
+    rows = []
+    for _ in range(iterations):
+        entry_idx = (rng.random(len(durations)) * (n_bars - durations)).astype(int)
+        exit_idx = entry_idx + durations
+        pnl = signs * (prices[exit_idx] - prices[entry_idx]) * quantities
+        costs = 7e-4 * (np.abs(prices[entry_idx]) + np.abs(prices[exit_idx])) * quantities
+        pnl_by_exit = np.zeros(n_bars)
+        np.add.at(pnl_by_exit, exit_idx, pnl - costs)
+        rows.append(compute_core_metrics(1_000.0 + np.cumsum(pnl_by_exit), periods_per_year=ppy))
+    return {key: np.array([row[key] for row in rows]) for key in KEYS}
+
+
+def test_iteration_chunks_cover_all_iterations():
+    chunks = list(iteration_chunks(10, n_bars=100, max_bytes=3 * 100 * 8))
+
+    assert chunks == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    assert list(iteration_chunks(2, n_bars=10**9, max_bytes=1)) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("max_bytes", [1, 900 * 8 * 7, 2**26])
+def test_trade_permutation_matches_sequential_loop(max_bytes):
+    prices, durations, signs, quantities = _market()
+
+    result = trade_permutation_metrics(
+        prices, durations, signs, quantities, 7e-4, 1_000.0,
+        iterations=60, rng=np.random.default_rng(11), periods_per_year=8766.0,
+        max_bytes=max_bytes,
+    )
+    expected = _reference_trade_permutation(prices, durations, signs, quantities, 60, 11, 8766.0)
+
+    for key in KEYS:
+        np.testing.assert_array_equal(result[key], expected[key], err_msg=key)
+
+
+def test_bootstrap_matches_sequential_loop():
+    prices, *_ = _market()
+    bar_returns = prices[1:] / prices[:-1] - 1
+
+    result = bootstrap_return_metrics(
+        bar_returns, 0.01, 10_000.0, iterations=50,
+        rng=np.random.default_rng(5), periods_per_year=252.0, max_bytes=len(bar_returns) * 8 * 9,
+    )
+
+    rng = np.random.default_rng(5)
+    for i in range(50):
+        equity = 10_000.0 * np.cumprod(1 + rng.choice(bar_returns, size=len(bar_returns)) * 0.01)
+        expected = compute_core_metrics(equity, periods_per_year=252.0)
+        for key in KEYS:
+            assert result[key][i] == expected[key], key
+
+
+def test_matrix_metrics_fall_back_for_degenerate_rows():
+    rng = np.random.default_rng(0)
+    equity = 100.0 + np.cumsum(rng.normal(0.0, 1.0, (6, 50)), axis=1)
+    equity[1, 10] = np.nan
+    equity[2, 20] = 0.0
+    equity[3] = -equity[3]
+    equity[4] = 100.0
+
+    result = compute_core_metrics_matrix(equity, periods_per_year=365.0)
+
+    for row in range(len(equity)):
+        expected = compute_core_metrics(equity[row], periods_per_year=365.0)
+        for key in KEYS:
+            assert result[key][row] == expected[key], (row, key)
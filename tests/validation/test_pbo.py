@@ -52,3 +52,48 @@ def test_cscv_pbo_insufficient_bars():
     config = CSCVConfig(n_folds=4, min_bars_per_fold=50, purge_gap=0)
     with pytest.raises(ValueError, match="Insufficient data"):
         cscv_pbo(returns, config=config)
+
+
+def _reference_cscv(returns: np.ndarray, config: CSCVConfig) -> tuple[list, list]:
+    """Per-trial loop over purged bar indices (original implementation)."""
+    from itertools import combinations
+
+    from crypto_backtest.validation.pbo_cscv import (
+        _compute_sharpe,
+        _create_fold_indices,
+        _get_purged_indices,
+    )
+
+    n_trials, n_bars = returns.shape
+    fold_indices = _create_fold_indices(n_bars, config.n_folds)
+    omegas, degradation = [], []
+    for is_ids in combinations(range(config.n_folds), config.n_folds // 2):
+        oos_ids = tuple(i for i in range(config.n_folds) if i not in is_ids)
+        is_bars, oos_bars = _get_purged_indices(fold_indices, is_ids, oos_ids, config.purge_gap)
+        if len(is_bars) < config.min_bars_per_fold or len(oos_bars) < config.min_bars_per_fold:
+            continue
+        is_sr = np.array([_compute_sharpe(returns[t, is_bars], config.annualization_factor) for t in range(n_trials)])
+        oos_sr = np.array([_compute_sharpe(returns[t, oos_bars], config.annualization_factor) for t in range(n_trials)])
+        best = np.argmax(is_sr)
+        omegas.append(np.sum(oos_sr <= oos_sr[best]) / (n_trials + 1))
+        if is_sr[best] > 0:
+            degradation.append(oos_sr[best] / is_sr[best])
+    return omegas, degradation
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize(
+    "purge_gap,min_bars,n_periods",
+    [(0, 50, 960), (12, 50, 960), (200, 400, 3200)],  # last case skips some paths
+)
+def test_cscv_pbo_matches_per_trial_reference(purge_gap, min_bars, n_periods, n_jobs):
+    returns = _random_returns(n_trials=25, n_periods=n_periods, seed=5)
+    returns[:5] += 0.001
+    config = CSCVConfig(n_folds=8, purge_gap=purge_gap, min_bars_per_fold=min_bars, n_jobs=n_jobs)
+
+    result = cscv_pbo(returns, config=config)
+    omegas, degradation = _reference_cscv(returns, config)
+
+    assert 0 < result["n_paths"] == len(omegas)
+    np.testing.assert_allclose(result["omega_distribution"], omegas, rtol=0, atol=0)
+    assert result["degradation"] == pytest.approx(np.mean(degradation), rel=1e-9)